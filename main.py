@@ -1,3 +1,4 @@
+import argparse
 import sys
 import os
 import tkinter as tk
@@ -8,11 +9,71 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.ui.main_window import MainWindow
 
 
+def parse_args():
+    """
+    명령행 인자 (인자 없이 실행하면 GUI)
+
+    여러 PC에서 나눠 처리:
+        python main.py --queue //공유폴더/2025-06 --input 대상자.xlsx --output 결과.xlsx
+    """
+    parser = argparse.ArgumentParser(description="행복e음 자동화 프로그램")
+    parser.add_argument('--queue', help="공유 작업 큐 디렉토리 (지정하면 GUI 없이 작업자로 실행)")
+    parser.add_argument('--input', help="입력 파일 (큐가 아직 없을 때 청크로 나눠서 생성)")
+    parser.add_argument('--output', help="모든 청크가 끝나면 합친 결과를 저장할 파일")
+    parser.add_argument('--chunk-size', type=int, default=50, help="청크당 레코드 수")
+    parser.add_argument('--lease', type=int, default=600, help="청크 임대 시간 (초)")
+    parser.add_argument('--worker-id', help="작업자 ID (기본: 호스트명-PID)")
+    parser.add_argument('--merge-only', action='store_true', help="처리 없이 완료된 청크만 합쳐서 저장")
+    parser.add_argument(
+        '--checkbox-engine', choices=('template', 'components'), default='template',
+        help="체크박스 세는 방식 (template: 템플릿 매칭, components: 연결 요소)"
+    )
+    parser.add_argument('--compare-engines', action='store_true', help="두 방식으로 모두 세서 일치율 기록")
+    return parser.parse_args()
+
+
+def run_queue(args):
+    """공유 작업 큐 작업자 실행"""
+    from src.services.excel_service import ExcelService
+    from src.services.work_queue import LeaseQueue, run_queue_worker
+
+    queue_options = {'worker_id': args.worker_id, 'lease_seconds': args.lease}
+    if os.path.exists(os.path.join(args.queue, 'manifest.json')) or not args.input:
+        queue = LeaseQueue(args.queue, **queue_options)
+    else:
+        records = ExcelService.read_residents(args.input)
+        queue = LeaseQueue.create(
+            args.queue, records, chunk_size=args.chunk_size, source=args.input, **queue_options
+        )
+
+    if not args.merge_only:
+        from src.services.search_service import SearchAutomationService
+        service = SearchAutomationService(
+            checkbox_engine=args.checkbox_engine,
+            compare_checkbox_engines=args.compare_engines
+        )
+
+        print("- 주의: 이제부터 마우스/키보드를 사용하지 마세요!")
+        run_queue_worker(queue, service)
+
+    if args.output:
+        if not queue.is_complete():
+            status = queue.status()
+            print(f"[QUEUE] 아직 끝나지 않은 청크가 있어 합치지 않습니다: 완료 {status['done']}/{status['total']}")
+            return
+        ExcelService.write_results(args.output, queue.merge())
+
+
 def main():
     """메인 함수"""
     print("행복e음 자동화 프로그램")
     print("개발: 2025 by ys-ongyeol")
-    
+
+    args = parse_args()
+    if args.queue:
+        run_queue(args)
+        return
+
     # GUI 실행
     root = tk.Tk()
     app = MainWindow(root)
@@ -21,4 +82,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
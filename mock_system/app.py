@@ -3,6 +3,7 @@
 실제 행정망 시스템을 모방한 테스트 환경
 """
 
+import argparse
 import tkinter as tk
 from tkinter import ttk, messagebox
 import pandas as pd
@@ -12,10 +13,10 @@ import os
 class HaengbokEumMockSystem:
     """행복e음 주민조회 시스템 Mock"""
     
-    def __init__(self, root):
+    def __init__(self, root, title="행복e음 - 주민조회", geometry="800x600"):
         self.root = root
-        self.root.title("행복e음 - 주민조회")
-        self.root.geometry("800x600")
+        self.root.title(title)
+        self.root.geometry(geometry)
         self.root.configure(bg="#f0f0f0")
         
         # 데이터베이스 로드
@@ -297,8 +298,14 @@ class HaengbokEumMockSystem:
 
 def main():
     """메인 함수"""
+    # 여러 창을 띄워 병렬 실행을 시험할 때 창 제목/위치를 지정 (tools/run_shards.py)
+    parser = argparse.ArgumentParser(description="행복e음 주민조회 Mock 시스템")
+    parser.add_argument('--title', default="행복e음 - 주민조회", help="창 제목")
+    parser.add_argument('--geometry', default="800x600", help="창 크기/위치 (예: 800x600+0+0)")
+    args = parser.parse_args()
+
     root = tk.Tk()
-    app = HaengbokEumMockSystem(root)
+    app = HaengbokEumMockSystem(root, title=args.title, geometry=args.geometry)
     root.mainloop()
 
 
@@ -0,0 +1,219 @@
+"""
+MARK: 동작 계획(Action Plan) 모듈
+클릭/키/텍스트/대기 단계를 선언해 두고, 워크플로당 한 번 좌표를 해석(compile)한 뒤
+레코드마다 최소 오버헤드로 실행
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+
+@dataclass
+class ActionStep:
+    """동작 계획의 한 단계"""
+
+    kind: str  # click, hotkey, key, text, sleep, wait, release
+    target: Optional[str] = None  # click 대상 UI 요소 이름
+    keys: Tuple[str, ...] = ()
+    text: Optional[str] = None  # '{resident_number}' 같은 치환 템플릿 허용
+    clicks: int = 1
+    interval: float = 0.0
+    seconds: float = 0.0
+    pace: Optional[str] = None  # pacer 동작 유형 (sleep 단계)
+    condition: Optional[str] = None  # wait 조건 이름
+    timeout: float = 2.0
+    label: str = ''
+    options: dict = field(default_factory=dict)
+
+    def describe(self):
+        if self.kind == 'click':
+            return f"click {self.target} x{self.clicks}"
+        if self.kind in ('hotkey', 'key'):
+            return f"{self.kind} {'+'.join(self.keys)}"
+        if self.kind == 'text':
+            return f"text {self.text}"
+        if self.kind == 'sleep':
+            return f"sleep {self.seconds:.2f}s" + (f" (pace={self.pace})" if self.pace else "")
+        if self.kind == 'wait':
+            return f"wait {self.condition} (timeout={self.timeout:.1f}s)"
+        return self.kind
+
+
+class ActionPlan:
+    """선언형 동작 계획 (빌더)"""
+
+    def __init__(self, name):
+        """
+        Args:
+            name: 계획 이름 (로그/타이밍 표시용)
+        """
+        self.name = name
+        self.steps = []
+
+    def _add(self, step):
+        if not step.label:
+            step.label = f"{len(self.steps) + 1:02d} {step.describe()}"
+        self.steps.append(step)
+        return self
+
+    def click(self, target, clicks=1, label=''):
+        """UI 요소 클릭 (좌표는 compile 시 한 번 해석)"""
+        return self._add(ActionStep('click', target=target, clicks=clicks, label=label))
+
+    def hotkey(self, *keys, label=''):
+        """단축키 입력"""
+        return self._add(ActionStep('hotkey', keys=tuple(keys), label=label))
+
+    def key(self, key, label=''):
+        """단일 키 입력"""
+        return self._add(ActionStep('key', keys=(key,), label=label))
+
+    def text(self, template, interval=0.01, label=''):
+        """텍스트 입력 (실행 시 params로 치환)"""
+        return self._add(ActionStep('text', text=template, interval=interval, label=label))
+
+    def sleep(self, seconds, pace=None, label=''):
+        """대기 (pace를 지정하면 pacer 학습값 사용)"""
+        return self._add(ActionStep('sleep', seconds=seconds, pace=pace, label=label))
+
+    def wait_for(self, condition, timeout=2.0, label=''):
+        """조건이 참이 될 때까지 대기 (조건 함수는 compile 시 연결)"""
+        return self._add(ActionStep('wait', condition=condition, timeout=timeout, label=label))
+
+    def release_modifiers(self, check_os=False, label=''):
+        """이 계획이 누른 modifier 해제 (check_os=True면 OS 눌림 상태까지 확인)"""
+        return self._add(ActionStep('release', options={'check_os': check_os}, label=label))
+
+    def estimate_wait(self, delay_for=None):
+        """
+        계획에 포함된 대기 시간 합계 (조작 방식 비교용)
+
+        Args:
+            delay_for: delay_for(pace, default) -> 초 (None이면 선언한 기본값)
+
+        Returns:
+            float: 대기 시간 합계 (초)
+        """
+        total = 0.0
+        for step in self.steps:
+            if step.kind != 'sleep':
+                continue
+            if step.pace and delay_for is not None:
+                total += delay_for(step.pace, step.seconds)
+            else:
+                total += step.seconds
+        return total
+
+    def targets(self):
+        """계획이 참조하는 UI 요소 이름 목록"""
+        return [step.target for step in self.steps if step.kind == 'click']
+
+    def compile(self, resolver, conditions=None, text_entry=None):
+        """
+        계획 컴파일 (UI 요소 좌표/조건 함수 바인딩)
+
+        Args:
+            resolver: resolver(element_name) -> {'center_x', 'center_y', ...}
+            conditions: {조건 이름: callable(params) -> bool}
+            text_entry: TextEntryEngine (지정하면 text 단계를 엔진으로 입력)
+
+        Returns:
+            CompiledPlan: 실행 가능한 계획
+        """
+        conditions = conditions or {}
+        resolved = {}
+        for target in self.targets():
+            if target not in resolved:
+                resolved[target] = resolver(target)
+
+        for step in self.steps:
+            if step.kind == 'wait' and step.condition not in conditions:
+                raise ValueError(f"조건 '{step.condition}'이(가) 연결되지 않았습니다.")
+
+        return CompiledPlan(self.name, list(self.steps), resolved, conditions, text_entry)
+
+
+class CompiledPlan:
+    """좌표가 해석된 동작 계획 (레코드마다 반복 실행)"""
+
+    def __init__(self, name, steps, coordinates, conditions, text_entry=None):
+        self.name = name
+        self.steps = steps
+        self.coordinates = coordinates
+        self.conditions = conditions
+        self.text_entry = text_entry
+        self.run_count = 0
+
+    def run(self, automation, params=None, timing=False):
+        """
+        계획 실행
+
+        Args:
+            automation: GUIAutomation 호환 객체
+            params: 텍스트 템플릿 치환값 (예: {'resident_number': '...'})
+            timing: 단계별 소요 시간 측정 여부
+
+        Returns:
+            dict: {'total': 전체 소요 시간, 'steps': [(label, 초), ...]}
+        """
+        params = params or {}
+        step_times = []
+        start = time.perf_counter()
+
+        # 단계 사이에 pyautogui 전역 PAUSE가 끼지 않도록 계획 단위로 해제
+        with automation.no_global_pause():
+            for step in self.steps:
+                step_start = time.perf_counter() if timing else 0.0
+                self._execute(automation, step, params)
+                if timing:
+                    step_times.append((step.label, time.perf_counter() - step_start))
+
+        self.run_count += 1
+        return {'total': time.perf_counter() - start, 'steps': step_times}
+
+    def _execute(self, automation, step, params):
+        kind = step.kind
+        if kind == 'click':
+            coords = self.coordinates[step.target]
+            automation.click(coords['center_x'], coords['center_y'], clicks=step.clicks, delay=0)
+        elif kind == 'hotkey':
+            automation.hotkey(*step.keys, delay=0)
+        elif kind == 'key':
+            automation.press_key(step.keys[0], delay=0)
+        elif kind == 'text':
+            text = step.text.format(**params)
+            if self.text_entry is not None:
+                self.text_entry.enter(text, interval=step.interval)
+            else:
+                automation.type_text(text, interval=step.interval, delay=0)
+        elif kind == 'sleep':
+            if step.pace:
+                automation.pause(step.pace, step.seconds)
+            elif step.seconds > 0:
+                time.sleep(step.seconds)
+        elif kind == 'wait':
+            condition = self.conditions[step.condition]
+            deadline = time.perf_counter() + step.timeout
+            while not condition(params):
+                if time.perf_counter() >= deadline:
+                    raise TimeoutError(f"조건 '{step.condition}' 대기 시간 초과 ({step.timeout:.1f}s)")
+                time.sleep(0.01)
+        elif kind == 'release':
+            if step.options.get('check_os'):
+                automation.ensure_modifiers_released()
+            else:
+                automation.release_modifiers()
+        else:
+            raise ValueError(f"알 수 없는 단계입니다: {kind}")
+
+    def describe(self):
+        """실행 순서 요약 문자열"""
+        lines = [f"[PLAN] {self.name}"]
+        for step in self.steps:
+            line = f"  - {step.label}"
+            if step.kind == 'click':
+                coords = self.coordinates[step.target]
+                line += f" @ ({coords['center_x']}, {coords['center_y']})"
+            lines.append(line)
+        return "\n".join(lines)
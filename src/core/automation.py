@@ -1,9 +1,15 @@
 # MARK: gui 제어  모듈
 
-import pyautogui
 import time
 import pyperclip
 import platform
+from contextlib import contextmanager
+
+try:
+    import pyautogui
+except Exception:
+    # 디스플레이가 없는 환경(세션 재생/벤치마크)에서는 pyautogui를 불러올 수 없음
+    pyautogui = None
 
 # Windows DPI 스케일링 문제 해결
 if platform.system() == "Windows":
@@ -19,20 +25,142 @@ if platform.system() == "Windows":
             pass  # DPI 설정 실패해도 계속 진행
 
 
+# 눌린 채 남을 수 있는 modifier 키 이름 (pyautogui 키 이름 기준)
+MODIFIER_KEYS = (
+    'command', 'commandleft', 'commandright',
+    'ctrl', 'ctrlleft', 'ctrlright',
+    'alt', 'option', 'altleft', 'altright',
+    'shift', 'shiftleft', 'shiftright'
+)
+
+
+def query_pressed_modifiers():
+    """
+    OS에 물리적으로 눌린 상태로 보고되는 modifier 조회 (watchdog용)
+
+    Returns:
+        list or None: 눌린 modifier 이름 목록, 조회할 수 없는 OS면 None
+    """
+    system = platform.system()
+    if system == "Windows":
+        try:
+            import ctypes
+            user32 = ctypes.windll.user32
+            virtual_keys = {'shift': 0x10, 'ctrl': 0x11, 'alt': 0x12, 'winleft': 0x5B, 'winright': 0x5C}
+            return [name for name, vk in virtual_keys.items() if user32.GetAsyncKeyState(vk) & 0x8000]
+        except Exception:
+            return None
+    if system == "Darwin":
+        try:
+            import Quartz
+            flags = Quartz.CGEventSourceFlagsState(Quartz.kCGEventSourceStateCombinedSessionState)
+            masks = {
+                'command': Quartz.kCGEventFlagMaskCommand,
+                'ctrl': Quartz.kCGEventFlagMaskControl,
+                'option': Quartz.kCGEventFlagMaskAlternate,
+                'shift': Quartz.kCGEventFlagMaskShift,
+            }
+            return [name for name, mask in masks.items() if flags & mask]
+        except Exception:
+            return None
+    return None
+
+
 class GUIAutomation:
     """GUI 자동화 유틸리티"""
     
-    def __init__(self, delay=0.5):
+    def __init__(self, delay=0.5, pacer=None):
         """
         초기화
         
         Args:
             delay: 동작 간 기본 지연 시간 (초)
+            pacer: PacingController (지정하면 동작 유형별 학습된 지연 사용)
         """
         self.delay = delay
+        self.pacer = pacer
+        self._action_listeners = []
+
+        # 이 객체가 누른 modifier만 추적해서 해제
+        self._held_modifiers = set()
+        self.modifier_stats = {
+            'release_events': 0,
+            'release_seconds': 0.0,
+            'full_resets': 0,
+            'stuck_detected': 0,
+        }
+
+        if pyautogui is None:
+            raise RuntimeError("pyautogui를 사용할 수 없습니다. 디스플레이 환경을 확인하세요.")
         
         pyautogui.PAUSE = 0.1  # 각 동작 후 0.1초 대기
         pyautogui.FAILSAFE = True  # 마우스를 화면 모서리로 이동 시 중단
+        self.sync_input_pause()
+
+    def pause(self, action, default):
+        """
+        동작 유형별 대기 (pacer가 있으면 학습값, 없으면 기본값)
+
+        Args:
+            action: 동작 유형 ('settle', 'result', 'between_records' 등)
+            default: pacer가 없거나 처음 보는 동작일 때의 대기 시간 (초)
+        """
+        if self.pacer is not None:
+            self.pacer.wait(action, default)
+        elif default > 0:
+            time.sleep(default)
+
+    def report_pacing(self, actions, success):
+        """
+        pacer에 성공/실패 신호 전달 후 pyautogui 전역 PAUSE 갱신
+
+        Args:
+            actions: 동작 유형 또는 목록
+            success: True/False/None(판단 불가)
+        """
+        if self.pacer is None:
+            return
+        self.pacer.report(actions, success)
+        self.sync_input_pause()
+
+    def sync_input_pause(self):
+        """pacer가 학습한 입력 간 간격을 pyautogui.PAUSE에 반영"""
+        if self.pacer is not None:
+            pyautogui.PAUSE = self.pacer.delay_for('input_pause', 0.1)
+
+    @contextmanager
+    def no_global_pause(self):
+        """블록 안에서는 pyautogui 호출마다 붙는 전역 PAUSE 제거 (동작 계획 실행용)"""
+        previous = pyautogui.PAUSE
+        pyautogui.PAUSE = 0
+        try:
+            yield
+        finally:
+            pyautogui.PAUSE = previous
+
+    def _pause(self, action, delay):
+        """명시적 delay가 있으면 그대로, 없으면 동작 유형별 대기"""
+        if delay is not None:
+            if delay > 0:
+                time.sleep(delay)
+        else:
+            self.pause(action, self.delay)
+
+    def add_action_listener(self, callback):
+        """
+        동작 리스너 등록 (세션 녹화 등)
+
+        Args:
+            callback: callback(action, params) 형태의 함수
+        """
+        self._action_listeners.append(callback)
+
+    def _notify(self, action, **params):
+        for callback in self._action_listeners:
+            try:
+                callback(action, params)
+            except Exception as e:
+                print(f"[AUTO] 동작 리스너 오류: {e}")
     
     def click(self, x, y, clicks=1, button='left', delay=None):
         """
@@ -44,8 +172,9 @@ class GUIAutomation:
             button: 'left', 'right', 'middle'
             delay: 클릭 후 대기 시간
         """
+        self._notify('click', x=x, y=y, clicks=clicks, button=button)
         pyautogui.click(x, y, clicks=clicks, button=button)
-        time.sleep(delay if delay is not None else self.delay)
+        self._pause('click', delay)
     
     def double_click(self, x, y, delay=None):
         self.click(x, y, clicks=2, delay=delay)
@@ -61,6 +190,7 @@ class GUIAutomation:
             x, y: 목표 좌표
             duration: 이동 시간 (초)
         """
+        self._notify('move_to', x=x, y=y, duration=duration)
         pyautogui.moveTo(x, y, duration=duration)
     
     def type_text(self, text, interval=0.05, delay=None):
@@ -72,8 +202,9 @@ class GUIAutomation:
             interval: 글자 간 간격
             delay: 입력 후 대기 시간
         """
+        self._notify('type_text', text=text, interval=interval)
         pyautogui.write(text, interval=interval)
-        time.sleep(delay if delay is not None else self.delay)
+        self._pause('type', delay)
     
     def paste_text(self, text, delay=None):
         """
@@ -83,18 +214,56 @@ class GUIAutomation:
             text: 붙여넣을 텍스트
             delay: 붙여넣기 후 대기 시간
         """
+        self._notify('paste_text', text=text)
         # 클립보드에 복사
         pyperclip.copy(text)
         
         # Cmd+V (macOS) 또는 Ctrl+V (Windows)
-        import platform
-        if platform.system() == 'Darwin':  # macOS
-            pyautogui.hotkey('command', 'v')
-        else:  # Windows/Linux
-            pyautogui.hotkey('ctrl', 'v')
+        modifier = 'command' if platform.system() == 'Darwin' else 'ctrl'
+        self._held_modifiers.add(modifier)
+        pyautogui.hotkey(modifier, 'v')
+        self.release_modifiers()
         
-        time.sleep(delay if delay is not None else self.delay)
+        self._pause('paste', delay)
     
+    def copy_selection(self, timeout=0.3):
+        """
+        포커스된 입력 필드 내용을 전체 선택 후 복사해서 반환 (입력값 확인용)
+
+        Args:
+            timeout: 클립보드 갱신 대기 최대 시간 (초)
+
+        Returns:
+            str or None: 필드 내용 (시간 안에 클립보드가 갱신되지 않으면 빈 필드로 보고 ''),
+                클립보드를 사용할 수 없으면 None
+        """
+        self._notify('copy_selection')
+        # 붙여넣기로 이미 같은 값이 클립보드에 있을 수 있으므로 비워 두고 갱신 여부 확인
+        try:
+            pyperclip.copy('')
+        except pyperclip.PyperclipException as e:
+            # 클립보드 백엔드가 없는 환경 (xclip/xsel 미설치 등): 확인 불가로 처리
+            print(f"[ENTRY] 클립보드를 사용할 수 없어 입력값을 확인하지 않습니다: {e}")
+            return None
+        modifier = 'command' if platform.system() == 'Darwin' else 'ctrl'
+        self._held_modifiers.add(modifier)
+        pyautogui.hotkey(modifier, 'a')
+        pyautogui.hotkey(modifier, 'c')
+        self.release_modifiers()
+
+        deadline = time.perf_counter() + timeout
+        while True:
+            try:
+                text = pyperclip.paste()
+            except pyperclip.PyperclipException:
+                return None
+            if text:
+                return text
+            if time.perf_counter() >= deadline:
+                # 빈 필드는 복사해도 클립보드가 비어 있음 (입력이 통째로 사라진 경우)
+                return ''
+            time.sleep(0.01)
+
     def press_key(self, key, delay=None):
         """
         키 입력
@@ -103,9 +272,20 @@ class GUIAutomation:
             key: 키 이름 ('enter', 'tab', 'esc', etc.)
             delay: 입력 후 대기 시간
         """
+        self._notify('press_key', key=key)
         pyautogui.press(key)
-        time.sleep(delay if delay is not None else self.delay)
+        self._pause('key', delay)
     
+    def key_up(self, key):
+        """
+        키 해제 (눌린 채 남은 키 정리용)
+
+        Args:
+            key: 키 이름
+        """
+        self._notify('key_up', key=key)
+        pyautogui.keyUp(key)
+
     def hotkey(self, *keys, delay=None):
         """
         단축키 입력
@@ -114,8 +294,65 @@ class GUIAutomation:
             *keys: 키 조합 (예: 'ctrl', 'c')
             delay: 입력 후 대기 시간
         """
+        self._notify('hotkey', keys=list(keys))
+        self._held_modifiers.update(key for key in keys if key in MODIFIER_KEYS)
         pyautogui.hotkey(*keys)
-        time.sleep(delay if delay is not None else self.delay)
+        self._pause('hotkey', delay)
+
+    def release_modifiers(self):
+        """
+        이 객체가 hotkey/paste_text로 누른 modifier만 해제
+
+        Returns:
+            int: 보낸 keyUp 이벤트 수
+        """
+        if not self._held_modifiers:
+            return 0
+        keys = sorted(self._held_modifiers)
+        self._held_modifiers.clear()
+        return self._send_key_ups(keys)
+
+    def reset_modifiers(self):
+        """
+        모든 modifier 강제 해제 (watchdog이 눌림 상태를 감지했거나 오류 복구 시)
+
+        Returns:
+            int: 보낸 keyUp 이벤트 수
+        """
+        self._held_modifiers.clear()
+        self.modifier_stats['full_resets'] += 1
+        return self._send_key_ups(MODIFIER_KEYS)
+
+    def ensure_modifiers_released(self):
+        """
+        추적 중인 modifier를 해제한 뒤, OS가 여전히 눌림으로 보고하면 전체 해제
+
+        Returns:
+            int: 보낸 keyUp 이벤트 수
+        """
+        sent = self.release_modifiers()
+        pressed = query_pressed_modifiers()
+        if pressed:
+            print(f"[AUTO] 눌린 상태로 남은 modifier 감지: {pressed}, 전체 해제")
+            self.modifier_stats['stuck_detected'] += 1
+            sent += self.reset_modifiers()
+        return sent
+
+    def _send_key_ups(self, keys):
+        start = time.perf_counter()
+        sent = 0
+        for key in keys:
+            try:
+                self._notify('key_up', key=key)
+                # 해제 이벤트마다 pyautogui.PAUSE가 붙지 않도록 _pause=False
+                pyautogui.keyUp(key, _pause=False)
+                sent += 1
+            except Exception:
+                # 일부 키는 현재 OS에서 지원되지 않을 수 있으므로 무시
+                continue
+        self.modifier_stats['release_events'] += sent
+        self.modifier_stats['release_seconds'] += time.perf_counter() - start
+        return sent
     
     def scroll(self, clicks, x=None, y=None):
         """
@@ -125,6 +362,7 @@ class GUIAutomation:
             clicks: 스크롤 양 (양수: 위, 음수: 아래)
             x, y: 스크롤 위치 (None이면 현재 위치)
         """
+        self._notify('scroll', clicks=clicks, x=x, y=y)
         if x is not None and y is not None:
             pyautogui.scroll(clicks, x=x, y=y)
         else:
@@ -160,13 +398,14 @@ class GUIAutomation:
 class SafeAutomation(GUIAutomation):
     """안전 모드 자동화 (확인 메시지 포함)"""
     
-    def __init__(self, delay=0.5, confirm=True):
+    def __init__(self, delay=0.5, confirm=True, pacer=None):
         """
         Args:
             delay: 동작 간 기본 지연 시간
             confirm: 중요 동작 전 확인 여부
+            pacer: PacingController
         """
-        super().__init__(delay)
+        super().__init__(delay, pacer=pacer)
         self.confirm = confirm
     
     def click(self, x, y, clicks=1, button='left', delay=None):
@@ -0,0 +1,489 @@
+"""
+MARK: 화면 캡처 백엔드 모듈
+pyautogui(기본/대체), X11 MIT-SHM(공유 메모리 재사용), 파일 재생 백엔드
+"""
+
+import ctypes
+import ctypes.util
+import glob
+import os
+import platform
+import time
+
+from PIL import Image
+
+
+class CaptureBackend:
+    """캡처 백엔드 공통 인터페이스 (캡처 지연 시간 측정 포함)"""
+
+    name = 'base'
+
+    def __init__(self):
+        self.capture_count = 0
+        self.total_latency = 0.0
+        self.last_latency = 0.0
+        self.max_latency = 0.0
+
+    def grab(self, region=None):
+        """
+        화면 캡처
+
+        Args:
+            region: (x, y, width, height) 화면 좌표 (None이면 전체 화면)
+
+        Returns:
+            PIL.Image: 캡처 이미지
+        """
+        start = time.perf_counter()
+        image = self._grab(region)
+        elapsed = time.perf_counter() - start
+
+        self.capture_count += 1
+        self.total_latency += elapsed
+        self.last_latency = elapsed
+        self.max_latency = max(self.max_latency, elapsed)
+        return image
+
+    def screen_size(self):
+        """
+        화면 크기 (화면 좌표 기준)
+
+        Returns:
+            tuple: (width, height)
+        """
+        raise NotImplementedError
+
+    def latency_stats(self):
+        """
+        캡처 지연 시간 통계
+
+        Returns:
+            dict: {'backend', 'count', 'last_ms', 'mean_ms', 'max_ms'}
+        """
+        mean = self.total_latency / self.capture_count if self.capture_count else 0.0
+        return {
+            'backend': self.name,
+            'count': self.capture_count,
+            'last_ms': self.last_latency * 1000,
+            'mean_ms': mean * 1000,
+            'max_ms': self.max_latency * 1000,
+        }
+
+    def close(self):
+        """백엔드 자원 해제"""
+
+    def _grab(self, region):
+        raise NotImplementedError
+
+
+class PyAutoGUIBackend(CaptureBackend):
+    """pyautogui.screenshot() 기반 백엔드 (모든 OS 대체 경로)"""
+
+    name = 'pyautogui'
+
+    def __init__(self):
+        super().__init__()
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def screen_size(self):
+        size = self._pyautogui.size()
+        return size[0], size[1]
+
+    def _grab(self, region):
+        if region is None:
+            return self._pyautogui.screenshot()
+        return self._pyautogui.screenshot(region=tuple(region))
+
+
+class _XImage(ctypes.Structure):
+    """Xlib XImage 구조체 (앞부분 필드만 사용)"""
+
+    _fields_ = [
+        ('width', ctypes.c_int),
+        ('height', ctypes.c_int),
+        ('xoffset', ctypes.c_int),
+        ('format', ctypes.c_int),
+        ('data', ctypes.c_void_p),
+        ('byte_order', ctypes.c_int),
+        ('bitmap_unit', ctypes.c_int),
+        ('bitmap_bit_order', ctypes.c_int),
+        ('bitmap_pad', ctypes.c_int),
+        ('depth', ctypes.c_int),
+        ('bytes_per_line', ctypes.c_int),
+        ('bits_per_pixel', ctypes.c_int),
+        ('red_mask', ctypes.c_ulong),
+        ('green_mask', ctypes.c_ulong),
+        ('blue_mask', ctypes.c_ulong),
+        ('obdata', ctypes.c_void_p),
+    ]
+
+
+class _XErrorEvent(ctypes.Structure):
+    """Xlib XErrorEvent 구조체"""
+
+    _fields_ = [
+        ('type', ctypes.c_int),
+        ('display', ctypes.c_void_p),
+        ('resourceid', ctypes.c_ulong),
+        ('serial', ctypes.c_ulong),
+        ('error_code', ctypes.c_ubyte),
+        ('request_code', ctypes.c_ubyte),
+        ('minor_code', ctypes.c_ubyte),
+    ]
+
+
+_XErrorHandler = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(_XErrorEvent))
+
+
+class _XShmSegmentInfo(ctypes.Structure):
+    _fields_ = [
+        ('shmseg', ctypes.c_ulong),
+        ('shmid', ctypes.c_int),
+        ('shmaddr', ctypes.c_void_p),
+        ('readOnly', ctypes.c_int),
+    ]
+
+
+class X11ShmBackend(CaptureBackend):
+    """
+    X11 MIT-SHM 백엔드 (ctypes + libX11/libXext)
+
+    캡처 크기별로 공유 메모리 XImage를 한 번만 만들고 이후 캡처에서 재사용한다.
+    Xvfb에서도 동작하므로 디스플레이 없는 서버에서 테스트할 수 있다.
+    """
+
+    name = 'x11shm'
+
+    _Z_PIXMAP = 2
+    _IPC_PRIVATE = 0
+    _IPC_CREAT = 0o1000
+    _IPC_RMID = 0
+    _ALL_PLANES = 0xFFFFFFFF
+
+    # Xlib 오류 처리기는 프로세스 전역이므로 한 번만 설치 (기본 처리기는 BadMatch 등에서 exit() 호출)
+    _error_handler = None
+    _x_errors = []
+
+    def __init__(self, display_name=None, max_buffers=4):
+        """
+        초기화
+
+        Args:
+            display_name: X 디스플레이 이름 (None이면 $DISPLAY)
+            max_buffers: 유지할 공유 메모리 버퍼 수 (캡처 크기별 1개)
+        """
+        super().__init__()
+        self._display = None
+        self._buffers = {}  # (w, h) -> (XImage*, XShmSegmentInfo)
+        self.max_buffers = max_buffers
+        self._fallback = None
+        if platform.system() != 'Linux':
+            raise OSError("X11 MIT-SHM 백엔드는 Linux에서만 사용할 수 있습니다.")
+
+        self._xlib = self._load_library('X11')
+        self._xext = self._load_library('Xext')
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._declare_functions()
+        self._install_error_handler()
+
+        name = display_name.encode() if display_name else None
+        self._display = self._xlib.XOpenDisplay(name)
+        if not self._display:
+            raise OSError(f"X 디스플레이를 열 수 없습니다: {display_name or os.environ.get('DISPLAY')}")
+
+        if not self._xext.XShmQueryExtension(self._display):
+            self.close()
+            raise OSError("X 서버가 MIT-SHM 확장을 지원하지 않습니다.")
+
+        screen = self._xlib.XDefaultScreen(self._display)
+        self._root = self._xlib.XDefaultRootWindow(self._display)
+        self._visual = self._xlib.XDefaultVisual(self._display, screen)
+        self._depth = self._xlib.XDefaultDepth(self._display, screen)
+        self._size = (
+            self._xlib.XDisplayWidth(self._display, screen),
+            self._xlib.XDisplayHeight(self._display, screen),
+        )
+        if self._depth not in (24, 32):
+            self.close()
+            raise OSError(f"지원하지 않는 색 깊이입니다: {self._depth}")
+
+    def _install_error_handler(self):
+        """X 오류를 기록만 하는 처리기 설치 (캡처 쪽에서 확인해 예외로 바꿈)"""
+        cls = X11ShmBackend
+        if cls._error_handler is None:
+            def record(display, event):
+                error = event.contents
+                cls._x_errors.append((error.error_code, error.request_code, error.minor_code))
+                return 0
+
+            # CFUNCTYPE 객체가 GC되면 Xlib이 해제된 함수를 부르므로 클래스에 보관
+            cls._error_handler = _XErrorHandler(record)
+            self._xlib.XSetErrorHandler(cls._error_handler)
+
+    def _raise_x_error(self, action):
+        """기록된 X 오류가 있으면 OSError로 변환"""
+        if not X11ShmBackend._x_errors:
+            return
+        errors, X11ShmBackend._x_errors[:] = list(X11ShmBackend._x_errors), []
+        codes = ', '.join(f"error={code}, request={request}.{minor}" for code, request, minor in errors)
+        raise OSError(f"{action} 중 X 오류: {codes}")
+
+    @staticmethod
+    def _load_library(name):
+        path = ctypes.util.find_library(name)
+        if not path:
+            raise OSError(f"lib{name}을(를) 찾을 수 없습니다.")
+        return ctypes.CDLL(path)
+
+    def _declare_functions(self):
+        xlib, xext, libc = self._xlib, self._xext, self._libc
+        vp = ctypes.c_void_p
+
+        xlib.XOpenDisplay.argtypes = [ctypes.c_char_p]
+        xlib.XOpenDisplay.restype = vp
+        xlib.XCloseDisplay.argtypes = [vp]
+        xlib.XDefaultScreen.argtypes = [vp]
+        xlib.XDefaultScreen.restype = ctypes.c_int
+        xlib.XDefaultRootWindow.argtypes = [vp]
+        xlib.XDefaultRootWindow.restype = ctypes.c_ulong
+        xlib.XDefaultVisual.argtypes = [vp, ctypes.c_int]
+        xlib.XDefaultVisual.restype = vp
+        xlib.XDefaultDepth.argtypes = [vp, ctypes.c_int]
+        xlib.XDefaultDepth.restype = ctypes.c_int
+        xlib.XDisplayWidth.argtypes = [vp, ctypes.c_int]
+        xlib.XDisplayWidth.restype = ctypes.c_int
+        xlib.XDisplayHeight.argtypes = [vp, ctypes.c_int]
+        xlib.XDisplayHeight.restype = ctypes.c_int
+        xlib.XSync.argtypes = [vp, ctypes.c_int]
+        xlib.XSetErrorHandler.argtypes = [_XErrorHandler]
+        xlib.XSetErrorHandler.restype = vp
+        xlib.XDestroyImage.argtypes = [ctypes.POINTER(_XImage)]
+
+        xext.XShmQueryExtension.argtypes = [vp]
+        xext.XShmQueryExtension.restype = ctypes.c_int
+        xext.XShmCreateImage.argtypes = [
+            vp, vp, ctypes.c_uint, ctypes.c_int, vp,
+            ctypes.POINTER(_XShmSegmentInfo), ctypes.c_uint, ctypes.c_uint,
+        ]
+        xext.XShmCreateImage.restype = ctypes.POINTER(_XImage)
+        xext.XShmAttach.argtypes = [vp, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmAttach.restype = ctypes.c_int
+        xext.XShmDetach.argtypes = [vp, ctypes.POINTER(_XShmSegmentInfo)]
+        xext.XShmGetImage.argtypes = [
+            vp, ctypes.c_ulong, ctypes.POINTER(_XImage), ctypes.c_int, ctypes.c_int, ctypes.c_ulong,
+        ]
+        xext.XShmGetImage.restype = ctypes.c_int
+
+        libc.shmget.argtypes = [ctypes.c_int, ctypes.c_size_t, ctypes.c_int]
+        libc.shmget.restype = ctypes.c_int
+        libc.shmat.argtypes = [ctypes.c_int, vp, ctypes.c_int]
+        libc.shmat.restype = vp
+        libc.shmdt.argtypes = [vp]
+        libc.shmctl.argtypes = [ctypes.c_int, ctypes.c_int, vp]
+
+    def screen_size(self):
+        return self._size
+
+    def _get_buffer(self, width, height):
+        """캡처 크기에 맞는 공유 메모리 XImage 반환 (없으면 생성)"""
+        key = (width, height)
+        if key in self._buffers:
+            return self._buffers[key]
+
+        if len(self._buffers) >= self.max_buffers:
+            # 가장 먼저 만든 버퍼 해제
+            oldest = next(iter(self._buffers))
+            self._release_buffer(*self._buffers.pop(oldest))
+
+        shminfo = _XShmSegmentInfo()
+        ximage = self._xext.XShmCreateImage(
+            self._display, self._visual, self._depth, self._Z_PIXMAP,
+            None, ctypes.byref(shminfo), width, height
+        )
+        if not ximage:
+            raise OSError("XShmCreateImage 실패")
+
+        size = ximage.contents.bytes_per_line * ximage.contents.height
+        shminfo.shmid = self._libc.shmget(self._IPC_PRIVATE, size, self._IPC_CREAT | 0o600)
+        if shminfo.shmid < 0:
+            self._xlib.XDestroyImage(ximage)
+            raise OSError(ctypes.get_errno(), "shmget 실패")
+
+        address = self._libc.shmat(shminfo.shmid, None, 0)
+        if address in (None, ctypes.c_void_p(-1).value):
+            self._libc.shmctl(shminfo.shmid, self._IPC_RMID, None)
+            self._xlib.XDestroyImage(ximage)
+            raise OSError(ctypes.get_errno(), "shmat 실패")
+
+        shminfo.shmaddr = address
+        shminfo.readOnly = 0
+        ximage.contents.data = address
+
+        if not self._xext.XShmAttach(self._display, ctypes.byref(shminfo)):
+            self._release_buffer(ximage, shminfo, attached=False)
+            raise OSError("XShmAttach 실패")
+        self._xlib.XSync(self._display, 0)
+        # 양쪽에서 붙은 뒤 삭제 예약 (프로세스가 죽어도 세그먼트가 남지 않음)
+        self._libc.shmctl(shminfo.shmid, self._IPC_RMID, None)
+
+        self._buffers[key] = (ximage, shminfo)
+        return self._buffers[key]
+
+    def _release_buffer(self, ximage, shminfo, attached=True):
+        if attached:
+            self._xext.XShmDetach(self._display, ctypes.byref(shminfo))
+        address = shminfo.shmaddr
+        # data/obdata는 공유 메모리와 Python 소유 구조체이므로 Xlib이 해제하지 않도록 분리
+        ximage.contents.data = None
+        ximage.contents.obdata = None
+        self._xlib.XDestroyImage(ximage)
+        if address:
+            self._libc.shmdt(address)
+
+    def _grab(self, region):
+        if region is None:
+            x, y = 0, 0
+            width, height = self._size
+        else:
+            x, y, width, height = (int(v) for v in region)
+
+        try:
+            ximage, _ = self._get_buffer(width, height)
+            X11ShmBackend._x_errors[:] = []
+            ok = self._xext.XShmGetImage(self._display, self._root, ximage, x, y, self._ALL_PLANES)
+            self._raise_x_error("XShmGetImage")
+            if not ok:
+                raise OSError(f"XShmGetImage 실패: region={region}")
+        except OSError as e:
+            # 창이 화면 밖으로 나갔거나 해상도가 바뀐 경우 (BadMatch 등) 이번 캡처는 pyautogui로
+            return self._fallback_grab(region, e)
+
+        image = ximage.contents
+        buffer = (ctypes.c_char * (image.bytes_per_line * image.height)).from_address(image.data)
+        # 공유 버퍼는 다음 캡처에서 덮어쓰므로 RGB 변환과 함께 복사
+        return Image.frombuffer(
+            'RGB', (width, height), buffer, 'raw', 'BGRX', image.bytes_per_line, 1
+        )
+
+    def _fallback_grab(self, region, error):
+        if self._fallback is None:
+            print(f"[CAPTURE] X11 SHM 캡처 실패, pyautogui로 대체합니다: {error}")
+            self._fallback = PyAutoGUIBackend()
+        return self._fallback._grab(region)
+
+    def close(self):
+        if not self._display:
+            return
+        for ximage, shminfo in self._buffers.values():
+            self._release_buffer(ximage, shminfo)
+        self._buffers.clear()
+        self._xlib.XCloseDisplay(self._display)
+        self._display = None
+
+
+class ReplayBackend(CaptureBackend):
+    """녹화된 프레임 파일을 순서대로 돌려주는 백엔드 (디스플레이 불필요)"""
+
+    name = 'replay'
+
+    def __init__(self, source, loop=False, scale=1.0):
+        """
+        초기화
+
+        Args:
+            source: 이미지 디렉토리 경로 또는 이미지 경로/PIL.Image 리스트
+            loop: 마지막 프레임 이후 처음부터 다시 재생할지 여부 (False면 마지막 프레임 유지)
+            scale: 프레임 픽셀 / 화면 좌표 배율 (Retina 녹화는 2.0)
+        """
+        super().__init__()
+        if isinstance(source, (str, os.PathLike)):
+            patterns = ('*.png', '*.webp', '*.jpg')
+            paths = []
+            for pattern in patterns:
+                paths.extend(glob.glob(os.path.join(source, pattern)))
+            source = sorted(paths)
+        self.frames = list(source)
+        if not self.frames:
+            raise ValueError("재생할 프레임이 없습니다.")
+        self.loop = loop
+        self.scale = scale
+        self.position = 0
+
+        first = self._load(self.frames[0])
+        self._size = (int(first.width / scale), int(first.height / scale))
+
+    def screen_size(self):
+        return self._size
+
+    def _load(self, item):
+        if isinstance(item, Image.Image):
+            return item
+        with Image.open(item) as img:
+            return img.convert('RGB')
+
+    def _next_image(self):
+        if self.position >= len(self.frames):
+            if self.loop:
+                self.position = 0
+            else:
+                return self._load(self.frames[-1])
+        image = self._load(self.frames[self.position])
+        self.position += 1
+        return image
+
+    def _grab(self, region):
+        image = self._next_image()
+        if region is None:
+            return image
+        x, y, width, height = region
+        s = self.scale
+        return image.crop((int(x * s), int(y * s), int((x + width) * s), int((y + height) * s)))
+
+
+BACKENDS = {
+    'pyautogui': PyAutoGUIBackend,
+    'x11shm': X11ShmBackend,
+    'replay': ReplayBackend,
+}
+
+
+def create_backend(name='auto', **options):
+    """
+    캡처 백엔드 생성
+
+    Args:
+        name: 'auto', 'pyautogui', 'x11shm', 'replay' 또는 CaptureBackend 인스턴스
+              ('auto'이면 환경변수 SCREEN_CAPTURE_BACKEND → Linux X11 SHM → pyautogui 순)
+        **options: 백엔드 생성 인자
+
+    Returns:
+        CaptureBackend: 생성된 백엔드 (실패 시 pyautogui 백엔드)
+    """
+    if isinstance(name, CaptureBackend):
+        return name
+
+    if name == 'auto':
+        name = os.environ.get('SCREEN_CAPTURE_BACKEND', '').strip().lower() or 'auto'
+
+    if name == 'auto':
+        if platform.system() == 'Linux' and os.environ.get('DISPLAY'):
+            candidates = ['x11shm', 'pyautogui']
+        else:
+            candidates = ['pyautogui']
+    elif name in BACKENDS:
+        candidates = [name] if name in ('pyautogui', 'replay') else [name, 'pyautogui']
+    else:
+        raise ValueError(f"알 수 없는 캡처 백엔드입니다: {name}")
+
+    last_error = None
+    for candidate in candidates:
+        try:
+            backend = BACKENDS[candidate](**(options if candidate == name else {}))
+            print(f"[CAPTURE] 캡처 백엔드: {backend.name}")
+            return backend
+        except Exception as e:
+            last_error = e
+            print(f"[CAPTURE] '{candidate}' 백엔드 사용 불가: {e}")
+
+    raise RuntimeError(f"사용 가능한 캡처 백엔드가 없습니다: {last_error}")
@@ -0,0 +1,165 @@
+"""
+MARK: 캡처 계획 모듈
+워크플로 단계별로 필요한 영역만 캡처 (알 수 없거나 오래된 영역은 전체 화면으로 대체)
+"""
+
+import time
+
+
+class CapturePlanner:
+    """단계별 캡처 영역 계획기"""
+
+    # 단계 이름 -> 필요한 영역 이름들
+    STEP_REGIONS = {
+        'dialog': ('dialog',),
+        'result': ('result_pane',),
+        'status': ('status_bar',),
+        'verify': ('result_pane', 'status_bar'),
+    }
+
+    def __init__(self, capture, max_age=600.0, step_regions=None):
+        """
+        초기화
+
+        Args:
+            capture: ScreenCapture 인스턴스
+            max_age: 영역 정보 유효 시간 (초, None이면 만료 없음)
+            step_regions: 단계별 영역 매핑 (None이면 STEP_REGIONS 사용)
+        """
+        self.capture = capture
+        self.max_age = max_age
+        self.step_regions = dict(self.STEP_REGIONS)
+        if step_regions:
+            self.step_regions.update(step_regions)
+
+        # 영역 이름 -> {'rect': (x, y, w, h), 'updated': timestamp}
+        self.regions = {}
+        self.stats = {
+            'region_captures': 0,
+            'full_captures': 0,
+            'captured_pixels': 0,
+            'full_screen_pixels': 0,
+        }
+
+    def set_region(self, name, x, y, width, height):
+        """
+        영역 등록 (화면 좌표 기준)
+
+        Args:
+            name: 영역 이름 ('dialog', 'result_pane', 'status_bar' 등)
+            x, y: 왼쪽 상단 좌표
+            width, height: 영역 크기
+        """
+        rect = self._clamp((int(x), int(y), int(width), int(height)))
+        if rect is None:
+            print(f"[PLAN] 영역 '{name}'이(가) 화면 밖이므로 무시합니다: ({x}, {y}, {width}x{height})")
+            return
+        self.regions[name] = {'rect': rect, 'updated': time.time()}
+        print(f"[PLAN] 영역 등록: {name} -> {rect}")
+
+    def invalidate(self, name=None):
+        """
+        영역 무효화
+
+        Args:
+            name: 무효화할 영역 이름 (None이면 전체)
+        """
+        if name is None:
+            self.regions.clear()
+        else:
+            self.regions.pop(name, None)
+
+    def get_region(self, name):
+        """
+        유효한 영역 반환
+
+        Returns:
+            tuple or None: (x, y, w, h), 알 수 없거나 만료되었으면 None
+        """
+        entry = self.regions.get(name)
+        if entry is None:
+            return None
+        if self.max_age is not None and time.time() - entry['updated'] > self.max_age:
+            print(f"[PLAN] 영역 '{name}' 정보가 만료되었습니다.")
+            self.regions.pop(name, None)
+            return None
+        return entry['rect']
+
+    def plan(self, step):
+        """
+        단계에 필요한 캡처 영역 계산
+
+        Args:
+            step: 워크플로 단계 이름
+
+        Returns:
+            tuple or None: 캡처할 (x, y, w, h), 전체 화면이 필요하면 None
+        """
+        names = self.step_regions.get(step)
+        if not names:
+            return None
+
+        rects = []
+        for name in names:
+            rect = self.get_region(name)
+            if rect is None:
+                return None
+            rects.append(rect)
+
+        return self._union(rects)
+
+    def capture_step(self, step, persist=True):
+        """
+        단계에 맞게 캡처 (영역을 모르면 전체 화면)
+
+        Args:
+            step: 워크플로 단계 이름
+            persist: 캡처 보관 여부 (ScreenCapture.grab_region 참고)
+
+        Returns:
+            CaptureFrame: 캡처 프레임
+        """
+        screen_w, screen_h = self.capture.get_screen_size()
+        rect = self.plan(step)
+
+        if rect is None:
+            frame = self.capture.grab_full_screen(persist=False)
+            self.stats['full_captures'] += 1
+            self.stats['captured_pixels'] += screen_w * screen_h
+        else:
+            frame = self.capture.grab_region(*rect, persist=False)
+            self.stats['region_captures'] += 1
+            self.stats['captured_pixels'] += rect[2] * rect[3]
+
+        self.stats['full_screen_pixels'] += screen_w * screen_h
+        # 단계 이름을 붙인 뒤 보관 (세션 녹화가 단계별로 프레임을 구분)
+        frame.step = step
+        if persist:
+            self.capture.persist_frame(frame)
+        return frame
+
+    def pixel_ratio(self):
+        """전체 화면 대비 실제 캡처한 픽셀 비율 (화면 좌표 기준)"""
+        if not self.stats['full_screen_pixels']:
+            return 1.0
+        return self.stats['captured_pixels'] / self.stats['full_screen_pixels']
+
+    @staticmethod
+    def _union(rects):
+        left = min(r[0] for r in rects)
+        top = min(r[1] for r in rects)
+        right = max(r[0] + r[2] for r in rects)
+        bottom = max(r[1] + r[3] for r in rects)
+        return left, top, right - left, bottom - top
+
+    def _clamp(self, rect):
+        """화면 범위 안으로 영역 보정"""
+        screen_w, screen_h = self.capture.get_screen_size()
+        x, y, w, h = rect
+        left = max(0, x)
+        top = max(0, y)
+        right = min(screen_w, x + w)
+        bottom = min(screen_h, y + h)
+        if right <= left or bottom <= top:
+            return None
+        return left, top, right - left, bottom - top
@@ -0,0 +1,298 @@
+"""
+MARK: 체크박스 카운터 모듈
+체크박스 템플릿을 한 번만 읽어 두고, 결과 영역에서만 매칭한 뒤
+점수 순 NMS(비최대 억제)로 중복을 벡터 연산으로 제거.
+ComponentCheckboxCounter는 매칭 없이 이진화 + 연결 요소 크기/비율/채움 정도로 체크박스를 셈
+"""
+
+import os
+import time
+
+import cv2
+import numpy as np
+
+from .frame import CaptureFrame, load_gray
+
+
+class CheckboxCounter:
+    """템플릿 매칭 기반 체크박스 카운터"""
+
+    def __init__(self, template_path, threshold=0.7, min_distance=None):
+        """
+        초기화
+
+        Args:
+            template_path: 체크박스 템플릿 이미지 경로
+            threshold: 매칭 임계값 (TM_CCOEFF_NORMED)
+            min_distance: 같은 체크박스로 볼 최대 거리 (픽셀, None이면 템플릿 크기의 절반, 최소 8)
+        """
+        self.template_path = template_path
+        self.threshold = threshold
+        self.min_distance = min_distance
+        self._template = None
+        self._template_mtime = None
+
+    @property
+    def template(self):
+        """grayscale 템플릿 (파일이 바뀌었을 때만 다시 읽음)"""
+        mtime = os.path.getmtime(self.template_path)
+        if self._template is None or mtime != self._template_mtime:
+            template = cv2.imread(self.template_path, cv2.IMREAD_GRAYSCALE)
+            if template is None:
+                raise ValueError(f"체크박스 템플릿 로드 실패: {self.template_path}")
+            self._template = template
+            self._template_mtime = mtime
+        return self._template
+
+    def count(self, source, roi=None):
+        """
+        체크박스 찾기
+
+        Args:
+            source: CaptureFrame, 이미지 경로 또는 ndarray
+            roi: 검색 영역 (x, y, width, height, 이미지 픽셀 기준, None이면 전체)
+
+        Returns:
+            dict: {
+                'count': 체크박스 수,
+                'rects': [(x, y, w, h), ...] 이미지 픽셀 좌표 (위→아래 순),
+                'screen_rects': 화면 좌표 (source가 CaptureFrame일 때만, 아니면 rects와 같음),
+                'scores': 매칭 점수 목록,
+                'elapsed_ms': 소요 시간
+            }
+        """
+        start = time.perf_counter()
+        gray = load_gray(source)
+        if gray is None:
+            raise ValueError("체크박스 검색 이미지 로드 실패")
+
+        offset_x = offset_y = 0
+        if roi is not None:
+            x, y, w, h = (int(v) for v in roi)
+            offset_x, offset_y = max(0, x), max(0, y)
+            gray = gray[offset_y:y + h, offset_x:x + w]
+
+        template = self.template
+        t_h, t_w = template.shape[:2]
+        if gray.shape[0] < t_h or gray.shape[1] < t_w:
+            return self._result([], [], source, start)
+
+        response = cv2.matchTemplate(gray, template, cv2.TM_CCOEFF_NORMED)
+        # 평탄한 영역에서 생기는 NaN/inf 제거
+        np.nan_to_num(response, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+        distance = self.min_distance or max(8, min(t_w, t_h) // 2)
+        points, scores = self._find_peaks(response, distance)
+
+        rects = [
+            (int(px) + offset_x, int(py) + offset_y, t_w, t_h)
+            for px, py in points
+        ]
+        return self._result(rects, scores, source, start)
+
+    def _find_peaks(self, response, distance):
+        """
+        임계값 이상 후보를 점수 순으로 보면서 가까운 후보는 점수 높은 것 하나만 유지 (NMS)
+
+        Returns:
+            tuple: (좌표 ndarray [[x, y], ...], 점수 목록)
+        """
+        ys, xs = np.nonzero(response >= self.threshold)
+        if xs.size == 0:
+            return np.empty((0, 2), dtype=int), []
+
+        values = response[ys, xs]
+        order = np.argsort(-values, kind='stable')
+        points = np.stack([xs[order], ys[order]], axis=1)
+        values = values[order]
+
+        # 남은 후보(체크박스 수만큼)에 대해서만 반복, 거리 계산은 벡터 연산
+        keep = np.ones(len(points), dtype=bool)
+        limit = distance * distance
+        for i in range(len(points)):
+            if not keep[i]:
+                continue
+            delta = points[i + 1:] - points[i]
+            keep[i + 1:] &= (delta * delta).sum(axis=1) >= limit
+
+        points = points[keep]
+        values = values[keep]
+        # 위→아래, 왼쪽→오른쪽 순으로 정렬
+        order = np.lexsort((points[:, 0], points[:, 1]))
+        return points[order], [round(float(v), 3) for v in values[order]]
+
+    @staticmethod
+    def _result(rects, scores, source, start):
+        if isinstance(source, CaptureFrame):
+            screen_rects = []
+            scale_x, scale_y = source.scale
+            for x, y, w, h in rects:
+                screen_x, screen_y = source.to_screen(x, y)
+                screen_rects.append((screen_x, screen_y, int(w / scale_x), int(h / scale_y)))
+        else:
+            screen_rects = list(rects)
+        return {
+            'count': len(rects),
+            'rects': rects,
+            'screen_rects': screen_rects,
+            'scores': scores,
+            'elapsed_ms': (time.perf_counter() - start) * 1000,
+        }
+
+
+class ComponentCheckboxCounter:
+    """연결 요소(connected components) 기반 체크박스 카운터 (matchTemplate 없음)"""
+
+    def __init__(self, template_path, size_tolerance=0.25, aspect_tolerance=0.25, fill_tolerance=0.15,
+                 min_overlap=0.45):
+        """
+        초기화
+
+        Args:
+            template_path: 체크박스 템플릿 이미지 경로 (크기/비율/채움 정도를 여기서 학습)
+            size_tolerance: 허용 크기 차이 (템플릿 체크박스 너비/높이 대비 비율)
+            aspect_tolerance: 허용 가로세로 비율 차이
+            fill_tolerance: 허용 채움 정도 차이 (요소 픽셀 수 / 외곽 사각형 넓이)
+            min_overlap: 템플릿 외곽선과 겹쳐야 하는 최소 비율 (양쪽을 1픽셀 두껍게 한 뒤 IoU,
+                크기가 비슷한 글자('0', 'ㅁ') 제외, 실제 화면 체크박스 0.65~0.84 / 글자 0.25 이하)
+        """
+        self.template_path = template_path
+        self.size_tolerance = size_tolerance
+        self.aspect_tolerance = aspect_tolerance
+        self.fill_tolerance = fill_tolerance
+        self.min_overlap = min_overlap
+        self._shape = None
+        self._template_mtime = None
+
+    @property
+    def shape(self):
+        """
+        템플릿에서 학습한 체크박스 모양 (파일이 바뀌었을 때만 다시 계산)
+
+        Returns:
+            dict: {'threshold', 'width', 'height', 'aspect', 'fill', 'mask'(1픽셀 두껍게 한 외곽선 픽셀),
+                   'offset'(템플릿 안 외곽선 위치), 'size'(템플릿 크기)}
+        """
+        mtime = os.path.getmtime(self.template_path)
+        if self._shape is None or mtime != self._template_mtime:
+            template = cv2.imread(self.template_path, cv2.IMREAD_GRAYSCALE)
+            if template is None:
+                raise ValueError(f"체크박스 템플릿 로드 실패: {self.template_path}")
+            self._shape = self._learn_shape(template)
+            self._template_mtime = mtime
+        return self._shape
+
+    @staticmethod
+    def _learn_shape(template):
+        # 배경(중앙값)과 가장 어두운 선의 중간값으로 이진화
+        # (결과 영역에도 같은 값으로 이진화해야 같은 모양이 나오므로 임계값도 함께 기록)
+        threshold = (float(np.median(template)) + float(template.min())) / 2
+        _, ink = cv2.threshold(template, threshold, 255, cv2.THRESH_BINARY_INV)
+        n, labels, stats, _ = cv2.connectedComponentsWithStats(ink, connectivity=8)
+        if n < 2:
+            raise ValueError("체크박스 템플릿에서 외곽선을 찾지 못했습니다.")
+        # 가장 큰 요소가 체크박스 외곽선
+        label = 1 + int(np.argmax(stats[1:, cv2.CC_STAT_AREA]))
+        x = int(stats[label, cv2.CC_STAT_LEFT])
+        y = int(stats[label, cv2.CC_STAT_TOP])
+        w = int(stats[label, cv2.CC_STAT_WIDTH])
+        h = int(stats[label, cv2.CC_STAT_HEIGHT])
+        return {
+            'threshold': threshold,
+            'width': w,
+            'height': h,
+            'aspect': w / h,
+            'fill': float(stats[label, cv2.CC_STAT_AREA]) / (w * h),
+            'mask': ComponentCheckboxCounter._thicken(labels[y:y + h, x:x + w] == label),
+            'offset': (x, y),
+            'size': (template.shape[1], template.shape[0]),
+        }
+
+    def count(self, source, roi=None):
+        """
+        체크박스 찾기 (CheckboxCounter.count와 같은 결과 형식)
+
+        Args:
+            source: CaptureFrame, 이미지 경로 또는 ndarray
+            roi: 검색 영역 (x, y, width, height, 이미지 픽셀 기준, None이면 전체)
+
+        Returns:
+            dict: {'count', 'rects'(템플릿 크기 기준, 매칭 결과와 같은 위치), 'screen_rects', 'scores', 'elapsed_ms'}
+        """
+        start = time.perf_counter()
+        gray = load_gray(source)
+        if gray is None:
+            raise ValueError("체크박스 검색 이미지 로드 실패")
+
+        offset_x = offset_y = 0
+        if roi is not None:
+            x, y, w, h = (int(v) for v in roi)
+            offset_x, offset_y = max(0, x), max(0, y)
+            gray = gray[offset_y:y + h, offset_x:x + w]
+
+        shape = self.shape
+        _, ink = cv2.threshold(gray, shape['threshold'], 255, cv2.THRESH_BINARY_INV)
+        # 라벨 이미지는 쓰지 않으므로 16비트로 받아 메모리 쓰기를 줄임 (결과 영역 요소 수는 65535개 미만)
+        n, labels, stats, _ = cv2.connectedComponentsWithStats(ink, connectivity=8, ltype=cv2.CV_16U)
+        if n < 2:
+            return CheckboxCounter._result([], [], source, start)
+
+        stats = stats[1:]
+        widths = stats[:, cv2.CC_STAT_WIDTH].astype(np.float32)
+        heights = stats[:, cv2.CC_STAT_HEIGHT].astype(np.float32)
+        fills = stats[:, cv2.CC_STAT_AREA] / (widths * heights)
+
+        # 크기 → 비율 → 채움 정도 순으로 벡터 연산 필터
+        width_error = np.abs(widths / shape['width'] - 1)
+        height_error = np.abs(heights / shape['height'] - 1)
+        aspect_error = np.abs(widths / heights / shape['aspect'] - 1)
+        fill_error = np.abs(fills - shape['fill'])
+        keep = (
+            (width_error <= self.size_tolerance)
+            & (height_error <= self.size_tolerance)
+            & (aspect_error <= self.aspect_tolerance)
+            & (fill_error <= self.fill_tolerance)
+        )
+        # 남은 후보(체크박스 수 정도)만 외곽선 모양 비교
+        indices = [i for i in np.flatnonzero(keep) if self._overlap(labels, stats[i], i + 1) >= self.min_overlap]
+
+        # 템플릿 안에서 외곽선이 있던 위치만큼 당겨서 매칭 방식과 같은 사각형으로 보고
+        t_w, t_h = shape['size']
+        pad_x, pad_y = shape['offset']
+        rects = [
+            (
+                int(stats[i, cv2.CC_STAT_LEFT]) + offset_x - pad_x,
+                int(stats[i, cv2.CC_STAT_TOP]) + offset_y - pad_y,
+                t_w,
+                t_h,
+            )
+            for i in indices
+        ]
+        # 모양 차이가 작을수록 1에 가까운 점수 (외곽선 겹침은 필터로만 사용)
+        scores = [
+            round(1.0 - float(max(width_error[i], height_error[i], aspect_error[i], fill_error[i])), 3)
+            for i in indices
+        ]
+        # 위→아래, 왼쪽→오른쪽 순으로 정렬
+        order = sorted(range(len(rects)), key=lambda k: (rects[k][1], rects[k][0]))
+        return CheckboxCounter._result([rects[k] for k in order], [scores[k] for k in order], source, start)
+
+    def _overlap(self, labels, stat, label):
+        """
+        후보 요소를 템플릿 외곽선 크기로 맞춘 뒤 겹치는 비율 (IoU)
+
+        1픽셀 두께 선은 크기를 맞추는 과정에서 한 칸만 어긋나도 거의 겹치지 않으므로
+        양쪽을 1픽셀씩 두껍게 한 뒤 비교
+        """
+        mask = self.shape['mask']
+        x, y, w, h = (int(v) for v in stat[:4])
+        candidate = (labels[y:y + h, x:x + w] == label).astype(np.uint8)
+        candidate = cv2.resize(candidate, (mask.shape[1], mask.shape[0]), interpolation=cv2.INTER_NEAREST)
+        candidate = self._thicken(candidate)
+        union = np.count_nonzero(candidate | mask)
+        return np.count_nonzero(candidate & mask) / union if union else 0.0
+
+    @staticmethod
+    def _thicken(mask):
+        """외곽선을 1픽셀 두껍게 (3x3 팽창)"""
+        return cv2.dilate(mask.astype(np.uint8), np.ones((3, 3), np.uint8)) > 0
@@ -2,10 +2,14 @@
 MARK: 팝업 대화상자 경계 검출 모듈
 """
 
+import os
+
 import cv2
 import numpy as np
 from PIL import Image
 
+from .frame import CaptureFrame, load_bgr
+
 
 class DialogDetector:
     """팝업 대화상자 경계 검출기"""
@@ -26,7 +30,7 @@ class DialogDetector:
         명암 차이를 이용한 대화상자 경계선 검출
 
         Args:
-            screenshot_path: 스크린샷 이미지 경로
+            screenshot_path: 스크린샷 이미지 경로 (CaptureFrame/NumPy 배열도 허용)
             output_debug_path: 디버그 이미지 저장 경로 (None이면 자동 생성)
 
         Returns:
@@ -44,7 +48,7 @@ class DialogDetector:
         print("\n대화상자 경계 검출 시작")
 
         # 이미지 로드
-        image = cv2.imread(screenshot_path)
+        image = load_bgr(screenshot_path)
         if image is None:
             raise ValueError(f"이미지 로드 실패: {screenshot_path}")
 
@@ -141,9 +145,10 @@ class DialogDetector:
 
             # 저장 경로 설정
             if output_debug_path is None:
-                import os
-                base_dir = os.path.dirname(screenshot_path)
-                output_debug_path = os.path.join(base_dir, 'debug_dialog_boundary.png')
+                output_debug_path = os.path.join(
+                    self._debug_dir(screenshot_path),
+                    'debug_dialog_boundary.png'
+                )
 
             cv2.imwrite(output_debug_path, debug_image)
             print(f"디버그 이미지 저장: {output_debug_path}")
@@ -155,7 +160,7 @@ class DialogDetector:
         대화상자 내부에서 입력 필드들 찾기
 
         Args:
-            screenshot_path: 스크린샷 이미지 경로
+            screenshot_path: 스크린샷 이미지 경로 (CaptureFrame/NumPy 배열도 허용)
             dialog_boundary: detect_dialog_boundary()의 반환값
             template_dir: 템플릿 디렉토리 경로
 
@@ -166,7 +171,6 @@ class DialogDetector:
                 ...
             }
         """
-        import os
         from .image_matcher import ImageMatcher
 
         print("\n[대화상자 내부 UI 요소 검색]")
@@ -174,21 +178,14 @@ class DialogDetector:
               f"({dialog_boundary['right']}, {dialog_boundary['bottom']})")
 
         # 이미지 로드
-        image = cv2.imread(screenshot_path)
+        image = load_bgr(screenshot_path)
 
-        # 대화상자 영역만 크롭
+        # 대화상자 영역만 크롭 (임시 파일 없이 뷰로 전달)
         roi = image[
             dialog_boundary['y']:dialog_boundary['bottom'],
             dialog_boundary['x']:dialog_boundary['right']
         ]
 
-        # 크롭된 이미지 임시 저장
-        import tempfile
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-            roi_path = tmp.name
-            cv2.imwrite(roi_path, roi)
-
-        print(f"ROI 이미지 저장: {roi_path}")
         print(f"ROI 크기: {dialog_boundary['width']}x{dialog_boundary['height']}")
 
         # 템플릿 매칭으로 UI 요소 찾기
@@ -207,7 +204,7 @@ class DialogDetector:
 
             try:
                 print(f"\n{element_name} 검색 중...")
-                match = matcher.find_template(roi_path, template_path)
+                match = matcher.find_template(roi, template_path)
 
                 if match:
                     # ROI 기준 좌표를 전체 화면 좌표로 변환
@@ -234,12 +231,6 @@ class DialogDetector:
             except Exception as e:
                 print(f"{element_name} 검색 실패: {e}")
 
-        # 임시 파일 삭제
-        try:
-            os.unlink(roi_path)
-        except:
-            pass
-
         print(f"\n검색 완료: {len(results)}개 요소 발견")
 
         return results
@@ -249,7 +240,7 @@ class DialogDetector:
         Hough 직선 검출을 이용한 대화상자 경계 검출 (대안 방법)
 
         Args:
-            screenshot_path: 스크린샷 이미지 경로
+            screenshot_path: 스크린샷 이미지 경로 (CaptureFrame/NumPy 배열도 허용)
             output_debug_path: 디버그 이미지 저장 경로
 
         Returns:
@@ -258,7 +249,7 @@ class DialogDetector:
         print("\n[Hough 직선 검출 방식]")
 
         # 이미지 로드
-        image = cv2.imread(screenshot_path)
+        image = load_bgr(screenshot_path)
         if image is None:
             raise ValueError(f"이미지 로드 실패: {screenshot_path}")
 
@@ -338,15 +329,27 @@ class DialogDetector:
             cv2.rectangle(debug_image, (left_x, top_y), (right_x, bottom_y), (0, 0, 255), 3)
 
             if output_debug_path is None:
-                import os
-                base_dir = os.path.dirname(screenshot_path)
-                output_debug_path = os.path.join(base_dir, 'debug_hough_lines.png')
+                output_debug_path = os.path.join(
+                    self._debug_dir(screenshot_path),
+                    'debug_hough_lines.png'
+                )
 
             cv2.imwrite(output_debug_path, debug_image)
             print(f"디버그 이미지 저장: {output_debug_path}")
 
         return result
 
+    @staticmethod
+    def _debug_dir(source):
+        """디버그 이미지를 저장할 디렉토리 (메모리 프레임은 저장 경로 또는 기본 디렉토리)"""
+        if isinstance(source, CaptureFrame):
+            if source.path:
+                return os.path.dirname(source.path)
+            return "tmp/screenshots"
+        if isinstance(source, np.ndarray):
+            return "tmp/screenshots"
+        return os.path.dirname(source)
+
 
 if __name__ == "__main__":
     # 테스트
@@ -0,0 +1,198 @@
+"""
+MARK: 메모리 캡처 프레임 모듈
+PNG 저장/재로딩 없이 캡처 결과를 바로 비전 파이프라인에 넘기기 위한 컨테이너
+"""
+
+import time
+
+import cv2
+import numpy as np
+
+
+class CaptureFrame:
+    """메모리 상의 캡처 결과 (PIL 버퍼 기반 NumPy 뷰 + 크기/배율 메타데이터)"""
+
+    def __init__(self, image, origin=(0, 0), logical_size=None, kind='fullscreen'):
+        """
+        초기화
+
+        Args:
+            image: PIL.Image (RGB/RGBA/L)
+            origin: 캡처 영역의 화면 좌표 기준 왼쪽 상단 (x, y)
+            logical_size: 캡처 영역의 화면 좌표 기준 크기 (None이면 이미지 크기)
+            kind: 캡처 종류 ('fullscreen', 'region', 'window')
+        """
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        self.image = image
+        self.origin = (int(origin[0]), int(origin[1]))
+        self.size = image.size
+        self.logical_size = tuple(logical_size) if logical_size else image.size
+        self.kind = kind
+        self.step = None  # CapturePlanner 단계 이름 ('result', 'status' 등, 세션 녹화에 기록)
+        self.timestamp = time.time()
+        self.path = None
+
+        self._array = None
+        self._bgr = None
+        self._gray = None
+
+    @property
+    def width(self):
+        return self.size[0]
+
+    @property
+    def height(self):
+        return self.size[1]
+
+    @property
+    def scale(self):
+        """이미지 픽셀 / 화면 좌표 배율 (Retina 환경에서는 2.0 등)"""
+        logical_w, logical_h = self.logical_size
+        scale_x = self.size[0] / logical_w if logical_w else 1.0
+        scale_y = self.size[1] / logical_h if logical_h else 1.0
+        return scale_x, scale_y
+
+    @property
+    def array(self):
+        """PIL 버퍼를 그대로 감싼 읽기 전용 NumPy 배열 (RGB 또는 L)"""
+        if self._array is None:
+            self._array = np.asarray(self.image)
+        return self._array
+
+    @property
+    def bgr(self):
+        """OpenCV용 BGR 이미지 (최초 접근 시 한 번만 변환)"""
+        if self._bgr is None:
+            if self.image.mode == 'L':
+                self._bgr = cv2.cvtColor(self.array, cv2.COLOR_GRAY2BGR)
+            else:
+                self._bgr = cv2.cvtColor(self.array, cv2.COLOR_RGB2BGR)
+        return self._bgr
+
+    @property
+    def gray(self):
+        """그레이스케일 이미지 (RGB 버퍼에서 직접 변환, BGR 경유 없음)"""
+        if self._gray is None:
+            if self.image.mode == 'L':
+                self._gray = self.array
+            else:
+                self._gray = cv2.cvtColor(self.array, cv2.COLOR_RGB2GRAY)
+        return self._gray
+
+    def to_screen(self, x, y):
+        """
+        프레임 픽셀 좌표를 화면 좌표로 변환
+
+        Args:
+            x, y: 프레임 내부 픽셀 좌표
+
+        Returns:
+            tuple: (screen_x, screen_y)
+        """
+        scale_x, scale_y = self.scale
+        return (
+            self.origin[0] + int(x / scale_x),
+            self.origin[1] + int(y / scale_y),
+        )
+
+    def crop(self, x, y, width, height):
+        """
+        프레임 픽셀 좌표 기준으로 잘라낸 하위 프레임 반환
+
+        Args:
+            x, y: 프레임 내부 픽셀 좌표
+            width, height: 픽셀 크기
+
+        Returns:
+            CaptureFrame: 잘라낸 프레임 (origin/배율 유지)
+        """
+        scale_x, scale_y = self.scale
+        sub = self.image.crop((x, y, x + width, y + height))
+        origin = (
+            self.origin[0] + int(x / scale_x),
+            self.origin[1] + int(y / scale_y),
+        )
+        logical = (int(round(width / scale_x)), int(round(height / scale_y)))
+        return CaptureFrame(sub, origin=origin, logical_size=logical, kind=self.kind)
+
+    def detached(self):
+        """
+        같은 PIL 이미지를 공유하고 변환 캐시(RGB/BGR/gray 배열)는 없는 복사본 (링 버퍼 보관용)
+
+        Returns:
+            CaptureFrame: 메타데이터가 같은 프레임
+        """
+        frame = CaptureFrame(self.image, origin=self.origin, logical_size=self.logical_size, kind=self.kind)
+        frame.step = self.step
+        frame.timestamp = self.timestamp
+        frame.path = self.path
+        return frame
+
+    @property
+    def nbytes(self):
+        """PIL 이미지 버퍼 크기 (바이트)"""
+        return self.size[0] * self.size[1] * len(self.image.getbands())
+
+    def __repr__(self):
+        return (
+            f"CaptureFrame(kind={self.kind}, size={self.size[0]}x{self.size[1]}, "
+            f"origin={self.origin}, path={self.path})"
+        )
+
+
+def load_bgr(source):
+    """
+    경로/프레임/배열 어느 것이든 BGR 이미지로 변환
+
+    Args:
+        source: 이미지 파일 경로, CaptureFrame 또는 NumPy 배열
+
+    Returns:
+        numpy.ndarray or None: BGR 이미지
+    """
+    if isinstance(source, CaptureFrame):
+        return source.bgr
+    if isinstance(source, np.ndarray):
+        if source.ndim == 2:
+            return cv2.cvtColor(source, cv2.COLOR_GRAY2BGR)
+        return source
+    return cv2.imread(str(source), cv2.IMREAD_COLOR)
+
+
+def load_gray(source):
+    """
+    경로/프레임/배열 어느 것이든 그레이스케일 이미지로 변환
+
+    Args:
+        source: 이미지 파일 경로, CaptureFrame 또는 NumPy 배열
+
+    Returns:
+        numpy.ndarray or None: 그레이스케일 이미지
+    """
+    if isinstance(source, CaptureFrame):
+        return source.gray
+    if isinstance(source, np.ndarray):
+        if source.ndim == 3:
+            return cv2.cvtColor(source, cv2.COLOR_BGR2GRAY)
+        return source
+    return cv2.imread(str(source), cv2.IMREAD_GRAYSCALE)
+
+
+def image_size(source):
+    """
+    경로/프레임/배열의 (width, height) 반환
+
+    Args:
+        source: 이미지 파일 경로, CaptureFrame 또는 NumPy 배열
+
+    Returns:
+        tuple: (width, height)
+    """
+    if isinstance(source, CaptureFrame):
+        return source.size
+    if isinstance(source, np.ndarray):
+        return source.shape[1], source.shape[0]
+    from PIL import Image
+    with Image.open(source) as img:
+        return img.size
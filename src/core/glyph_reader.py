@@ -0,0 +1,268 @@
+"""
+MARK: 상태 표시줄 숫자 판독 모듈
+'조회 결과: N명' 같은 요약 줄의 숫자 부분만 캡처해 글자(glyph) 단위로 자르고,
+실제 화면에서 모은 숫자 예시와 비교해 읽음 (OCR 의존성 없음, 작은 영역이라 매칭보다 훨씬 빠름)
+"""
+
+import json
+import os
+import time
+
+import cv2
+import numpy as np
+
+from .frame import load_gray
+from .pacing import default_pacing_path
+
+
+DIGITS = '0123456789'
+
+
+def default_glyph_path(base_dir="tmp/glyphs"):
+    """
+    장비별 숫자 예시 저장 경로
+
+    Returns:
+        str: tmp/glyphs/<호스트명>_<OS>.json
+    """
+    return default_pacing_path(base_dir)
+
+
+def segment_glyphs(source, min_contrast=40):
+    """
+    글자 영역 나누기 (세로 방향으로 잉크가 없는 열을 경계로)
+
+    Args:
+        source: CaptureFrame, 이미지 경로 또는 ndarray
+        min_contrast: 글자가 있다고 볼 최소 밝기 차이 (빈 영역에서 잡음을 글자로 보지 않도록)
+
+    Returns:
+        tuple: (잉크 이진 이미지, [(x, y, w, h), ...] 왼쪽→오른쪽 순)
+    """
+    gray = load_gray(source)
+    if gray is None or gray.size == 0 or int(gray.max()) - int(gray.min()) < min_contrast:
+        return None, []
+
+    _, ink = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+    if cv2.countNonZero(ink) > ink.size / 2:
+        # 어두운 배경에 밝은 글자
+        ink = cv2.bitwise_not(ink)
+
+    columns = ink.any(axis=0)
+    boxes = []
+    x = 0
+    width = len(columns)
+    while x < width:
+        if not columns[x]:
+            x += 1
+            continue
+        start = x
+        while x < width and columns[x]:
+            x += 1
+        rows = np.flatnonzero(ink[:, start:x].any(axis=1))
+        boxes.append((start, int(rows[0]), x - start, int(rows[-1] - rows[0] + 1)))
+    return ink, boxes
+
+
+def glyph_signature(ink, box, size=(8, 12)):
+    """
+    글자 하나의 정규화 이미지 (0~1 float32 1차원 배열)
+
+    좁은 글자('1')가 가로로 늘어나 다른 글자처럼 보이지 않도록 size 비율에 맞게 여백을 넣은 뒤 축소
+
+    Args:
+        ink: segment_glyphs의 잉크 이진 이미지
+        box: (x, y, w, h)
+        size: 정규화 크기 (width, height)
+
+    Returns:
+        ndarray: 서명
+    """
+    x, y, w, h = box
+    crop = ink[y:y + h, x:x + w]
+    target_w = max(w, int(round(h * size[0] / size[1])))
+    padded = np.zeros((h, target_w), dtype=np.uint8)
+    left = (target_w - w) // 2
+    padded[:, left:left + w] = crop
+    small = cv2.resize(padded, size, interpolation=cv2.INTER_AREA)
+    return small.astype(np.float32).ravel() / 255.0
+
+
+class GlyphDigitReader:
+    """숫자 예시 최근접 비교 기반 숫자 판독기"""
+
+    def __init__(self, app_name='default', threshold=0.18, max_examples=4, path=None):
+        """
+        초기화
+
+        Args:
+            app_name: 대상 프로그램 이름 (예시를 프로그램별로 저장)
+            threshold: 이 거리 이내의 예시가 있어야 숫자로 인정 (평균 픽셀 차이, 0~1)
+            max_examples: 숫자별 최대 예시 수
+            path: 저장 경로 (None이면 장비별 기본 경로, ''이면 저장 안 함)
+        """
+        if path is None:
+            path = default_glyph_path()
+        self.path = path or None
+        self.app_name = app_name
+        self.threshold = threshold
+        self.max_examples = max(1, int(max_examples))
+        self.examples = {}  # digit -> [signature, ...]
+        self.suffix_glyphs = None  # 숫자 뒤 글자 수 ('명' 등, 맞게 읽은 결과로 확인)
+        self._dirty = False
+        self.stats = {'reads': 0, 'unreadable': 0, 'learned': 0}
+        self.load()
+
+    def known_digits(self):
+        return ''.join(digit for digit in DIGITS if self.examples.get(digit))
+
+    def read(self, source):
+        """
+        앞쪽부터 연속된 숫자 읽기 (숫자가 아닌 글자('명' 등)가 나오면 멈춤)
+
+        Args:
+            source: 숫자 영역 CaptureFrame, 이미지 경로 또는 ndarray
+
+        Returns:
+            dict: {
+                'value': 읽은 정수 또는 None,
+                'text': 읽은 숫자 문자열,
+                'distance': 읽은 글자 중 가장 먼 예시 거리,
+                'unknown': 숫자 뒤에 남은 글자 수,
+                'complete': 숫자를 끝까지 읽었는지 (숫자 뒤 글자 수가 확인된 값과 같으면 True,
+                            아직 확인 전이면 None, 예시가 없는 숫자에서 멈췄으면 False),
+                'elapsed_ms': 소요 시간
+            }
+        """
+        start = time.perf_counter()
+        ink, boxes = segment_glyphs(source)
+        text = ''
+        worst = 0.0
+        for box in boxes:
+            digit, distance = self._classify(glyph_signature(ink, box))
+            if digit is None:
+                break
+            text += digit
+            worst = max(worst, distance)
+
+        self.stats['reads'] += 1
+        if not text:
+            self.stats['unreadable'] += 1
+        unknown = len(boxes) - len(text)
+        return {
+            'value': int(text) if text else None,
+            'text': text,
+            'distance': worst,
+            'unknown': unknown,
+            'complete': None if self.suffix_glyphs is None else unknown == self.suffix_glyphs,
+            'elapsed_ms': (time.perf_counter() - start) * 1000,
+        }
+
+    def confirm(self, read):
+        """
+        다른 방법(체크박스 수)과 일치한 판독 결과로 숫자 뒤 글자 수 확정
+
+        Args:
+            read: read() 결과
+        """
+        if read['value'] is not None and self.suffix_glyphs != read['unknown']:
+            self.suffix_glyphs = read['unknown']
+            self._dirty = True
+
+    def learn(self, source, value):
+        """
+        알고 있는 값으로 앞쪽 글자들을 숫자 예시로 저장
+
+        Args:
+            source: 숫자 영역 이미지
+            value: 영역에 표시된 정수 (예: 체크박스로 센 세대원 수)
+
+        Returns:
+            bool: 예시를 추가했으면 True (글자 수가 맞지 않으면 False)
+        """
+        text = str(int(value))
+        ink, boxes = segment_glyphs(source)
+        if len(boxes) < len(text):
+            return False
+
+        digit_boxes = boxes[:len(text)]
+        heights = [h for _, _, _, h in digit_boxes]
+        # 숫자끼리는 높이가 비슷해야 함 (붙은 글자/잘린 영역이면 학습하지 않음)
+        if min(heights) < max(heights) * 0.7:
+            return False
+
+        added = False
+        for digit, box in zip(text, digit_boxes):
+            signature = glyph_signature(ink, box)
+            examples = self.examples.setdefault(digit, [])
+            if any(float(np.abs(signature - known).mean()) <= self.threshold / 3 for known in examples):
+                continue
+            examples.append(signature)
+            if len(examples) > self.max_examples:
+                del examples[0]
+            added = True
+        if added:
+            self._dirty = True
+            self.stats['learned'] += 1
+        return added
+
+    def _classify(self, signature):
+        best_digit, best_distance = None, float('inf')
+        for digit, examples in self.examples.items():
+            for known in examples:
+                distance = float(np.abs(signature - known).mean())
+                if distance < best_distance:
+                    best_digit, best_distance = digit, distance
+        if best_distance > self.threshold:
+            return None, best_distance
+        return best_digit, best_distance
+
+    def load(self):
+        """저장된 예시 불러오기"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[STATUS] 숫자 예시 로드 실패: {e}")
+            return
+
+        entry = data.get(self.app_name) or {}
+        self.examples = {
+            digit: [np.asarray(values, dtype=np.float32) for values in signatures]
+            for digit, signatures in entry.get('digits', {}).items()
+            if digit in DIGITS
+        }
+        self.suffix_glyphs = entry.get('suffix_glyphs')
+        if self.examples:
+            print(f"[STATUS] '{self.app_name}' 숫자 예시 사용: {self.known_digits()}")
+
+    def save(self):
+        """프로그램별 예시 저장 (변경이 있을 때만)"""
+        if not self.path or not self._dirty:
+            return
+        data = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+
+        data[self.app_name] = {
+            'digits': {
+                digit: [[round(float(v), 3) for v in signature] for signature in signatures]
+                for digit, signatures in self.examples.items()
+            },
+            'suffix_glyphs': self.suffix_glyphs,
+            'updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        self._dirty = False
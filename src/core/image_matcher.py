@@ -8,6 +8,8 @@ import cv2
 import numpy as np
 import math
 
+from .frame import load_bgr, load_gray
+
 
 class ImageMatcher:
     """이미지 템플릿 매칭"""
@@ -129,7 +131,7 @@ class ImageMatcher:
         스크린샷에서 템플릿 이미지 찾기
         
         Args:
-            screenshot_path: 스크린샷 이미지 경로
+            screenshot_path: 스크린샷 이미지 경로 (CaptureFrame/NumPy 배열도 허용)
             template_path: 템플릿 이미지 경로
             method: OpenCV 매칭 방법
             scale_search: 탐색 시 사용할 배율 목록 (None이면 self.search_scales 사용)
@@ -152,9 +154,9 @@ class ImageMatcher:
         else:
             methods = (method,) if method in self.SUPPORTED_METHODS else self.methods
 
-        # 원본 이미지 로드
-        screenshot_gray = cv2.imread(screenshot_path, cv2.IMREAD_GRAYSCALE)
-        screenshot_color = cv2.imread(screenshot_path, cv2.IMREAD_COLOR)
+        # 원본 이미지 로드 (메모리 프레임이면 디코딩 없이 사용)
+        screenshot_gray = load_gray(screenshot_path)
+        screenshot_color = load_bgr(screenshot_path)
 
         if screenshot_gray is None or screenshot_color is None:
             raise ValueError("Failed to load images")
@@ -474,7 +476,7 @@ class ImageMatcher:
         스크린샷에서 템플릿의 모든 매칭 위치 찾기
         
         Args:
-            screenshot_path: 스크린샷 이미지 경로
+            screenshot_path: 스크린샷 이미지 경로 (CaptureFrame/NumPy 배열도 허용)
             template_path: 템플릿 이미지 경로
             threshold: 신뢰도 임계값 (None이면 self.confidence 사용)
             
@@ -485,7 +487,7 @@ class ImageMatcher:
             threshold = self.confidence
         
         # 이미지 로드
-        screenshot = cv2.imread(screenshot_path, cv2.IMREAD_GRAYSCALE)
+        screenshot = load_gray(screenshot_path)
         template = cv2.imread(template_path, cv2.IMREAD_GRAYSCALE)
         
         if screenshot is None or template is None:
@@ -524,12 +526,12 @@ class ImageMatcher:
         매칭 결과를 이미지에 표시
         
         Args:
-            screenshot_path: 스크린샷 이미지 경로
+            screenshot_path: 스크린샷 이미지 경로 (CaptureFrame/NumPy 배열도 허용)
             matches: 매칭 결과 리스트
             output_path: 출력 이미지 경로
         """
-        # 이미지 로드 (컬러)
-        screenshot = cv2.imread(screenshot_path)
+        # 이미지 로드 (컬러, 원본 프레임은 보존)
+        screenshot = load_bgr(screenshot_path).copy()
         
         # 매칭 위치에 사각형 그리기
         for match in matches:
@@ -560,7 +562,7 @@ class ColorMatcher:
         특정 색상 범위의 영역 찾기
         
         Args:
-            image_path: 이미지 경로
+            image_path: 이미지 경로 (CaptureFrame/NumPy 배열도 허용)
             lower_color: 하한 색상 (B, G, R)
             upper_color: 상한 색상 (B, G, R)
             
@@ -568,7 +570,7 @@ class ColorMatcher:
             list: 매칭된 영역 리스트 [(x, y, w, h), ...]
         """
         # 이미지 로드
-        image = cv2.imread(image_path)
+        image = load_bgr(image_path)
         
         # 색상 범위로 마스크 생성
         mask = cv2.inRange(image, np.array(lower_color), np.array(upper_color))
@@ -0,0 +1,54 @@
+"""
+MARK: 상호작용 프로필 모듈
+대상 프로그램이 지원하는 키보드 조작(Enter 검색, 포커스 유지)을 프로필로 정의해
+레코드마다 필요한 템플릿 탐색/마우스 이동을 줄임
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class InteractionProfile:
+    """한 건 검색의 조작 방식"""
+
+    name: str
+    submit: str = 'enter'  # 'enter'(키 입력으로 검색) 또는 'click'(검색 버튼 클릭)
+    submit_key: str = 'enter'
+    refocus: str = 'once'  # 'once'(첫 건만 입력 필드 클릭) 또는 'every'(매 건 클릭)
+
+    def __post_init__(self):
+        if self.submit not in ('enter', 'click'):
+            raise ValueError(f"지원하지 않는 검색 방식입니다: {self.submit}")
+        if self.refocus not in ('once', 'every'):
+            raise ValueError(f"지원하지 않는 포커스 방식입니다: {self.refocus}")
+
+    @property
+    def uses_search_button(self):
+        return self.submit == 'click'
+
+
+PROFILES = {
+    # 기존 방식: 매 건 입력 필드/검색 버튼 클릭
+    'mouse': InteractionProfile('mouse', submit='click', refocus='every'),
+    # 입력 필드 포커스는 첫 건에서만 확인하고 Enter로 검색
+    'keyboard': InteractionProfile('keyboard', submit='enter', refocus='once'),
+    # Enter로 검색하되 포커스를 잃는 화면을 위해 매 건 입력 필드 클릭
+    'keyboard_refocus': InteractionProfile('keyboard_refocus', submit='enter', refocus='every'),
+}
+
+
+def get_profile(profile):
+    """
+    프로필 조회
+
+    Args:
+        profile: 프로필 이름 또는 InteractionProfile
+
+    Returns:
+        InteractionProfile
+    """
+    if isinstance(profile, InteractionProfile):
+        return profile
+    if profile not in PROFILES:
+        raise ValueError(f"알 수 없는 상호작용 프로필입니다: {profile} (사용 가능: {', '.join(PROFILES)})")
+    return PROFILES[profile]
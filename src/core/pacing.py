@@ -0,0 +1,225 @@
+"""
+MARK: 적응형 동작 간격 조절 모듈
+성공 신호가 이어지면 대기 시간을 줄이고 실패하면 늘려서, 동작 유형별 최소 안전 지연을 학습
+"""
+
+import json
+import os
+import platform
+import socket
+import tempfile
+import threading
+import time
+
+
+def default_pacing_path(base_dir="tmp/pacing"):
+    """
+    장비별 학습값 저장 경로
+
+    Returns:
+        str: tmp/pacing/<호스트명>_<OS>.json
+    """
+    host = socket.gethostname() or 'unknown'
+    safe_host = ''.join(ch if ch.isalnum() or ch in '-_' else '_' for ch in host)
+    return os.path.join(base_dir, f"{safe_host}_{platform.system().lower()}.json")
+
+
+class PacingController:
+    """동작 유형별 적응형 지연 시간 컨트롤러"""
+
+    def __init__(
+        self,
+        path=None,
+        min_delay=0.01,
+        max_delay=3.0,
+        tighten=0.85,
+        backoff=2.0,
+        success_streak=3,
+        autosave_every=20,
+        min_fraction=0.5,
+    ):
+        """
+        초기화
+
+        Args:
+            path: 학습값 저장 경로 (None이면 장비별 기본 경로, False면 저장 안 함)
+            min_delay: 최소 지연 (초)
+            max_delay: 최대 지연 (초)
+            tighten: 연속 성공 시 곱할 비율 (1보다 작음)
+            backoff: 실패 시 곱할 비율 (1보다 큼)
+            success_streak: 지연을 줄이기 전 필요한 연속 성공 횟수
+            autosave_every: 이 횟수만큼 보고가 쌓이면 자동 저장 (0이면 수동 저장만)
+            min_fraction: 동작별 기본값(기존 고정값) 대비 최소 비율
+                (성공 신호가 잘못 들어와도 지연이 min_delay까지 내려가지 않도록)
+        """
+        if path is None:
+            path = default_pacing_path()
+        self.path = path or None
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.tighten = tighten
+        self.backoff = backoff
+        self.success_streak = success_streak
+        self.autosave_every = autosave_every
+        self.min_fraction = min_fraction
+
+        self._lock = threading.Lock()
+        # action -> {'delay', 'floor', 'baseline', 'streak', 'successes', 'failures'}
+        self.actions = {}
+        self._reports_since_save = 0
+        self.load()
+
+    def delay_for(self, action, default=0.5):
+        """
+        현재 학습된 지연 시간
+
+        Args:
+            action: 동작 유형 ('click', 'key', 'settle', 'between_records' 등)
+            default: 처음 보는 동작의 초기 지연 (기존 고정값)
+
+        Returns:
+            float: 지연 시간 (초)
+        """
+        with self._lock:
+            entry = self._entry(action, default)
+            # 이전 버전에서 하한 없이 줄어든 학습값도 기본값 기준 하한까지 올림
+            entry['delay'] = max(entry['delay'], self._lower_bound(entry))
+            return entry['delay']
+
+    def wait(self, action, default=0.5):
+        """학습된 지연 시간만큼 대기"""
+        delay = self.delay_for(action, default)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def report(self, actions, success):
+        """
+        동작 결과 보고
+
+        Args:
+            actions: 동작 유형 또는 목록 (이번 단계에서 사용한 지연들)
+            success: True(기대한 변화 확인), False(실패), None(판단 불가, 학습 안 함)
+        """
+        if success is None:
+            return
+        if isinstance(actions, str):
+            actions = (actions,)
+
+        with self._lock:
+            for action in actions:
+                entry = self._entry(action, None)
+                if success:
+                    entry['successes'] += 1
+                    entry['streak'] += 1
+                    if entry['streak'] >= self.success_streak:
+                        entry['streak'] = 0
+                        entry['delay'] = max(self._lower_bound(entry), entry['floor'], entry['delay'] * self.tighten)
+                        # 오래된 실패 기록은 천천히 잊음
+                        entry['floor'] *= 0.99
+                else:
+                    entry['failures'] += 1
+                    entry['streak'] = 0
+                    # 실패한 지연값은 안전하지 않으므로 그보다 조금 위를 하한으로 기억
+                    entry['floor'] = min(self.max_delay, max(entry['floor'], entry['delay'] * 1.2))
+                    entry['delay'] = min(self.max_delay, max(entry['delay'] * self.backoff, entry['floor']))
+            self._reports_since_save += 1
+            should_save = self.autosave_every and self._reports_since_save >= self.autosave_every
+
+        if should_save:
+            self.save()
+
+    def summary(self):
+        """
+        학습 현황
+
+        Returns:
+            dict: {action: {'delay', 'floor', 'baseline', 'successes', 'failures'}}
+        """
+        with self._lock:
+            return {
+                action: {
+                    'delay': round(entry['delay'], 4),
+                    'floor': round(entry['floor'], 4),
+                    'baseline': entry['baseline'],
+                    'successes': entry['successes'],
+                    'failures': entry['failures'],
+                }
+                for action, entry in self.actions.items()
+            }
+
+    def load(self):
+        """저장된 학습값 불러오기"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[PACING] 학습값 로드 실패: {e}")
+            return
+
+        for action, values in data.get('actions', {}).items():
+            delay = float(values.get('delay', 0.5))
+            self.actions[action] = {
+                'delay': min(self.max_delay, max(self.min_delay, delay)),
+                'floor': float(values.get('floor', 0.0)),
+                # 기본값이 기록되지 않은 이전 학습값은 delay_for가 처음 불릴 때 채움
+                'baseline': values.get('baseline'),
+                'streak': 0,
+                'successes': int(values.get('successes', 0)),
+                'failures': int(values.get('failures', 0)),
+            }
+        print(f"[PACING] 학습값 로드: {self.path} ({len(self.actions)}개 동작)")
+
+    def save(self):
+        """학습값 저장"""
+        if not self.path:
+            return
+        data = {
+            'host': socket.gethostname(),
+            'platform': platform.platform(),
+            'updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'actions': self.summary(),
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 여러 스레드(윈도우)가 같은 컨트롤러를 공유하므로 임시 파일 이름이 겹치지 않게 생성
+        fd, temp_path = tempfile.mkstemp(
+            prefix=os.path.basename(self.path) + '.', suffix='.tmp', dir=directory or None
+        )
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        with self._lock:
+            self._reports_since_save = 0
+
+    def _entry(self, action, default):
+        entry = self.actions.get(action)
+        if entry is None:
+            initial = 0.5 if default is None else default
+            entry = {
+                'delay': min(self.max_delay, max(0.0, initial)),
+                'floor': 0.0,
+                'baseline': default,
+                'streak': 0,
+                'successes': 0,
+                'failures': 0,
+            }
+            self.actions[action] = entry
+        elif default is not None and entry['baseline'] is None:
+            entry['baseline'] = default
+        return entry
+
+    def _lower_bound(self, entry):
+        """연속 성공으로 줄일 수 있는 하한 (min_delay와 기본값 × min_fraction 중 큰 값)"""
+        baseline = entry['baseline']
+        if baseline is None or baseline <= 0:
+            return self.min_delay
+        return max(self.min_delay, baseline * self.min_fraction)
@@ -2,29 +2,108 @@
 TITLE: 화면 캡처 모듈
 """
 
-import pyautogui
-from PIL import Image
 import os
-from datetime import datetime
-import subprocess
-import platform
+
+from .capture_backends import create_backend
+from .frame import CaptureFrame
+from .screenshot_store import ScreenshotStore
+from .window_geometry import CachedWindowGeometry, WindowGeometryProvider, create_geometry_provider
 
 
 class ScreenCapture:
     """화면 캡처 유틸리티"""
-    
-    def __init__(self, output_dir="tmp/screenshots", target_window=None):
+
+    PERSIST_MODES = ('none', 'background', 'sync')
+
+    def __init__(
+        self,
+        output_dir="tmp/screenshots",
+        target_window=None,
+        persist_mode='background',
+        store=None,
+        backend='auto',
+        window_geometry=None,
+    ):
         """
         초기화
 
         Args:
             output_dir: 스크린샷 저장 디렉토리
             target_window: 타겟 윈도우 이름 (예: "행복e음 Mock System")
+            persist_mode: grab_* 결과 저장 방식
+                ('none': 저장 안 함, 'background': 백그라운드 저장, 'sync': 즉시 저장)
+            store: ScreenshotStore (None이면 기본 보관 정책으로 생성)
+            backend: 캡처 백엔드 이름 ('auto', 'pyautogui', 'x11shm', 'replay') 또는 CaptureBackend
+            window_geometry: CachedWindowGeometry 또는 WindowGeometryProvider
+                (None이면 OS에 맞는 조회기를 캐시로 감싸서 사용)
         """
+        if persist_mode not in self.PERSIST_MODES:
+            raise ValueError(f"지원하지 않는 저장 방식입니다: {persist_mode}")
+
         self.output_dir = output_dir
         self.target_window = target_window
+        self.persist_mode = persist_mode
+        if store is None:
+            store = ScreenshotStore(output_dir, background=(persist_mode == 'background'))
+        self.store = store
+        self.backend = create_backend(backend)
+        self._screen_size = None
+        self._capture_scale = None
+        self._frame_listeners = []
+
+        if isinstance(window_geometry, WindowGeometryProvider):
+            window_geometry = CachedWindowGeometry(window_geometry)
+        elif window_geometry is None:
+            provider = create_geometry_provider() if target_window else None
+            window_geometry = CachedWindowGeometry(provider)
+        self.window_geometry = window_geometry
         os.makedirs(output_dir, exist_ok=True)
-    
+
+    def grab_full_screen(self, persist=True):
+        """
+        전체 화면을 메모리로 캡처 (target_window가 설정되어 있으면 해당 윈도우만 캡처)
+
+        Args:
+            persist: 링 버퍼/디스크/프레임 리스너에 넘길지 여부
+                (안정화 대기처럼 짧은 간격으로 반복 캡처할 때는 False로 두고 최종 프레임만 persist_frame)
+
+        Returns:
+            CaptureFrame: 캡처 프레임 (persist_mode에 따라 디스크 저장 예약)
+        """
+        if self.target_window:
+            frame = self._grab_window(self.target_window)
+        else:
+            screenshot = self.backend.grab()
+            frame = CaptureFrame(screenshot, logical_size=self.get_screen_size())
+
+        if persist:
+            self._persist(frame, "fullscreen")
+        return frame
+
+    def grab_region(self, x, y, width, height, persist=True):
+        """
+        영역을 메모리로 캡처
+
+        Args:
+            x, y: 시작 좌표 (화면 좌표)
+            width, height: 영역 크기 (화면 좌표)
+            persist: 링 버퍼/디스크/프레임 리스너에 넘길지 여부 (grab_full_screen 참고)
+
+        Returns:
+            CaptureFrame: 캡처 프레임
+        """
+        screenshot = self.backend.grab((x, y, width, height))
+        frame = CaptureFrame(
+            screenshot,
+            origin=(x, y),
+            logical_size=(width, height),
+            kind='region'
+        )
+
+        if persist:
+            self._persist(frame, "region")
+        return frame
+
     def capture_full_screen(self, save_path=None):
         """
         전체 화면 캡처 (target_window가 설정되어 있으면 해당 윈도우만 캡처)
@@ -35,20 +114,23 @@ class ScreenCapture:
         Returns:
             str: 저장된 파일 경로
         """
-        if save_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_path = os.path.join(self.output_dir, f"fullscreen_{timestamp}.png")
+        auto_path = save_path is None
+        if auto_path:
+            save_path = self.store.make_path("fullscreen")
 
         # 타겟 윈도우가 설정되어 있으면 해당 윈도우만 캡처
         if self.target_window:
-            return self._capture_window_macos(self.target_window, save_path)
+            frame = self._grab_window(self.target_window)
+        else:
+            frame = CaptureFrame(self.backend.grab(), logical_size=self.get_screen_size())
 
-        # 전체 화면 캡처
-        screenshot = pyautogui.screenshot()
-        screenshot.save(save_path)
+        self.store.save_image(frame.image, save_path)
+        frame.path = save_path
+        if auto_path:
+            self.store.register_file(save_path)
 
         return save_path
-    
+
     def capture_region(self, x, y, width, height, save_path=None):
         """
         영역 캡처
@@ -61,12 +143,14 @@ class ScreenCapture:
         Returns:
             str: 저장된 파일 경로
         """
-        if save_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            save_path = os.path.join(self.output_dir, f"region_{timestamp}.png")
+        auto_path = save_path is None
+        if auto_path:
+            save_path = self.store.make_path("region")
         
-        screenshot = pyautogui.screenshot(region=(x, y, width, height))
-        screenshot.save(save_path)
+        screenshot = self.backend.grab((x, y, width, height))
+        self.store.save_image(screenshot, save_path)
+        if auto_path:
+            self.store.register_file(save_path)
         
         return save_path
     
@@ -87,79 +171,119 @@ class ScreenCapture:
     
     def get_screen_size(self):
         """
-        화면 크기 반환
+        화면 크기 반환 (최초 조회 후 캐시)
 
         Returns:
             tuple: (width, height)
         """
-        return pyautogui.size()
+        if self._screen_size is None:
+            self._screen_size = self.backend.screen_size()
+        return self._screen_size
 
-    def _capture_window_macos(self, window_name, save_path):
+    def get_capture_scale(self, probe=16):
         """
-        macOS 윈도우 캡처 (AppleScript 사용)
+        캡처 픽셀 / 화면 좌표 배율 (최초 조회 후 캐시, Retina/HiDPI면 2.0 등)
+
+        화면 좌표 크기가 같아도 배율이 바뀌면 템플릿/좌표가 맞지 않으므로
+        작은 영역을 한 번 캡처해 실제 픽셀 크기로 계산
 
         Args:
-            window_name: 윈도우 이름 (부분 일치)
-            save_path: 저장 경로
+            probe: 확인용으로 캡처할 정사각형 크기 (화면 좌표)
 
         Returns:
-            str: 저장된 파일 경로
+            tuple: (scale_x, scale_y)
         """
-        if platform.system() != 'Darwin':
-            # macOS가 아니면 전체 화면 캡처
-            screenshot = pyautogui.screenshot()
-            screenshot.save(save_path)
-            return save_path
-
-        # AppleScript로 윈도우 찾기 및 활성화
-        applescript = f'''
-        tell application "System Events"
-            set targetApp to first application process whose name contains "{window_name}"
-            set frontmost of targetApp to true
-            delay 0.2
-
-            -- 윈도우 위치와 크기 가져오기
-            tell first window of targetApp
-                set {{x, y}} to position
-                set {{w, h}} to size
-            end tell
-
-            return {{x, y, w, h}}
-        end tell
-        '''
-
-        try:
-            # AppleScript 실행
-            result = subprocess.run(
-                ['osascript', '-e', applescript],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
+        if self._capture_scale is None:
+            scale = getattr(self.backend, 'scale', None)
+            if scale is not None:
+                # 재생 백엔드는 배율을 알고 있으므로 프레임을 소모하지 않음
+                self._capture_scale = (float(scale), float(scale))
+                return self._capture_scale
+            image = self.backend.grab((0, 0, probe, probe))
+            self._capture_scale = (round(image.width / probe, 2), round(image.height / probe, 2))
+        return self._capture_scale
+
+    def capture_latency(self):
+        """
+        캡처 백엔드 지연 시간 통계
+
+        Returns:
+            dict: {'backend', 'count', 'last_ms', 'mean_ms', 'max_ms'}
+        """
+        return self.backend.latency_stats()
 
-            if result.returncode != 0:
-                print(f"윈도우 '{window_name}' 찾기 실패, 전체 화면 캡처")
-                screenshot = pyautogui.screenshot()
-                screenshot.save(save_path)
-                return save_path
+    def add_frame_listener(self, callback):
+        """
+        프레임 리스너 등록 (세션 녹화 등)
 
-            # 결과 파싱: "x, y, w, h"
-            coords = result.stdout.strip().split(', ')
-            x, y, w, h = map(int, coords)
+        Args:
+            callback: callback(frame) 형태의 함수
+        """
+        self._frame_listeners.append(callback)
+
+    def flush(self):
+        """백그라운드 저장 대기열 비우기"""
+        self.store.flush()
 
-            print(f"윈도우 '{window_name}' 찾음: ({x}, {y}, {w}x{h})")
+    def persist_frame(self, frame):
+        """
+        persist=False로 캡처한 프레임을 나중에 보관 (안정화 대기에서 최종으로 받아들인 프레임 등)
 
-            # 윈도우 영역만 캡처
-            screenshot = pyautogui.screenshot(region=(x, y, w, h))
-            screenshot.save(save_path)
+        Args:
+            frame: CaptureFrame
+        """
+        self._persist(frame, "fullscreen" if frame.kind != 'region' else "region")
+
+    def _persist(self, frame, prefix):
+        """최근 프레임 링에 보관하고 persist_mode에 따라 디스크 저장"""
+        self.store.add(frame, prefix, persist=(self.persist_mode != 'none'))
+        for callback in self._frame_listeners:
+            try:
+                callback(frame)
+            except Exception as e:
+                print(f"[CAPTURE] 프레임 리스너 오류: {e}")
+
+    def _grab_window(self, window_name):
+        """
+        타겟 윈도우 영역 캡처 (geometry는 캐시, 테두리가 바뀌었을 때만 재조회)
+
+        Args:
+            window_name: 윈도우 이름 (부분 일치)
+
+        Returns:
+            CaptureFrame: 윈도우 영역 프레임 (실패 시 전체 화면)
+        """
+        for _ in range(2):
+            rect = self.window_geometry.get(window_name)
+            if rect is None:
+                if self.window_geometry.provider is not None:
+                    print(f"윈도우 '{window_name}' 찾기 실패, 전체 화면 캡처")
+                return CaptureFrame(self.backend.grab(), logical_size=self.get_screen_size())
+
+            # 창 일부가 화면 밖에 있으면 화면 안쪽만 캡처 (X11 등에서 화면 밖 영역 요청은 오류)
+            x, y, w, h = self._clamp_to_screen(rect)
+            if w <= 0 or h <= 0:
+                print(f"윈도우 '{window_name}'이(가) 화면 밖에 있어 전체 화면 캡처")
+                return CaptureFrame(self.backend.grab(), logical_size=self.get_screen_size())
+            frame = CaptureFrame(
+                self.backend.grab((x, y, w, h)),
+                origin=(x, y),
+                logical_size=(w, h),
+                kind='window'
+            )
+            if self.window_geometry.validate(window_name, frame):
+                return frame
 
-            return save_path
+        # 재조회 직후에도 검증 실패하면 방금 캡처한 프레임 사용
+        return frame
 
-        except Exception as e:
-            print(f"윈도우 캡처 실패: {e}, 전체 화면 캡처")
-            screenshot = pyautogui.screenshot()
-            screenshot.save(save_path)
-            return save_path
+    def _clamp_to_screen(self, rect):
+        """(x, y, w, h)를 화면 영역과 겹치는 부분으로 자름"""
+        screen_w, screen_h = self.get_screen_size()
+        x, y, w, h = (int(v) for v in rect)
+        left, top = max(0, x), max(0, y)
+        right, bottom = min(screen_w, x + w), min(screen_h, y + h)
+        return left, top, right - left, bottom - top
 
 
 if __name__ == "__main__":
@@ -173,3 +297,7 @@ if __name__ == "__main__":
     path = capture.capture_full_screen()
     print(f"Full screen captured: {path}")
 
+    # 메모리 캡처
+    frame = capture.grab_full_screen()
+    print(f"Frame grabbed: {frame}, scale={frame.scale}")
+    capture.flush()
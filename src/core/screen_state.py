@@ -0,0 +1,213 @@
+"""
+MARK: 화면 상태 분류 모듈
+결과 영역을 16x16 밝기 축소 이미지(서명)로 줄여 학습해 둔 상태별 예시와 비교.
+템플릿 매칭 없이 수십 마이크로초 안에 대기/조회 중/결과/결과 없음/경고 상태를 구분
+"""
+
+import json
+import os
+import time
+
+import cv2
+import numpy as np
+
+from .frame import load_gray
+from .pacing import default_pacing_path
+from .stabilizer import wait_until_stable
+
+
+STATES = ('idle', 'searching', 'result', 'no_result', 'warning')
+
+# 이 상태가 보이면 아직 조회가 끝나지 않은 것으로 보고 계속 기다림
+PENDING_STATES = ('idle', 'searching')
+
+
+def default_screen_state_path(base_dir="tmp/screen_states"):
+    """
+    장비별 화면 상태 예시 저장 경로
+
+    Returns:
+        str: tmp/screen_states/<호스트명>_<OS>.json
+    """
+    return default_pacing_path(base_dir)
+
+
+def screen_signature(source, size=(16, 16)):
+    """
+    화면 서명 (축소 밝기 이미지, 0~1 float32 1차원 배열)
+
+    Args:
+        source: CaptureFrame, 이미지 경로 또는 ndarray
+        size: 축소 크기 (width, height)
+
+    Returns:
+        ndarray: 서명
+    """
+    gray = load_gray(source)
+    if gray is None or gray.size == 0:
+        raise ValueError("화면 서명을 만들 이미지가 없습니다.")
+    # INTER_AREA: 픽셀 평균이라 글자 내용보다 배치(줄 수, 색 덩어리)가 남음
+    small = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+    return small.astype(np.float32).ravel() / 255.0
+
+
+def signature_distance(a, b):
+    """두 서명의 평균 밝기 차이 (0~1)"""
+    return float(np.abs(a - b).mean())
+
+
+class ScreenStateClassifier:
+    """서명 최근접 예시 기반 화면 상태 분류기"""
+
+    def __init__(self, app_name='default', threshold=0.05, max_exemplars=12, path=None):
+        """
+        초기화
+
+        Args:
+            app_name: 대상 프로그램 이름 (예시를 프로그램별로 저장)
+            threshold: 이 거리 이내의 예시가 있어야 상태로 인정 (평균 밝기 차이, 0~1)
+            max_exemplars: 상태별 최대 예시 수
+            path: 저장 경로 (None이면 장비별 기본 경로, ''이면 저장 안 함)
+        """
+        if path is None:
+            path = default_screen_state_path()
+        self.path = path or None
+        self.app_name = app_name
+        self.threshold = threshold
+        self.max_exemplars = max(1, int(max_exemplars))
+        self.exemplars = {}  # state -> [signature, ...]
+        self._dirty = False
+        self.stats = {'classified': 0, 'unknown': 0, 'waits': 0, 'wait_seconds': 0.0, 'overruled': 0}
+        self.load()
+
+    def has(self, state):
+        return bool(self.exemplars.get(state))
+
+    def learn(self, state, signature):
+        """
+        상태 예시 추가 (이미 가까운 예시가 있으면 추가하지 않음)
+
+        Returns:
+            bool: 추가 여부
+        """
+        if state not in STATES:
+            raise ValueError(f"알 수 없는 화면 상태입니다: {state} (사용 가능: {', '.join(STATES)})")
+        exemplars = self.exemplars.setdefault(state, [])
+        if any(signature_distance(signature, known) <= self.threshold / 2 for known in exemplars):
+            return False
+        exemplars.append(np.asarray(signature, dtype=np.float32))
+        if len(exemplars) > self.max_exemplars:
+            # 가장 오래된 예시부터 버림 (화면 테마/배치가 바뀐 경우 최근 것 유지)
+            del exemplars[0]
+        self._dirty = True
+        return True
+
+    def classify(self, signature):
+        """
+        가장 가까운 예시의 상태
+
+        Returns:
+            tuple: (상태 또는 None(threshold 안에 예시 없음), 거리)
+        """
+        best_state, best_distance = None, float('inf')
+        # 분석 스레드에서 learn이 호출될 수 있으므로 복사본으로 순회
+        for state, exemplars in list(self.exemplars.items()):
+            for known in list(exemplars):
+                distance = signature_distance(signature, known)
+                if distance < best_distance:
+                    best_state, best_distance = state, distance
+        self.stats['classified'] += 1
+        if best_distance > self.threshold:
+            self.stats['unknown'] += 1
+            return None, best_distance
+        return best_state, best_distance
+
+    def wait_for_result(self, grab, baseline=None, unchanged_after=0.1, timeout=3.0,
+                        interval=0.02, min_changed_pixels=20):
+        """
+        결과 영역이 다 그려지고 조회 중이 아닌 상태가 될 때까지 대기 (wait_until_stable + 상태 분류)
+
+        Args:
+            grab: grab() -> CaptureFrame (결과 영역 캡처)
+            baseline: 입력 전 결과 영역 grayscale 이미지 (None이면 변화 확인 생략)
+            unchanged_after: 화면이 그대로여도 분류할 시간 (초, 기존 고정 대기 시간)
+            timeout: 최대 대기 시간 (초)
+            interval: 캡처 간격 (초)
+            min_changed_pixels: 화면이 바뀌었다고 볼 최소 변경 픽셀 수
+
+        Returns:
+            dict: wait_until_stable 결과 + {'signature', 'state', 'distance'}
+        """
+        classified = {}
+
+        def not_pending(gray):
+            signature = screen_signature(gray)
+            state, distance = self.classify(signature)
+            classified.update(signature=signature, state=state, distance=distance)
+            return state not in PENDING_STATES
+
+        waited = wait_until_stable(
+            grab,
+            baseline=baseline,
+            unchanged_after=unchanged_after,
+            timeout=timeout,
+            interval=interval,
+            min_changed_pixels=min_changed_pixels,
+            accept=not_pending
+        )
+        if waited['timed_out']:
+            # 시간 초과로 끝났으면 마지막 화면으로 분류
+            not_pending(waited['gray'])
+        waited.update(classified)
+        self.stats['waits'] += 1
+        self.stats['wait_seconds'] += waited['elapsed']
+        return waited
+
+    def load(self):
+        """저장된 예시 불러오기"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[STATE] 화면 상태 예시 로드 실패: {e}")
+            return
+
+        entry = data.get(self.app_name) or {}
+        self.exemplars = {
+            state: [np.asarray(values, dtype=np.float32) for values in signatures]
+            for state, signatures in entry.get('exemplars', {}).items()
+            if state in STATES
+        }
+        if self.exemplars:
+            counts = ', '.join(f"{state} {len(values)}" for state, values in self.exemplars.items())
+            print(f"[STATE] '{self.app_name}' 화면 상태 예시 사용: {counts}")
+
+    def save(self):
+        """프로그램별 예시 저장 (변경이 있을 때만)"""
+        if not self.path or not self._dirty:
+            return
+        data = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+
+        data[self.app_name] = {
+            'exemplars': {
+                state: [[round(float(v), 4) for v in signature] for signature in signatures]
+                for state, signatures in self.exemplars.items()
+            },
+            'updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+        self._dirty = False
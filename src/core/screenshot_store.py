@@ -0,0 +1,264 @@
+"""
+MARK: 스크린샷 보관 모듈
+최근 프레임 링 버퍼 + 충돌 없는 파일명 + 디스크 용량 제한(오래된 파일부터 삭제)
+"""
+
+import itertools
+import os
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+
+from PIL import features
+
+
+class FrameWriter:
+    """캡처 프레임을 백그라운드 스레드에서 디스크에 저장"""
+
+    def __init__(self, write_fn, max_pending=16):
+        """
+        초기화
+
+        Args:
+            write_fn: 실제 저장 함수 (frame, save_path)
+            max_pending: 저장 대기열 최대 길이 (가득 차면 캡처 쪽이 대기)
+        """
+        self._write_fn = write_fn
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="FrameWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, frame, save_path):
+        """프레임 저장 예약"""
+        self._queue.put((frame, save_path))
+
+    def flush(self):
+        """대기 중인 저장 작업이 모두 끝날 때까지 대기"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            frame, save_path = self._queue.get()
+            try:
+                self._write_fn(frame, save_path)
+            except Exception as e:
+                print(f"[CAPTURE] 백그라운드 저장 실패: {save_path} ({e})")
+            finally:
+                self._queue.task_done()
+
+
+class ScreenshotStore:
+    """스크린샷 보관소 (메모리 링 버퍼 + 디스크 용량 제한)"""
+
+    FORMATS = ('png', 'webp')
+    IMAGE_EXTENSIONS = ('.png', '.webp')
+
+    def __init__(
+        self,
+        output_dir="tmp/screenshots",
+        ring_size=20,
+        ring_max_bytes=64 * 1024 * 1024,
+        max_disk_bytes=512 * 1024 * 1024,
+        max_files=None,
+        image_format='png',
+        png_compress_level=1,
+        background=True,
+    ):
+        """
+        초기화
+
+        Args:
+            output_dir: 저장 디렉토리
+            ring_size: 메모리에 유지할 최근 프레임 수
+            ring_max_bytes: 링 버퍼 최대 메모리 (바이트, 4K/Retina 전체 화면은 한 장에 수십 MB)
+            max_disk_bytes: 디렉토리 최대 사용량 (바이트, None이면 제한 없음)
+            max_files: 디렉토리 최대 파일 수 (None이면 제한 없음)
+            image_format: 'png' 또는 'webp' (무손실)
+            png_compress_level: PNG 압축 레벨 (0: 최고 속도 ~ 9: 최소 용량)
+            background: 디스크 저장을 백그라운드 스레드에서 수행할지 여부
+        """
+        if image_format not in self.FORMATS:
+            raise ValueError(f"지원하지 않는 이미지 형식입니다: {image_format}")
+        if image_format == 'webp' and not features.check('webp'):
+            print("[STORE] 현재 Pillow에서 WebP를 지원하지 않아 PNG로 저장합니다.")
+            image_format = 'png'
+
+        self.output_dir = output_dir
+        self.ring = deque()
+        self.ring_size = max(1, int(ring_size))
+        self.ring_max_bytes = ring_max_bytes
+        self._ring_bytes = 0
+        self._ring_lock = threading.Lock()
+        self.max_disk_bytes = max_disk_bytes
+        self.max_files = max_files
+        self.image_format = image_format
+        self.png_compress_level = max(0, min(9, int(png_compress_level)))
+
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+        self._files = deque()  # (path, size) 오래된 순
+        self._disk_bytes = 0
+        self.evicted_files = 0
+
+        os.makedirs(output_dir, exist_ok=True)
+        self._scan_existing()
+
+        self._writer = FrameWriter(self._write) if background else None
+
+    @property
+    def extension(self):
+        return '.' + self.image_format
+
+    def make_path(self, prefix, extension=None):
+        """
+        충돌 없는 저장 경로 생성 (밀리초 타임스탬프 + 단조 증가 일련번호)
+
+        Args:
+            prefix: 파일명 접두사 ('fullscreen', 'region' 등)
+            extension: 확장자 (None이면 현재 이미지 형식)
+
+        Returns:
+            str: 저장 경로
+        """
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S") + f"_{now.microsecond // 1000:03d}"
+        sequence = next(self._sequence)
+        ext = extension or self.extension
+        return os.path.join(self.output_dir, f"{prefix}_{timestamp}_{sequence:06d}{ext}")
+
+    def add(self, frame, prefix, persist=True):
+        """
+        프레임 보관 (링 버퍼에 추가하고 필요하면 디스크에 저장)
+
+        Args:
+            frame: CaptureFrame
+            prefix: 파일명 접두사
+            persist: 디스크 저장 여부
+
+        Returns:
+            str or None: 저장(예정) 경로
+        """
+        if not persist:
+            self._remember(frame)
+            return None
+
+        save_path = self.make_path(prefix)
+        frame.path = save_path
+        self._remember(frame)
+        if self._writer:
+            self._writer.submit(frame, save_path)
+        else:
+            self._write(frame, save_path)
+        return save_path
+
+    def _remember(self, frame):
+        """
+        링 버퍼에 추가 (변환 캐시 없는 복사본만 보관, 개수/메모리 한도를 넘으면 오래된 것부터 버림)
+
+        비전 파이프라인이 원본 프레임에 만든 BGR/gray 배열까지 링 버퍼가 붙잡지 않도록 함
+        """
+        slim = frame.detached()
+        with self._ring_lock:
+            self.ring.append(slim)
+            self._ring_bytes += slim.nbytes
+            while len(self.ring) > 1 and (
+                len(self.ring) > self.ring_size
+                or (self.ring_max_bytes is not None and self._ring_bytes > self.ring_max_bytes)
+            ):
+                self._ring_bytes -= self.ring.popleft().nbytes
+
+    def register_file(self, path):
+        """외부에서 직접 저장한 파일을 용량 관리 대상으로 등록"""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        with self._lock:
+            self._files.append((path, size))
+            self._disk_bytes += size
+        self._evict()
+
+    def recent(self, count=None):
+        """
+        최근 프레임 목록 (오래된 순)
+
+        Args:
+            count: 가져올 개수 (None이면 전체)
+
+        Returns:
+            list: CaptureFrame 리스트
+        """
+        with self._ring_lock:
+            frames = list(self.ring)
+        if count is not None:
+            frames = frames[-count:]
+        return frames
+
+    def latest(self):
+        """가장 최근 프레임 (없으면 None)"""
+        return self.ring[-1] if self.ring else None
+
+    def disk_usage(self):
+        """
+        디스크 사용량
+
+        Returns:
+            dict: {'files': 파일 수, 'bytes': 사용량, 'evicted': 삭제한 파일 수}
+        """
+        with self._lock:
+            return {
+                'files': len(self._files),
+                'bytes': self._disk_bytes,
+                'evicted': self.evicted_files,
+            }
+
+    def flush(self):
+        """백그라운드 저장 대기열 비우기"""
+        if self._writer:
+            self._writer.flush()
+
+    def save_image(self, image, save_path):
+        """설정된 형식/압축 옵션으로 PIL 이미지 저장"""
+        if save_path.lower().endswith('.webp'):
+            image.save(save_path, format='WEBP', lossless=True, method=4)
+        else:
+            image.save(save_path, format='PNG', compress_level=self.png_compress_level)
+
+    def _write(self, frame, save_path):
+        self.save_image(frame.image, save_path)
+        self.register_file(save_path)
+
+    def _evict(self):
+        """용량/파일 수 한도를 넘으면 오래된 파일부터 삭제"""
+        while True:
+            with self._lock:
+                over_bytes = self.max_disk_bytes is not None and self._disk_bytes > self.max_disk_bytes
+                over_files = self.max_files is not None and len(self._files) > self.max_files
+                if not (over_bytes or over_files) or len(self._files) <= 1:
+                    return
+                path, size = self._files.popleft()
+                self._disk_bytes -= size
+                self.evicted_files += 1
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _scan_existing(self):
+        """이전 실행에서 남은 파일을 오래된 순으로 용량 관리 대상에 포함"""
+        entries = []
+        for name in os.listdir(self.output_dir):
+            if not name.lower().endswith(self.IMAGE_EXTENSIONS):
+                continue
+            path = os.path.join(self.output_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path, stat.st_size))
+
+        for _, path, size in sorted(entries):
+            self._files.append((path, size))
+            self._disk_bytes += size
+        self._evict()
@@ -0,0 +1,467 @@
+"""
+MARK: 세션 녹화/재생 모듈
+캡처 프레임과 GUI 동작을 하나의 아카이브(zip)에 기록하고, 디스플레이 없이 다시 재생
+
+아카이브 구성:
+    session.json          메타데이터 (생성 시각, 키프레임 간격, 화면 크기)
+    events.jsonl          시간순 이벤트 (record / action / frame, frame에는 캡처 단계 이름 포함)
+    frames/000001.npz     키프레임(전체 픽셀) 또는 델타(XOR 변경 영역만)
+"""
+
+import contextlib
+import io
+import json
+import os
+import threading
+import time
+import zipfile
+from collections import deque
+
+import numpy as np
+from PIL import Image
+
+from .capture_backends import CaptureBackend
+from .frame import CaptureFrame
+
+
+class SessionRecorder:
+    """ScreenCapture/GUIAutomation 훅으로 세션을 녹화"""
+
+    def __init__(self, archive_path, keyframe_interval=30):
+        """
+        초기화
+
+        Args:
+            archive_path: 아카이브 저장 경로 (.zip)
+            keyframe_interval: 키프레임 간격 (이 사이의 프레임은 XOR 델타로 저장)
+        """
+        directory = os.path.dirname(archive_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.archive_path = archive_path
+        self.keyframe_interval = max(1, int(keyframe_interval))
+        self._zip = zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_STORED)
+        self._lock = threading.Lock()
+        self._events = []
+        self._start = time.perf_counter()
+        self._frame_index = 0
+        self._previous = None
+        self._screen_size = None
+        self.stats = {'frames': 0, 'keyframes': 0, 'deltas': 0, 'unchanged': 0, 'actions': 0, 'records': 0, 'bytes': 0}
+
+    def attach(self, capture=None, automation=None):
+        """
+        녹화 대상 연결
+
+        Args:
+            capture: ScreenCapture (프레임 기록)
+            automation: GUIAutomation (동작 기록)
+        """
+        if capture is not None:
+            capture.add_frame_listener(self.record_frame)
+            try:
+                self._screen_size = list(capture.get_screen_size())
+            except Exception:
+                self._screen_size = None
+        if automation is not None:
+            automation.add_action_listener(self.record_action)
+
+    def record_action(self, action, params):
+        """GUI 동작 기록"""
+        with self._lock:
+            if self._zip is None:
+                return
+            self._events.append({
+                't': round(time.perf_counter() - self._start, 6),
+                'type': 'action',
+                'action': action,
+                'params': params,
+            })
+            self.stats['actions'] += 1
+
+    def record_input(self, resident_number):
+        """
+        한 건 처리 시작 기록 (재생할 입력 목록은 이 이벤트로만 만듦)
+
+        type_text/paste_text 동작에는 입력 전략 측정, 혼합 입력의 나눠진 조각, 확인 실패 후 재입력이
+        섞여 있으므로 입력값을 따로 남김
+
+        Args:
+            resident_number: 이번 건의 주민등록번호
+        """
+        with self._lock:
+            if self._zip is None:
+                return
+            self._events.append({
+                't': round(time.perf_counter() - self._start, 6),
+                'type': 'record',
+                'resident_number': resident_number,
+            })
+            self.stats['records'] += 1
+
+    def record_frame(self, frame):
+        """캡처 프레임 기록 (키프레임 또는 XOR 델타)"""
+        pixels = np.asarray(frame.image)
+        with self._lock:
+            if self._zip is None:
+                return
+            self._frame_index += 1
+            index = self._frame_index
+            event = {
+                't': round(time.perf_counter() - self._start, 6),
+                'type': 'frame',
+                'index': index,
+                'kind': frame.kind,
+                'step': frame.step,
+                'mode': frame.image.mode,
+                'origin': list(frame.origin),
+                'logical_size': list(frame.logical_size),
+            }
+
+            previous = self._previous
+            use_keyframe = (
+                previous is None
+                or previous.shape != pixels.shape
+                or (index - 1) % self.keyframe_interval == 0
+            )
+
+            if use_keyframe:
+                event['encoding'] = 'key'
+                self._write_array(index, pixels)
+                self.stats['keyframes'] += 1
+            else:
+                diff = np.bitwise_xor(pixels, previous)
+                changed = diff.any(axis=2) if diff.ndim == 3 else diff.astype(bool)
+                rows = np.flatnonzero(changed.any(axis=1))
+                if rows.size == 0:
+                    event['encoding'] = 'same'
+                    self.stats['unchanged'] += 1
+                else:
+                    cols = np.flatnonzero(changed.any(axis=0))
+                    top, bottom = int(rows[0]), int(rows[-1]) + 1
+                    left, right = int(cols[0]), int(cols[-1]) + 1
+                    event['encoding'] = 'delta'
+                    event['rect'] = [left, top, right - left, bottom - top]
+                    self._write_array(index, diff[top:bottom, left:right])
+                    self.stats['deltas'] += 1
+
+            self._previous = pixels
+            self._events.append(event)
+            self.stats['frames'] += 1
+
+    def close(self):
+        """이벤트/메타데이터를 기록하고 아카이브 닫기"""
+        with self._lock:
+            if self._zip is None:
+                return
+            meta = {
+                'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'keyframe_interval': self.keyframe_interval,
+                'screen_size': self._screen_size,
+                'stats': self.stats,
+            }
+            self._zip.writestr('session.json', json.dumps(meta, ensure_ascii=False, indent=2))
+            lines = '\n'.join(json.dumps(event, ensure_ascii=False) for event in self._events)
+            self._zip.writestr('events.jsonl', lines)
+            self._zip.close()
+            self._zip = None
+
+        print(
+            f"[RECORD] 세션 저장: {self.archive_path} "
+            f"(프레임 {self.stats['frames']}개: 키 {self.stats['keyframes']}, "
+            f"델타 {self.stats['deltas']}, 변화 없음 {self.stats['unchanged']} / "
+            f"동작 {self.stats['actions']}개, {self.stats['bytes'] / 1024:.1f}KB)"
+        )
+
+    def _write_array(self, index, array):
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, data=array)
+        payload = buffer.getvalue()
+        self._zip.writestr(f'frames/{index:06d}.npz', payload)
+        self.stats['bytes'] += len(payload)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class SessionReplayer:
+    """녹화된 세션 아카이브 재생기"""
+
+    def __init__(self, archive_path):
+        """
+        초기화
+
+        Args:
+            archive_path: SessionRecorder가 만든 아카이브 경로
+        """
+        self.archive_path = archive_path
+        with zipfile.ZipFile(archive_path, 'r') as archive:
+            self.meta = json.loads(archive.read('session.json'))
+            raw_events = archive.read('events.jsonl').decode('utf-8')
+        self.events = [json.loads(line) for line in raw_events.splitlines() if line.strip()]
+
+    @property
+    def screen_size(self):
+        size = self.meta.get('screen_size')
+        if size:
+            return tuple(size)
+        for event in self.events:
+            if event['type'] == 'frame' and event['kind'] == 'fullscreen':
+                return tuple(event['logical_size'])
+        return None
+
+    def actions(self):
+        """녹화된 동작 이벤트 목록"""
+        return [event for event in self.events if event['type'] == 'action']
+
+    def resident_numbers(self):
+        """녹화 당시 처리한 주민등록번호 (건마다 한 번, 처리 순서)"""
+        return [event['resident_number'] for event in self.events if event['type'] == 'record']
+
+    def frames(self):
+        """
+        녹화된 프레임을 순서대로 복원
+
+        Yields:
+            CaptureFrame: 복원된 프레임 (origin/logical_size 메타데이터 포함)
+        """
+        previous = None
+        with zipfile.ZipFile(self.archive_path, 'r') as archive:
+            for event in self.events:
+                if event['type'] != 'frame':
+                    continue
+
+                encoding = event['encoding']
+                if encoding == 'key':
+                    pixels = self._read_array(archive, event['index'])
+                elif encoding == 'same':
+                    pixels = previous
+                else:
+                    left, top, width, height = event['rect']
+                    pixels = previous.copy()
+                    pixels[top:top + height, left:left + width] ^= self._read_array(archive, event['index'])
+
+                previous = pixels
+                image = Image.fromarray(pixels)
+                frame = CaptureFrame(
+                    image,
+                    origin=event['origin'],
+                    logical_size=event['logical_size'],
+                    kind=event['kind']
+                )
+                frame.step = event.get('step')
+                yield frame
+
+    def capture_backend(self):
+        """녹화 프레임을 순서대로 돌려주는 캡처 백엔드"""
+        return SessionReplayBackend(self)
+
+    def build_service(self, **kwargs):
+        """
+        재생 프레임으로 동작하는 SearchAutomationService 생성 (디스플레이 불필요)
+
+        Args:
+            **kwargs: SearchAutomationService 추가 인자
+
+        Returns:
+            SearchAutomationService: 재생용 서비스
+        """
+        from ..services.search_service import SearchAutomationService
+        from .screen_capture import ScreenCapture
+
+        capture = ScreenCapture(
+            output_dir=kwargs.pop('output_dir', 'tmp/replay'),
+            persist_mode='none',
+            backend=self.capture_backend()
+        )
+        # 저장된 UI 좌표 확인용 캡처가 재생 프레임을 소모하지 않도록 영구 캐시는 끔
+        kwargs.setdefault('persistent_cache', False)
+        # 녹화에는 안정화 대기에서 최종으로 받아들인 결과 프레임만 남으므로 재생은 한 번만 캡처
+        kwargs.setdefault('stabilize', False)
+        # 상태 표시줄 캡처는 꺼도 됨 (재생 백엔드가 요청하지 않은 영역의 녹화 프레임은 건너뜀)
+        kwargs.setdefault('status_reader', False)
+        return SearchAutomationService(
+            automation=ReplayAutomation(),
+            capture=capture,
+            **kwargs
+        )
+
+    @staticmethod
+    def _read_array(archive, index):
+        with archive.open(f'frames/{index:06d}.npz') as handle:
+            with np.load(io.BytesIO(handle.read())) as data:
+                return data['data']
+
+
+class SessionReplayBackend(CaptureBackend):
+    """
+    녹화된 프레임을 요청 순서대로 돌려주는 캡처 백엔드
+
+    재생 설정이 녹화 때와 달라 일부 캡처(상태 표시줄 등)를 요청하지 않으면
+    요청 영역과 다른 녹화 프레임은 건너뛰어 이후 결과 프레임이 밀리지 않게 함
+    """
+
+    name = 'session'
+
+    def __init__(self, replayer, lookahead=16):
+        """
+        초기화
+
+        Args:
+            replayer: SessionReplayer
+            lookahead: 요청 영역과 같은 프레임을 찾을 때 앞서 볼 최대 프레임 수
+        """
+        super().__init__()
+        self._frames = replayer.frames()
+        self._size = replayer.screen_size
+        self._last = None
+        self._pending = deque()
+        self.lookahead = max(1, int(lookahead))
+        self.skipped = {}  # 단계 이름 -> 건너뛴 프레임 수
+
+    def screen_size(self):
+        if self._size is None:
+            return self._last.logical_size if self._last else (0, 0)
+        return self._size
+
+    def _grab(self, region):
+        frame = self._next_frame(region)
+        if frame is None:
+            if self._last is None:
+                raise RuntimeError("재생할 프레임이 없습니다.")
+            print("[REPLAY] 녹화된 프레임이 끝나 마지막 프레임을 재사용합니다.")
+            frame = self._last
+
+        if region is not None and tuple(frame.logical_size) != tuple(region[2:]):
+            print(
+                f"[REPLAY] 요청 영역 {tuple(region)}과 녹화 프레임 "
+                f"{frame.origin}/{frame.logical_size}이 다릅니다."
+            )
+        self._last = frame
+        return frame.image
+
+    def _next_frame(self, region):
+        """요청 영역과 같은 다음 녹화 프레임 (lookahead 안에 없으면 바로 다음 프레임)"""
+        for position in range(self.lookahead):
+            if position == len(self._pending):
+                try:
+                    self._pending.append(next(self._frames))
+                except StopIteration:
+                    break
+            if self._matches(self._pending[position], region):
+                for _ in range(position):
+                    skipped = self._pending.popleft()
+                    if not self.skipped:
+                        print("[REPLAY] 요청하지 않은 녹화 프레임을 건너뜁니다. (녹화/재생 설정 차이)")
+                    self.skipped[skipped.step] = self.skipped.get(skipped.step, 0) + 1
+                return self._pending.popleft()
+        return self._pending.popleft() if self._pending else None
+
+    @staticmethod
+    def _matches(frame, region):
+        if region is None:
+            return frame.kind == 'fullscreen'
+        return tuple(frame.origin) == tuple(region[:2]) and tuple(frame.logical_size) == tuple(region[2:])
+
+
+class ReplayAutomation:
+    """재생 모드용 GUI 자동화 (실제 입력 없이 동작만 기록)"""
+
+    def __init__(self):
+        self.delay = 0
+        self.pacer = None
+        self.actions = []
+        self._action_listeners = []
+        # 입력 필드 상태 흉내 (입력값 확인용)
+        self.field_text = ''
+        self._field_selected = False
+        self.modifier_stats = {
+            'release_events': 0,
+            'release_seconds': 0.0,
+            'full_resets': 0,
+            'stuck_detected': 0,
+        }
+
+    def add_action_listener(self, callback):
+        self._action_listeners.append(callback)
+
+    def _record(self, action, **params):
+        self.actions.append((action, params))
+        for callback in self._action_listeners:
+            callback(action, params)
+
+    def click(self, x, y, clicks=1, button='left', delay=None):
+        self._record('click', x=x, y=y, clicks=clicks, button=button)
+
+    def double_click(self, x, y, delay=None):
+        self.click(x, y, clicks=2, delay=delay)
+
+    def right_click(self, x, y, delay=None):
+        self.click(x, y, button='right', delay=delay)
+
+    def move_to(self, x, y, duration=0.5):
+        self._record('move_to', x=x, y=y, duration=duration)
+
+    def type_text(self, text, interval=0.05, delay=None):
+        self._record('type_text', text=text, interval=interval)
+        self._insert(text)
+
+    def paste_text(self, text, delay=None):
+        self._record('paste_text', text=text)
+        self._insert(text)
+
+    def copy_selection(self, timeout=0.3):
+        self._record('copy_selection')
+        self._field_selected = True
+        return self.field_text
+
+    def _insert(self, text):
+        if self._field_selected:
+            self.field_text = ''
+            self._field_selected = False
+        self.field_text += text
+
+    def press_key(self, key, delay=None):
+        self._record('press_key', key=key)
+        if key == 'backspace':
+            self.field_text = '' if self._field_selected else self.field_text[:-1]
+            self._field_selected = False
+
+    def key_up(self, key):
+        self._record('key_up', key=key)
+
+    def hotkey(self, *keys, delay=None):
+        self._record('hotkey', keys=list(keys))
+        if keys and keys[-1] == 'a':
+            self._field_selected = True
+
+    def release_modifiers(self):
+        return 0
+
+    def reset_modifiers(self):
+        return 0
+
+    def ensure_modifiers_released(self):
+        return 0
+
+    def scroll(self, clicks, x=None, y=None):
+        self._record('scroll', clicks=clicks, x=x, y=y)
+
+    def wait(self, seconds):
+        pass
+
+    def pause(self, action, default):
+        pass
+
+    def report_pacing(self, actions, success):
+        pass
+
+    def no_global_pause(self):
+        return contextlib.nullcontext()
+
+    def get_mouse_position(self):
+        return 0, 0
@@ -0,0 +1,132 @@
+"""
+MARK: 화면 안정화 대기 모듈
+고정 시간 대기 대신 작은 영역(결과 영역, 상태 표시줄)을 짧은 간격으로 캡처해
+화면이 바뀐 뒤 더 이상 변하지 않으면 바로 다음 단계로 진행
+"""
+
+import time
+
+import cv2
+
+from .frame import load_gray
+
+
+def frames_differ(gray, other, min_changed_pixels=20, tolerance=32):
+    """
+    두 grayscale 이미지가 다른 화면인지
+
+    Args:
+        gray, other: grayscale 이미지 (other가 None이면 다른 화면으로 봄)
+        min_changed_pixels: 다른 화면으로 볼 최소 변경 픽셀 수 (커서 깜빡임 등 무시)
+        tolerance: 변경으로 볼 밝기 차이 (안티앨리어싱/압축 노이즈 무시)
+
+    Returns:
+        bool: 다르면 True
+    """
+    if other is None or gray.shape != other.shape:
+        return True
+    _, changed = cv2.threshold(cv2.absdiff(gray, other), tolerance, 255, cv2.THRESH_BINARY)
+    return cv2.countNonZero(changed) >= min_changed_pixels
+
+
+def wait_until_stable(grab, baseline=None, unchanged_after=None, timeout=3.0, interval=0.02,
+                      stable_samples=2, min_changed_pixels=20, accept=None):
+    """
+    영역이 바뀐 뒤 연속 캡처가 같아질 때까지 대기
+
+    baseline과 한 번이라도 달라진 뒤 stable_samples번 연속 같은 화면이면 완료.
+    같은 화면이 다시 그려지는 경우(연속 '결과 없음' 등)를 위해 unchanged_after가 지나면
+    바뀌지 않은 화면도 안정된 것으로 인정
+
+    Args:
+        grab: grab() -> CaptureFrame (대상 영역 캡처)
+        baseline: 동작 전 grayscale 이미지 (None이면 변화 확인 없이 안정만 확인)
+        unchanged_after: 바뀌지 않아도 완료로 볼 시간 (초, None이면 timeout까지 변화를 기다림)
+        timeout: 최대 대기 시간 (초)
+        interval: 캡처 간격 (초)
+        stable_samples: 같아야 하는 연속 캡처 수
+        min_changed_pixels: 화면이 바뀌었다고 볼 최소 변경 픽셀 수
+        accept: accept(gray) -> bool 안정된 화면을 받아들일지 (False면 계속 대기, 예: 조회 중 화면)
+
+    Returns:
+        dict: {'frame', 'gray', 'elapsed', 'samples', 'changed', 'timed_out'}
+    """
+    start = time.perf_counter()
+    changed = baseline is None
+    previous = None
+    same = 0
+    samples = 0
+    while True:
+        frame = grab()
+        gray = load_gray(frame)
+        samples += 1
+        elapsed = time.perf_counter() - start
+        timed_out = elapsed >= timeout
+
+        if not changed and frames_differ(gray, baseline, min_changed_pixels):
+            changed = True
+        if previous is not None and not frames_differ(gray, previous, min_changed_pixels):
+            same += 1
+        else:
+            same = 0
+
+        settled = same + 1 >= stable_samples and (
+            changed or (unchanged_after is not None and elapsed >= unchanged_after)
+        )
+        if timed_out or (settled and (accept is None or accept(gray))):
+            return {
+                'frame': frame,
+                'gray': gray,
+                'elapsed': elapsed,
+                'samples': samples,
+                'changed': changed,
+                'timed_out': timed_out,
+            }
+        previous = gray
+        time.sleep(interval)
+
+
+class WaitStats:
+    """완료 대기 시간 측정 기록 (대기 종류별)"""
+
+    def __init__(self):
+        self.waits = {}  # label -> {'count', 'seconds', 'max', 'timeouts', 'unchanged'}
+
+    def record(self, label, waited):
+        """
+        대기 결과 기록
+
+        Args:
+            label: 대기 종류 ('result', 'between_records' 등)
+            waited: wait_until_stable 결과
+        """
+        entry = self.waits.setdefault(
+            label, {'count': 0, 'seconds': 0.0, 'max': 0.0, 'timeouts': 0, 'unchanged': 0}
+        )
+        entry['count'] += 1
+        entry['seconds'] += waited['elapsed']
+        entry['max'] = max(entry['max'], waited['elapsed'])
+        if waited['timed_out']:
+            entry['timeouts'] += 1
+        elif not waited['changed']:
+            entry['unchanged'] += 1
+
+    def summary(self):
+        """대기 종류별 {'count', 'average', 'max', 'timeouts', 'unchanged'}"""
+        return {
+            label: {
+                'count': entry['count'],
+                'average': entry['seconds'] / entry['count'],
+                'max': entry['max'],
+                'timeouts': entry['timeouts'],
+                'unchanged': entry['unchanged'],
+            }
+            for label, entry in self.waits.items()
+        }
+
+    def print_summary(self):
+        for label, values in self.summary().items():
+            print(
+                f"[WAIT] {label}: 평균 {values['average'] * 1000:.0f}ms, 최대 {values['max'] * 1000:.0f}ms "
+                f"({values['count']}회, 변화 없음 {values['unchanged']}, 시간 초과 {values['timeouts']})"
+            )
@@ -0,0 +1,387 @@
+"""
+MARK: 텍스트 입력 전략 모듈
+타이핑/붙여넣기/혼합 방식을 대상 프로그램별로 한 번 측정해 가장 빠르고 안정적인 방식을 고르고,
+입력값을 클립보드 왕복 또는 필드 픽셀 비교로 확인해 불일치하면 다른 방식으로 다시 입력
+"""
+
+import json
+import os
+import platform
+import time
+
+import numpy as np
+
+from .pacing import default_pacing_path
+
+
+STRATEGIES = ('type', 'paste', 'hybrid')
+# 마스킹된 입력 필드가 복사해 주는 가림 문자
+MASK_CHARACTERS = '*●•'
+
+
+class TextEntryError(RuntimeError):
+    """모든 입력 방식으로 입력값 확인에 실패"""
+
+
+def default_text_entry_path(base_dir="tmp/text_entry"):
+    """
+    장비별 입력 전략 저장 경로
+
+    Returns:
+        str: tmp/text_entry/<호스트명>_<OS>.json
+    """
+    return default_pacing_path(base_dir)
+
+
+class PixelFieldVerifier:
+    """
+    입력 필드 픽셀 비교 확인기 (OCR 없음)
+
+    빈 필드 이미지와 비교해 글자가 차지한 폭을 구하고,
+    클립보드로 확인된 입력에서 학습한 글자당 폭과 맞는지 본다.
+    """
+
+    def __init__(self, reader, threshold=40, tolerance=0.35):
+        """
+        Args:
+            reader: reader() -> 입력 필드 영역 grayscale ndarray
+            threshold: 빈 필드 대비 밝기 차이 기준 (0~255)
+            tolerance: 예상 폭 대비 허용 오차 비율
+        """
+        self.reader = reader
+        self.threshold = threshold
+        self.tolerance = tolerance
+        self.baseline = None
+        self.char_width = None
+        self.last_width = None
+        self._samples = []
+
+    def capture_baseline(self):
+        """빈 필드 이미지 저장 (필드를 비운 직후 호출)"""
+        self.baseline = np.asarray(self.reader(), dtype=np.int16)
+
+    def ink_width(self, gray=None):
+        """빈 필드와 달라진 열의 폭 (픽셀)"""
+        if self.baseline is None:
+            return None
+        if gray is None:
+            gray = self.reader()
+        gray = np.asarray(gray, dtype=np.int16)
+        if gray.shape != self.baseline.shape:
+            return None
+        changed = (np.abs(gray - self.baseline) > self.threshold).any(axis=0)
+        columns = np.flatnonzero(changed)
+        if columns.size == 0:
+            return 0
+        return int(columns[-1] - columns[0] + 1)
+
+    def learn(self, text):
+        """확인된 입력으로 글자당 폭 학습 (직전 check에서 잰 폭 사용)"""
+        width = self.last_width
+        if not text or not width:
+            return
+        self._samples.append(width / len(text))
+        self._samples = self._samples[-20:]
+        self.char_width = float(np.median(self._samples))
+
+    def check(self, text):
+        """
+        현재 필드 폭이 text 길이와 맞는지 확인
+
+        Returns:
+            bool or None: 판단할 수 없으면 None (빈 필드 이미지/글자 폭 미학습)
+        """
+        width = self.ink_width()
+        self.last_width = width
+        if width is None:
+            return None
+        if not text:
+            return width == 0
+        if self.char_width is None:
+            return None
+        expected = self.char_width * len(text)
+        return abs(width - expected) <= expected * self.tolerance
+
+
+class TextEntryEngine:
+    """텍스트 입력 전략 선택/확인/대체 엔진"""
+
+    def __init__(
+        self,
+        automation,
+        app_name='default',
+        strategy='auto',
+        verify='clipboard',
+        verify_every=10,
+        field_reader=None,
+        normalize=None,
+        hybrid_tail=1,
+        type_interval=0.01,
+        settle=0.05,
+        benchmark_rounds=2,
+        path=None,
+    ):
+        """
+        초기화
+
+        Args:
+            automation: GUIAutomation 호환 객체 (copy_selection 필요)
+            app_name: 대상 프로그램 이름 (전략을 프로그램별로 저장)
+            strategy: 'auto'(측정 후 선택), 'type', 'paste', 'hybrid'
+            verify: 'clipboard', 'pixel', 'none'
+            verify_every: N건마다 한 번 확인 (불일치가 나온 뒤에는 매번 확인, 1이면 매 건 확인)
+            field_reader: field_reader() -> 입력 필드 grayscale ndarray ('pixel' 확인용)
+            normalize: normalize(text) -> 비교용 문자열 (None이면 앞뒤 공백만 제거,
+                필드가 '-' 등을 자동으로 넣는 경우 숫자만 비교하도록 지정)
+            hybrid_tail: 혼합 방식에서 붙여넣은 뒤 타이핑할 끝 글자 수
+            type_interval: 타이핑 글자 간 간격 (초)
+            settle: 입력 후 확인 전 대기 (초)
+            benchmark_rounds: 전략별 측정 횟수
+            path: 저장 경로 (None이면 장비별 기본 경로, False면 저장 안 함)
+        """
+        if strategy != 'auto' and strategy not in STRATEGIES:
+            raise ValueError(f"지원하지 않는 입력 전략입니다: {strategy}")
+        if verify not in ('clipboard', 'pixel', 'none'):
+            raise ValueError(f"지원하지 않는 확인 방식입니다: {verify}")
+        if verify == 'pixel' and field_reader is None:
+            raise ValueError("'pixel' 확인에는 field_reader가 필요합니다.")
+
+        if path is None:
+            path = default_text_entry_path()
+        self.path = path or None
+        self.automation = automation
+        self.app_name = app_name
+        self.verify = verify
+        self.verify_every = max(1, int(verify_every))
+        self.hybrid_tail = max(1, int(hybrid_tail))
+        self.type_interval = type_interval
+        self.settle = settle
+        self.benchmark_rounds = max(1, int(benchmark_rounds))
+        self.pixel = PixelFieldVerifier(field_reader) if field_reader is not None else None
+        self.normalize = normalize or str.strip
+
+        self.fixed_strategy = None if strategy == 'auto' else strategy
+        self.strategy = self.fixed_strategy
+        self.timings = {}
+        self.entry_count = 0
+        self._force_verify = False
+        self.last_result = None
+        self.stats = {'entries': 0, 'verified': 0, 'mismatches': 0, 'fallbacks': 0, 'benchmarks': 0}
+
+        if self.strategy is None:
+            self.load()
+
+    def enter(self, text, interval=None):
+        """
+        포커스된(비어 있는) 입력 필드에 텍스트 입력
+
+        Args:
+            text: 입력할 텍스트
+            interval: 타이핑 글자 간 간격 (None이면 type_interval)
+
+        Returns:
+            dict: {'strategy', 'verified', 'seconds', 'attempts'}
+        """
+        if interval is not None:
+            self.type_interval = interval
+
+        if self.strategy is None:
+            if self.verify == 'none':
+                # 확인 수단이 없으면 측정 결과를 믿을 수 없으므로 기존 방식 유지
+                self.strategy = 'type'
+            else:
+                self.benchmark(text)
+
+        self.entry_count += 1
+        should_verify = (
+            self.verify != 'none'
+            and (self._force_verify or self.entry_count % self.verify_every == 0)
+        )
+
+        start = time.perf_counter()
+        attempts = []
+        for strategy in self._fallback_order():
+            if attempts:
+                self.clear_field()
+            self._write(strategy, text)
+            if not should_verify:
+                verified = None
+                break
+
+            verified = self._verify(text)
+            attempts.append(strategy)
+            if verified is not False:
+                break
+            self.stats['mismatches'] += 1
+            print(f"[ENTRY] '{strategy}' 입력값 불일치, 다른 방식으로 재입력")
+        else:
+            raise TextEntryError(f"입력값 확인 실패: {text} (시도: {', '.join(attempts)})")
+
+        if len(attempts) > 1:
+            # 다른 방식으로 성공했으면 이후에는 그 방식을 사용하고 당분간 매번 확인
+            self.stats['fallbacks'] += 1
+            self._force_verify = True
+            if self.fixed_strategy is None:
+                print(f"[ENTRY] 입력 전략 변경: {self.strategy} -> {strategy}")
+                self.strategy = strategy
+                self.save()
+        elif verified:
+            self._force_verify = False
+
+        self.stats['entries'] += 1
+        if verified:
+            self.stats['verified'] += 1
+        self.last_result = {
+            'strategy': strategy,
+            'verified': verified,
+            'seconds': time.perf_counter() - start,
+            'attempts': max(1, len(attempts)),
+        }
+        return self.last_result
+
+    def benchmark(self, sample_text):
+        """
+        전략별 입력 시간/정확도 측정 후 가장 빠른 안정적인 전략 선택 (필드가 비어 있어야 함)
+
+        Args:
+            sample_text: 측정에 사용할 텍스트 (실제 입력값)
+
+        Returns:
+            str: 선택된 전략
+        """
+        print(f"[ENTRY] '{self.app_name}' 입력 전략 측정 ({self.benchmark_rounds}회씩)")
+        self.stats['benchmarks'] += 1
+        results = {}
+        for strategy in STRATEGIES:
+            times = []
+            reliable = True
+            for _ in range(self.benchmark_rounds):
+                self.clear_field()
+                start = time.perf_counter()
+                try:
+                    self._write(strategy, sample_text)
+                except Exception as e:
+                    # 클립보드가 없는 환경의 붙여넣기 등
+                    print(f"  - {strategy}: 입력 실패 ({e})")
+                    reliable = False
+                    break
+                times.append(time.perf_counter() - start)
+                if self._verify(sample_text) is False:
+                    reliable = False
+                    break
+            if not times:
+                results[strategy] = {'seconds': None, 'reliable': False}
+                continue
+            results[strategy] = {'seconds': min(times), 'reliable': reliable}
+            state = "OK" if reliable else "불일치"
+            print(f"  - {strategy}: {min(times) * 1000:.1f}ms ({state})")
+
+        reliable = [name for name, result in results.items() if result['reliable']]
+        if reliable:
+            chosen = min(reliable, key=lambda name: results[name]['seconds'])
+        else:
+            print("[ENTRY] 안정적인 입력 전략이 없어 타이핑 방식을 사용합니다.")
+            chosen = 'type'
+
+        self.timings = results
+        self.strategy = chosen
+        self.clear_field()
+        print(f"[ENTRY] 선택된 입력 전략: {chosen}")
+        self.save()
+        return chosen
+
+    def clear_field(self):
+        """포커스된 입력 필드 비우기 (전체 선택 후 삭제)"""
+        modifier = 'command' if platform.system() == 'Darwin' else 'ctrl'
+        self.automation.hotkey(modifier, 'a', delay=0)
+        self.automation.release_modifiers()
+        self.automation.press_key('backspace', delay=0)
+        if self.settle > 0:
+            time.sleep(self.settle)
+        if self.pixel is not None and self.pixel.baseline is None:
+            self.pixel.capture_baseline()
+
+    def _fallback_order(self):
+        first = self.strategy or 'type'
+        return [first] + [name for name in STRATEGIES if name != first]
+
+    def _write(self, strategy, text):
+        if strategy == 'paste' or (strategy == 'hybrid' and len(text) <= self.hybrid_tail):
+            self.automation.paste_text(text, delay=0)
+        elif strategy == 'hybrid':
+            # 앞부분은 붙여넣고 끝 글자만 타이핑 (키 입력 이벤트가 필요한 프로그램 대응)
+            self.automation.paste_text(text[:-self.hybrid_tail], delay=0)
+            self.automation.type_text(text[-self.hybrid_tail:], interval=self.type_interval, delay=0)
+        else:
+            self.automation.type_text(text, interval=self.type_interval, delay=0)
+
+    def _verify(self, text):
+        """
+        입력값 확인
+
+        Returns:
+            bool or None: 일치 True, 불일치 False, 판단 불가 None
+                (클립보드 사용 불가, 마스킹된 필드처럼 복사한 값으로 비교할 수 없는 경우)
+        """
+        if self.settle > 0:
+            time.sleep(self.settle)
+
+        if self.pixel is not None:
+            # 클립보드 확인(전체 선택)으로 필드가 강조되기 전에 폭 측정
+            result = self.pixel.check(text)
+            if self.verify == 'pixel' and result is not None:
+                return result
+            # 글자 폭을 아직 모르면 클립보드로 확인하고 학습
+
+        copied = self.automation.copy_selection()
+        if copied is None:
+            return None
+        # 빈 문자열(입력이 통째로 사라진 필드)도 불일치로 처리해 다른 방식으로 재입력
+        matched = self.normalize(copied) == self.normalize(text)
+        if not matched and any(ch in copied for ch in MASK_CHARACTERS):
+            return None
+        if matched and self.pixel is not None:
+            self.pixel.learn(text)
+        return matched
+
+    def load(self):
+        """저장된 전략 불러오기"""
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[ENTRY] 입력 전략 로드 실패: {e}")
+            return
+
+        entry = data.get(self.app_name)
+        if entry and entry.get('strategy') in STRATEGIES:
+            self.strategy = entry['strategy']
+            self.timings = entry.get('timings', {})
+            print(f"[ENTRY] '{self.app_name}' 저장된 입력 전략 사용: {self.strategy}")
+
+    def save(self):
+        """프로그램별 전략 저장"""
+        if not self.path or self.strategy is None:
+            return
+        data = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+
+        data[self.app_name] = {
+            'strategy': self.strategy,
+            'timings': self.timings,
+            'updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, self.path)
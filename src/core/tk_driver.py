@@ -0,0 +1,205 @@
+"""
+MARK: Tk 위젯 직접 구동 모듈
+같은 프로세스에서 실행 중인 Mock 시스템(Tkinter)을 pyautogui 없이 구동하는 GUIAutomation 호환 드라이버.
+화면 좌표를 위젯으로 바꿔 invoke/insert/event_generate로 조작하고, 매 동작 뒤 화면을 갱신해
+비전 파이프라인은 실제로 그려진 프레임을 그대로 사용한다.
+"""
+
+import contextlib
+import time
+import tkinter as tk
+
+
+class TkWidgetAutomation:
+    """Tk 위젯 직접 구동 드라이버 (실제 마우스/키보드 입력 없음)"""
+
+    def __init__(self, root, pacer=None):
+        """
+        초기화
+
+        Args:
+            root: Tk 루트 (Mock 시스템이 올라가 있는 루트, 같은 스레드에서 호출해야 함)
+            pacer: PacingController (지정하면 대기 동작에 학습값 사용, 보통 None)
+        """
+        self.root = root
+        self.delay = 0
+        self.pacer = pacer
+        self._action_listeners = []
+        self._focus = None
+        self._mouse = (0, 0)
+        self.modifier_stats = {
+            'release_events': 0,
+            'release_seconds': 0.0,
+            'full_resets': 0,
+            'stuck_detected': 0,
+        }
+        self.stats = {'actions': 0, 'unresolved_clicks': 0}
+        self.update()
+
+    def update(self):
+        """대기 중인 Tk 이벤트/다시 그리기 처리 (캡처 전에 화면 반영)"""
+        self.root.update()
+
+    def add_action_listener(self, callback):
+        self._action_listeners.append(callback)
+
+    def _notify(self, action, **params):
+        self.stats['actions'] += 1
+        for callback in self._action_listeners:
+            try:
+                callback(action, params)
+            except Exception as e:
+                print(f"[AUTO] 동작 기록 실패: {e}")
+
+    def widget_at(self, x, y):
+        """화면 좌표에 있는 위젯 (없으면 None)"""
+        return self.root.winfo_containing(int(x), int(y))
+
+    def _entry(self):
+        """현재 포커스된 Entry 위젯"""
+        widget = self._focus or self.root.focus_get()
+        return widget if isinstance(widget, tk.Entry) else None
+
+    def click(self, x, y, clicks=1, button='left', delay=None):
+        self._notify('click', x=x, y=y, clicks=clicks, button=button)
+        self._mouse = (x, y)
+        widget = self.widget_at(x, y)
+        if widget is None:
+            self.stats['unresolved_clicks'] += 1
+            print(f"[TK] ({x}, {y}) 위치에 위젯이 없습니다.")
+            self.update()
+            return
+
+        if isinstance(widget, tk.Button) and button == 'left':
+            widget.invoke()
+        elif isinstance(widget, tk.Entry):
+            widget.focus_set()
+            self._focus = widget
+            if clicks >= 2:
+                # 더블/트리플 클릭은 전체 선택으로 처리
+                widget.selection_range(0, tk.END)
+                widget.icursor(tk.END)
+            else:
+                local_x = int(x) - widget.winfo_rootx()
+                widget.icursor(widget.index(f"@{local_x}"))
+                widget.selection_clear()
+        else:
+            local_x = int(x) - widget.winfo_rootx()
+            local_y = int(y) - widget.winfo_rooty()
+            number = 3 if button == 'right' else 1
+            for _ in range(max(1, clicks)):
+                widget.event_generate(f'<ButtonPress-{number}>', x=local_x, y=local_y)
+                widget.event_generate(f'<ButtonRelease-{number}>', x=local_x, y=local_y)
+        self.update()
+
+    def double_click(self, x, y, delay=None):
+        self.click(x, y, clicks=2, delay=delay)
+
+    def right_click(self, x, y, delay=None):
+        self.click(x, y, button='right', delay=delay)
+
+    def move_to(self, x, y, duration=0.5):
+        self._notify('move_to', x=x, y=y, duration=duration)
+        self._mouse = (x, y)
+
+    def type_text(self, text, interval=0.05, delay=None):
+        self._notify('type_text', text=text, interval=interval)
+        self._insert(text)
+
+    def paste_text(self, text, delay=None):
+        self._notify('paste_text', text=text)
+        self._insert(text)
+
+    def _insert(self, text):
+        entry = self._entry()
+        if entry is None:
+            print("[TK] 포커스된 입력 필드가 없습니다.")
+            return
+        if entry.selection_present():
+            entry.delete(tk.SEL_FIRST, tk.SEL_LAST)
+        entry.insert(tk.INSERT, text)
+        self.update()
+
+    def copy_selection(self, timeout=0.3):
+        self._notify('copy_selection')
+        entry = self._entry()
+        if entry is None:
+            return None
+        entry.selection_range(0, tk.END)
+        return entry.get()
+
+    def press_key(self, key, delay=None):
+        self._notify('press_key', key=key)
+        entry = self._entry()
+        if key == 'backspace' and entry is not None:
+            if entry.selection_present():
+                entry.delete(tk.SEL_FIRST, tk.SEL_LAST)
+            else:
+                cursor = entry.index(tk.INSERT)
+                if cursor > 0:
+                    entry.delete(cursor - 1)
+        elif key in ('enter', 'return'):
+            target = entry or self.root.focus_get() or self.root
+            target.event_generate('<Return>')
+        elif key == 'tab':
+            target = (entry or self.root).tk_focusNext()
+            if target is not None:
+                target.focus_set()
+                self._focus = target
+        else:
+            target = entry or self.root.focus_get() or self.root
+            target.event_generate(f'<KeyPress-{key}>')
+        self.update()
+
+    def key_up(self, key):
+        self._notify('key_up', key=key)
+
+    def hotkey(self, *keys, delay=None):
+        self._notify('hotkey', keys=list(keys))
+        entry = self._entry()
+        if entry is not None and keys and keys[-1] == 'a':
+            entry.selection_range(0, tk.END)
+            entry.icursor(tk.END)
+        self.update()
+
+    def release_modifiers(self):
+        return 0
+
+    def reset_modifiers(self):
+        return 0
+
+    def ensure_modifiers_released(self):
+        return 0
+
+    def scroll(self, clicks, x=None, y=None):
+        self._notify('scroll', clicks=clicks, x=x, y=y)
+        if x is None or y is None:
+            x, y = self._mouse
+        widget = self.widget_at(x, y)
+        if widget is not None:
+            widget.event_generate('<MouseWheel>', delta=120 * clicks)
+        self.update()
+
+    def wait(self, seconds):
+        # 기다리는 동안에도 Tk 이벤트 처리
+        deadline = time.perf_counter() + seconds
+        self.update()
+        while time.perf_counter() < deadline:
+            time.sleep(min(0.01, max(0.0, deadline - time.perf_counter())))
+            self.update()
+
+    def pause(self, action, default):
+        # 위젯을 직접 구동하므로 입력 반영을 기다릴 필요 없음 (화면 갱신만)
+        if self.pacer is not None:
+            self.pacer.wait(action, default)
+        self.update()
+
+    def report_pacing(self, actions, success):
+        if self.pacer is not None:
+            self.pacer.report(actions, success)
+
+    def no_global_pause(self):
+        return contextlib.nullcontext()
+
+    def get_mouse_position(self):
+        return self._mouse
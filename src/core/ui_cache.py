@@ -0,0 +1,138 @@
+"""
+MARK: UI 좌표 영구 캐시 모듈
+UI 요소 좌표/대화상자 경계/캡처 영역을 디스크에 저장해 다음 실행에서 바로 사용.
+화면 크기, 캡처 배율, 템플릿 파일 해시, 타겟 윈도우 위치로 만든 지문이 바뀌면 자동으로 버림
+"""
+
+import glob
+import hashlib
+import json
+import os
+import platform
+import time
+
+import numpy as np
+
+
+def template_set_hash(template_dir):
+    """
+    템플릿 디렉토리 내용 해시
+
+    Args:
+        template_dir: 템플릿 이미지 디렉토리
+
+    Returns:
+        str: 파일 이름/내용 기준 sha1 (디렉토리가 없으면 빈 문자열)
+    """
+    digest = hashlib.sha1()
+    paths = sorted(glob.glob(os.path.join(template_dir, '*.png')))
+    if not paths:
+        return ''
+    for path in paths:
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class PersistentUICache:
+    """지문으로 유효성을 관리하는 UI 좌표 디스크 캐시"""
+
+    VERSION = 1
+
+    def __init__(self, path="tmp/cache/ui_cache.json"):
+        """
+        초기화
+
+        Args:
+            path: 캐시 파일 경로 (None이면 저장 안 함)
+        """
+        self.path = path
+
+    def fingerprint(self, capture, template_dir):
+        """
+        현재 환경 지문
+
+        Args:
+            capture: ScreenCapture
+            template_dir: 템플릿 디렉토리
+
+        Returns:
+            dict: {'os', 'screen_size', 'capture_scale', 'templates', 'window'}
+        """
+        window = None
+        if capture.target_window:
+            rect = capture.window_geometry.get(capture.target_window)
+            window = list(rect) if rect else None
+        return {
+            'os': platform.system(),
+            'screen_size': list(capture.get_screen_size()),
+            # 화면 좌표 크기는 같아도 배율(Retina/HiDPI 설정)이 바뀌면 좌표가 맞지 않음
+            'capture_scale': list(capture.get_capture_scale()),
+            'templates': template_set_hash(template_dir),
+            'window': window,
+        }
+
+    def load(self, fingerprint):
+        """
+        지문이 같을 때만 저장된 캐시 반환
+
+        Returns:
+            dict or None: {'elements', 'dialog_boundary', 'regions'}
+        """
+        if not self.path or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[UI CACHE] 캐시 로드 실패: {e}")
+            return None
+
+        if data.get('version') != self.VERSION or data.get('fingerprint') != fingerprint:
+            print("[UI CACHE] 화면/템플릿/윈도우 지문이 달라 저장된 좌표를 버립니다.")
+            self.clear()
+            return None
+        return data
+
+    def save(self, fingerprint, elements, dialog_boundary=None, regions=None):
+        """
+        캐시 저장
+
+        Args:
+            fingerprint: fingerprint() 결과
+            elements: {요소 이름: 좌표 dict}
+            dialog_boundary: 대화상자 경계 (스크린샷 좌표)
+            regions: {영역 이름: (x, y, w, h)}
+        """
+        if not self.path:
+            return
+        data = {
+            'version': self.VERSION,
+            'updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'fingerprint': fingerprint,
+            'elements': elements,
+            'dialog_boundary': dialog_boundary,
+            'regions': {name: list(rect) for name, rect in (regions or {}).items()},
+        }
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=self._to_json)
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        """캐시 파일 삭제"""
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+    @staticmethod
+    def _to_json(value):
+        # numpy 정수/실수 (템플릿 매칭 결과) 변환
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, np.ndarray):
+            return value.tolist()
+        raise TypeError(f"JSON으로 저장할 수 없는 값입니다: {type(value)}")
@@ -0,0 +1,304 @@
+"""
+MARK: 윈도우 위치/크기 조회 모듈
+타겟 윈도우 geometry를 한 번만 조회해 캐시하고, 테두리 픽셀이 그대로인지로 유효성 확인
+"""
+
+import platform
+import shutil
+import subprocess
+import time
+
+import numpy as np
+
+
+class WindowGeometryProvider:
+    """윈도우 geometry 조회 인터페이스"""
+
+    name = 'base'
+
+    def __init__(self):
+        self.query_count = 0
+
+    def query(self, window_name):
+        """
+        윈도우 위치/크기 조회 (필요하면 윈도우를 앞으로 가져옴)
+
+        Args:
+            window_name: 윈도우 이름 (부분 일치)
+
+        Returns:
+            tuple or None: (x, y, width, height) 화면 좌표, 못 찾으면 None
+        """
+        self.query_count += 1
+        return self._query(window_name)
+
+    def _query(self, window_name):
+        raise NotImplementedError
+
+
+class MacOSWindowGeometryProvider(WindowGeometryProvider):
+    """AppleScript(osascript) 기반 macOS 구현"""
+
+    name = 'macos'
+
+    def __init__(self, activate=True, timeout=5):
+        """
+        Args:
+            activate: 조회할 때 윈도우를 앞으로 가져올지 여부
+            timeout: osascript 제한 시간 (초)
+        """
+        super().__init__()
+        self.activate = activate
+        self.timeout = timeout
+
+    def _query(self, window_name):
+        activate_line = (
+            "set frontmost of targetApp to true\n            delay 0.2"
+            if self.activate else ""
+        )
+        applescript = f'''
+        tell application "System Events"
+            set targetApp to first application process whose name contains "{window_name}"
+            {activate_line}
+
+            -- 윈도우 위치와 크기 가져오기
+            tell first window of targetApp
+                set {{x, y}} to position
+                set {{w, h}} to size
+            end tell
+
+            return {{x, y, w, h}}
+        end tell
+        '''
+        result = subprocess.run(
+            ['osascript', '-e', applescript],
+            capture_output=True,
+            text=True,
+            timeout=self.timeout
+        )
+        if result.returncode != 0:
+            return None
+
+        # 결과 파싱: "x, y, w, h"
+        x, y, w, h = map(int, result.stdout.strip().split(', '))
+        return x, y, w, h
+
+
+class X11WindowGeometryProvider(WindowGeometryProvider):
+    """xdotool(없으면 wmctrl) 기반 Linux/X11 구현"""
+
+    name = 'x11'
+
+    def __init__(self, activate=True, timeout=5):
+        """
+        Args:
+            activate: 조회할 때 윈도우를 앞으로 가져올지 여부 (xdotool 필요)
+            timeout: 외부 명령 제한 시간 (초)
+        """
+        super().__init__()
+        self.activate = activate
+        self.timeout = timeout
+        self.xdotool = shutil.which('xdotool')
+        self.wmctrl = shutil.which('wmctrl')
+        if not self.xdotool and not self.wmctrl:
+            raise OSError("xdotool 또는 wmctrl이 필요합니다.")
+
+    def _run(self, *args):
+        result = subprocess.run(args, capture_output=True, text=True, timeout=self.timeout)
+        if result.returncode != 0:
+            return None
+        return result.stdout
+
+    def _query(self, window_name):
+        if self.xdotool:
+            return self._query_xdotool(window_name)
+        return self._query_wmctrl(window_name)
+
+    def _query_xdotool(self, window_name):
+        output = self._run(self.xdotool, 'search', '--onlyvisible', '--name', window_name)
+        if not output or not output.split():
+            return None
+        window_id = output.split()[0]
+
+        if self.activate:
+            self._run(self.xdotool, 'windowactivate', '--sync', window_id)
+
+        output = self._run(self.xdotool, 'getwindowgeometry', '--shell', window_id)
+        if not output:
+            return None
+        values = dict(
+            line.split('=', 1) for line in output.splitlines() if '=' in line
+        )
+        return int(values['X']), int(values['Y']), int(values['WIDTH']), int(values['HEIGHT'])
+
+    def _query_wmctrl(self, window_name):
+        # 출력 형식: <id> <desktop> <x> <y> <w> <h> <host> <title...>
+        output = self._run(self.wmctrl, '-lG')
+        if not output:
+            return None
+        for line in output.splitlines():
+            parts = line.split(None, 7)
+            if len(parts) == 8 and window_name in parts[7]:
+                if self.activate:
+                    self._run(self.wmctrl, '-ia', parts[0])
+                x, y, w, h = map(int, parts[2:6])
+                return x, y, w, h
+        return None
+
+
+class StaticWindowGeometryProvider(WindowGeometryProvider):
+    """고정 geometry를 돌려주는 구현 (테스트/재생용)"""
+
+    name = 'static'
+
+    def __init__(self, geometries=None):
+        """
+        Args:
+            geometries: {윈도우 이름: (x, y, width, height)}
+        """
+        super().__init__()
+        self.geometries = dict(geometries or {})
+
+    def set(self, window_name, rect):
+        self.geometries[window_name] = tuple(rect)
+
+    def _query(self, window_name):
+        for name, rect in self.geometries.items():
+            if window_name in name:
+                return rect
+        return None
+
+
+def create_geometry_provider(name='auto'):
+    """
+    OS에 맞는 geometry 조회기 생성
+
+    Args:
+        name: 'auto', 'macos', 'x11', 'static'
+
+    Returns:
+        WindowGeometryProvider or None: 사용 가능한 구현이 없으면 None
+    """
+    if name == 'auto':
+        system = platform.system()
+        name = 'macos' if system == 'Darwin' else 'x11' if system == 'Linux' else None
+    try:
+        if name == 'macos':
+            return MacOSWindowGeometryProvider()
+        if name == 'x11':
+            return X11WindowGeometryProvider()
+        if name == 'static':
+            return StaticWindowGeometryProvider()
+    except Exception as e:
+        print(f"[WINDOW] '{name}' geometry 조회기 사용 불가: {e}")
+    return None
+
+
+class CachedWindowGeometry:
+    """
+    geometry 캐시
+
+    최초 조회 후에는 캡처할 때마다 윈도우 테두리(제목 표시줄/프레임) 픽셀 요약값만 비교하고,
+    테두리가 달라졌을 때(윈도우 이동/크기 변경)만 다시 조회한다.
+    """
+
+    def __init__(self, provider, border=6, segments=16, tolerance=12.0, max_age=None):
+        """
+        초기화
+
+        Args:
+            provider: WindowGeometryProvider (None이면 항상 조회 실패)
+            border: 비교할 테두리 두께 (픽셀)
+            segments: 테두리 한 변을 나눌 구간 수
+            tolerance: 허용 평균 밝기 차이 (0~255)
+            max_age: 캐시 최대 유지 시간 (초, None이면 무제한)
+        """
+        self.provider = provider
+        self.border = border
+        self.segments = segments
+        self.tolerance = tolerance
+        self.max_age = max_age
+        self._entries = {}  # window_name -> {'rect', 'signature', 'updated'}
+        self.stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+    def get(self, window_name):
+        """
+        캐시된 geometry 반환 (없거나 만료되면 조회)
+
+        Returns:
+            tuple or None: (x, y, width, height)
+        """
+        entry = self._entries.get(window_name)
+        if entry and (self.max_age is None or time.time() - entry['updated'] <= self.max_age):
+            self.stats['hits'] += 1
+            return entry['rect']
+
+        self.stats['misses'] += 1
+        if self.provider is None:
+            return None
+        try:
+            rect = self.provider.query(window_name)
+        except Exception as e:
+            print(f"[WINDOW] geometry 조회 실패: {e}")
+            rect = None
+        if rect is None:
+            self._entries.pop(window_name, None)
+            return None
+
+        print(f"[WINDOW] 윈도우 '{window_name}' geometry: {rect}")
+        self._entries[window_name] = {'rect': tuple(rect), 'signature': None, 'updated': time.time()}
+        return tuple(rect)
+
+    def invalidate(self, window_name=None):
+        """캐시 무효화 (None이면 전체)"""
+        if window_name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(window_name, None)
+        self.stats['invalidations'] += 1
+
+    def validate(self, window_name, frame):
+        """
+        캡처한 윈도우 프레임의 테두리가 캐시 당시와 같은지 확인
+
+        Args:
+            window_name: 윈도우 이름
+            frame: 캐시된 geometry로 캡처한 CaptureFrame
+
+        Returns:
+            bool: 유효하면 True (처음 캡처면 서명 저장 후 True)
+        """
+        entry = self._entries.get(window_name)
+        if entry is None:
+            return False
+
+        signature = self._border_signature(frame.gray)
+        if entry['signature'] is None:
+            entry['signature'] = signature
+            return True
+
+        if signature.shape != entry['signature'].shape:
+            difference = float('inf')
+        else:
+            difference = float(np.abs(signature - entry['signature']).mean())
+        if difference <= self.tolerance:
+            return True
+
+        print(f"[WINDOW] 윈도우 테두리 변경 감지 (차이 {difference:.1f}), geometry 재조회")
+        self.invalidate(window_name)
+        return False
+
+    def _border_signature(self, gray):
+        """테두리 4변을 구간별 평균 밝기로 요약"""
+        b = max(1, min(self.border, gray.shape[0] // 4, gray.shape[1] // 4))
+        strips = (
+            gray[:b, :],          # 위 (제목 표시줄)
+            gray[-b:, :],         # 아래
+            gray[:, :b].T,        # 왼쪽
+            gray[:, -b:].T,       # 오른쪽
+        )
+        values = []
+        for strip in strips:
+            for chunk in np.array_split(strip, self.segments, axis=1):
+                values.append(chunk.mean() if chunk.size else 0.0)
+        return np.asarray(values, dtype=np.float32)
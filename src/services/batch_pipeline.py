@@ -0,0 +1,184 @@
+"""
+MARK: 파이프라인 일괄 검색
+GUI 조작 스레드는 입력/검색/결과 캡처까지만 하고 다음 건으로 넘어가며,
+결과 분석(체크박스 매칭)은 별도 작업 스레드에서 처리한 뒤 입력 순서대로 다시 모음
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+
+
+class PipelinedBatchRunner:
+    """입력(GUI)과 결과 분석을 겹쳐서 실행하는 일괄 검색기"""
+
+    def __init__(self, service, max_pending=4, max_requeue=1, between_default=0.2):
+        """
+        초기화
+
+        Args:
+            service: SearchAutomationService (submit_record/analyze_result 필요)
+            max_pending: 분석 대기 프레임 최대 수 (가득 차면 GUI 스레드가 기다림)
+            max_requeue: 분석 실패 시 다시 입력/캡처할 최대 횟수
+            between_default: 다음 건 입력 전 최대 대기 시간 (초, pacer 학습값 우선, 결과 영역이 멈추면 바로 진행)
+        """
+        self.service = service
+        self.max_pending = max(1, int(max_pending))
+        self.max_requeue = max(0, int(max_requeue))
+        self.between_default = between_default
+        self.stats = {}
+
+    def run(self, resident_numbers, callback=None, should_stop=None):
+        """
+        일괄 검색
+
+        Args:
+            resident_numbers: 주민등록번호 리스트
+            callback: 진행 상황 콜백 (index, total, result), 입력 순서대로 GUI 스레드에서 호출
+            should_stop: should_stop() -> True면 새 입력을 멈추고 진행 중인 분석만 마무리
+
+        Returns:
+            list: 입력과 같은 길이의 검색 결과 (중지해서 처리하지 못한 건은 None,
+                건너뛴 건 때문에 뒤 결과가 앞으로 당겨지지 않음)
+        """
+        total = len(resident_numbers)
+        results = [None] * total
+        attempts = [0] * total
+        pending = deque(range(total))
+        tasks = queue.Queue(maxsize=self.max_pending)
+        done = queue.Queue()
+        self.stats = {
+            'submitted': 0,
+            'requeued': 0,
+            'backpressure_waits': 0,
+            'gui_seconds': 0.0,
+            'analysis_seconds': 0.0,
+        }
+
+        worker = threading.Thread(target=self._worker, args=(tasks, done), daemon=True)
+        worker.start()
+
+        start = time.perf_counter()
+        in_flight = 0
+        next_emit = 0
+        stopping = False
+        try:
+            while pending or in_flight:
+                # 끝난 분석 결과 반영 (더 넣을 건이 없으면 하나 올 때까지 대기)
+                in_flight -= self._collect(done, results, attempts, pending, block=not pending)
+                next_emit = self._emit(results, next_emit, total, callback)
+
+                if not stopping and should_stop and should_stop():
+                    print("[PIPELINE] 중지 요청: 진행 중인 분석만 마무리합니다.")
+                    stopping = True
+                if stopping:
+                    # 재입력 대기 건도 버림
+                    pending.clear()
+                if not pending:
+                    continue
+
+                index = pending.popleft()
+                attempts[index] += 1
+                gui_start = time.perf_counter()
+                submitted = self.service.submit_record(resident_numbers[index])
+                self.stats['submitted'] += 1
+
+                if submitted['status'] == 'captured':
+                    if tasks.full():
+                        self.stats['backpressure_waits'] += 1
+                    tasks.put((index, submitted['resident_number'], submitted))
+                    in_flight += 1
+                else:
+                    results[index] = submitted
+                self.stats['gui_seconds'] += time.perf_counter() - gui_start
+
+                # 다음 검색 전 대기 (분석 결과를 기다리지 않음)
+                if pending:
+                    self.service.wait_ready('between_records', self.between_default)
+        finally:
+            tasks.put(None)
+            worker.join()
+
+        self._emit(results, next_emit, total, callback)
+        elapsed = time.perf_counter() - start
+        finished = sum(result is not None for result in results)
+        self._print_stats(finished, elapsed)
+        return results
+
+    def _worker(self, tasks, done):
+        """분석 작업 스레드"""
+        while True:
+            task = tasks.get()
+            if task is None:
+                return
+            index, resident_number, captured = task
+            analysis_start = time.perf_counter()
+            try:
+                result = self.service.analyze_result(
+                    resident_number, captured['frame'], captured.get('state'), captured.get('status_frame')
+                )
+                result['screen_changed'] = captured.get('changed')
+                error = None
+            except Exception as e:
+                result = None
+                error = e
+            done.put((index, resident_number, result, error, time.perf_counter() - analysis_start))
+
+    def _collect(self, done, results, attempts, pending, block):
+        """
+        완료된 분석 결과 반영 (pacing 보고도 GUI 스레드에서 처리)
+
+        Returns:
+            int: 반영한 건수
+        """
+        collected = 0
+        while True:
+            try:
+                item = done.get(block=block and collected == 0)
+            except queue.Empty:
+                return collected
+            index, resident_number, result, error, seconds = item
+            collected += 1
+            self.stats['analysis_seconds'] += seconds
+            automation = self.service.automation
+
+            if error is None:
+                results[index] = result
+                signal = self.service.pacing_signal(result)
+                automation.report_pacing(self.service.PACED_ACTIONS, signal)
+                automation.report_pacing('between_records', signal)
+                continue
+
+            automation.report_pacing(self.service.PACED_ACTIONS, False)
+            if attempts[index] <= self.max_requeue:
+                # 새로 캡처하도록 다음 입력 순서 맨 앞에 다시 넣음
+                print(f"[PIPELINE] {index + 1}번째 건 분석 실패({error}), 다시 입력/캡처합니다.")
+                self.stats['requeued'] += 1
+                pending.appendleft(index)
+            else:
+                error_type = self.service.classify_error(error)
+                results[index] = self.service.error_result(
+                    resident_number,
+                    f'결과 분석 실패: {error}',
+                    'analysis' if error_type == 'unknown' else error_type
+                )
+
+    @staticmethod
+    def _emit(results, next_emit, total, callback):
+        """앞에서부터 이어진 결과만 순서대로 콜백 호출"""
+        while next_emit < total and results[next_emit] is not None:
+            if callback:
+                callback(next_emit + 1, total, results[next_emit])
+            next_emit += 1
+        return next_emit
+
+    def _print_stats(self, finished, elapsed):
+        stats = self.stats
+        if not finished:
+            return
+        print(
+            f"[PIPELINE] {finished}건 {elapsed:.2f}초 (건당 {elapsed / finished * 1000:.0f}ms), "
+            f"GUI {stats['gui_seconds']:.2f}초 / 분석 {stats['analysis_seconds']:.2f}초 겹쳐 실행, "
+            f"재입력 {stats['requeued']}회, 대기열 가득 참 {stats['backpressure_waits']}회"
+        )
@@ -0,0 +1,170 @@
+"""
+MARK: 진행 기록(체크포인트) 저널
+결과 한 건이 끝날 때마다 JSONL 한 줄을 추가하고 fsync해서,
+중간에 프로그램이 죽거나 전원이 나가도 다시 실행하면 끝난 건은 건너뛰고 이어서 처리.
+다시 시도하면 나아질 수 있는 오류 행은 끝난 건으로 보지 않고 다음 실행에서 다시 처리
+"""
+
+import json
+import os
+import threading
+
+
+def _to_json(value):
+    # pandas/numpy 값 (순번 등) 변환
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+class CheckpointJournal:
+    """추가 전용 결과 저널"""
+
+    # 행마다 함께 기록하는 완료 여부 (결과 행에는 포함하지 않음)
+    FINAL_KEY = '_final'
+
+    def __init__(self, path):
+        """
+        초기화
+
+        Args:
+            path: 저널 파일 경로 (.jsonl)
+        """
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def path_for(output_path):
+        """출력 파일 옆에 둘 저널 경로 (결과.xlsx → 결과.journal.jsonl)"""
+        return os.path.splitext(output_path)[0] + '.journal.jsonl'
+
+    @staticmethod
+    def key(row, position=None):
+        """
+        레코드/결과 행 식별 키
+
+        Args:
+            row: 입력 레코드 또는 결과 행
+            position: 순번 컬럼이 없을 때 쓸 순번 (입력 파일 내 1부터 시작하는 위치)
+
+        Returns:
+            tuple: (순번, 주민등록번호)
+        """
+        resident_number = row.get('주민등록번호')
+        resident_number = '' if resident_number is None else str(resident_number).strip()
+        if resident_number.lower() == 'nan':
+            resident_number = ''
+        return str(row.get('순번', position)).strip(), resident_number
+
+    @staticmethod
+    def is_final(row):
+        """
+        이어서 하기에서 건너뛸 행인지 (완료 여부가 없는 이전 형식 행은 상태로 판단)
+
+        Args:
+            row: 저널에 기록된 행
+
+        Returns:
+            bool: 성공했거나 다시 해도 결과가 같은 오류(빈 주민등록번호 등)면 True
+        """
+        final = row.get(CheckpointJournal.FINAL_KEY)
+        if final is not None:
+            return bool(final)
+        return row.get('상태') == '완료' or not CheckpointJournal.key(row)[1]
+
+    def load(self, finished_only=False):
+        """
+        저장된 결과 읽기 (마지막 줄이 쓰다 만 줄이면 무시, 같은 건은 나중 줄이 우선)
+
+        Args:
+            finished_only: True면 끝난 건(is_final)만 (이어서 하기에서 건너뛸 건)
+
+        Returns:
+            dict: {key: 결과 행}
+        """
+        rows = {}
+        if not os.path.exists(self.path):
+            return rows
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    print(f"[JOURNAL] {line_number}번째 줄이 손상되어 건너뜁니다.")
+                    continue
+                rows[self.key(row)] = row
+        if finished_only:
+            rows = {key: row for key, row in rows.items() if self.is_final(row)}
+        return {key: self._strip(row) for key, row in rows.items()}
+
+    def append(self, row, final=None):
+        """
+        결과 한 건 추가 (디스크에 기록될 때까지 fsync)
+
+        Args:
+            row: 결과 행 ({'순번', '주민등록번호', '이름', '세대원 수', '상태', '메시지'})
+            final: 끝난 건 여부 (False면 다음 실행에서 다시 처리, None이면 상태가 '완료'일 때만 True)
+        """
+        if final is None:
+            final = row.get('상태') == '완료'
+        line = json.dumps(dict(row, **{self.FINAL_KEY: bool(final)}), ensure_ascii=False, default=_to_json)
+        with self._lock:
+            if self._file is None:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._file = open(self.path, 'a', encoding='utf-8')
+                self._terminate_partial_line()
+            self._file.write(line + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def reset(self):
+        """저널 비우기 (처음부터 다시 처리)"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def rows_for(self, records, done=None):
+        """
+        입력 레코드 순서대로 저널의 결과 행 모음 (아직 처리하지 않은 레코드는 제외)
+
+        Args:
+            records: 입력 레코드 목록
+            done: load() 결과 (None이면 새로 읽음)
+
+        Returns:
+            list: 결과 행 목록
+        """
+        done = self.load() if done is None else done
+        rows = []
+        for position, record in enumerate(records, 1):
+            row = done.get(self.key(record, position))
+            if row is not None:
+                rows.append(row)
+        return rows
+
+    @classmethod
+    def _strip(cls, row):
+        if cls.FINAL_KEY not in row:
+            return row
+        return {key: value for key, value in row.items() if key != cls.FINAL_KEY}
+
+    def _terminate_partial_line(self):
+        """이전 실행이 줄 중간에 끊겼으면 줄바꿈을 넣어 새 줄이 붙지 않게 함"""
+        if self._file.tell() == 0:
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                self._file.write('\n')
@@ -0,0 +1,174 @@
+"""
+MARK: 조회 결과 캐시
+이전 실행에서 조회한 세대원 수를 주민등록번호 해시(HMAC-SHA256, 설치별 비밀키)로 저장해
+유효 기간 안의 건은 GUI 조회 없이 재사용. 주민등록번호 원문은 저장하지 않음
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+
+
+class ResultCache:
+    """주민등록번호 해시 기반 조회 결과 디스크 캐시"""
+
+    VERSION = 1
+
+    def __init__(self, path="tmp/cache/result_cache.json", ttl_days=30, key_path=None):
+        """
+        초기화
+
+        Args:
+            path: 캐시 파일 경로
+            ttl_days: 결과 유효 기간 (일, 0이면 캐시 사용 안 함)
+            key_path: 해시 비밀키 파일 경로 (None이면 캐시 파일 옆 .key, 없으면 새로 생성)
+        """
+        self.path = path
+        self.ttl_seconds = max(0.0, float(ttl_days)) * 86400
+        self.key_path = key_path or os.path.splitext(path)[0] + '.key'
+        self._secret = None
+        self._entries = None
+        self._dirty = False
+        self.stats = {'hits': 0, 'expired': 0, 'misses': 0, 'stored': 0}
+
+    def get(self, resident_number):
+        """
+        유효 기간 안의 결과 조회
+
+        Args:
+            resident_number: 주민등록번호
+
+        Returns:
+            dict or None: {'household_count', 'checked'(저장 시각 epoch)}
+        """
+        if self.ttl_seconds <= 0:
+            return None
+        entry = self._load().get(self._hash(resident_number))
+        if entry is None:
+            self.stats['misses'] += 1
+            return None
+        if time.time() - entry['checked'] > self.ttl_seconds:
+            self.stats['expired'] += 1
+            return None
+        self.stats['hits'] += 1
+        return entry
+
+    def put(self, resident_number, result):
+        """
+        GUI로 조회한 결과 저장 (성공 결과만, 0명은 화면 표시가 늦어 잘못 센 경우와 구분할 수 없어 저장 안 함)
+
+        Args:
+            resident_number: 주민등록번호
+            result: search_resident 결과
+
+        Returns:
+            bool: 저장 여부
+        """
+        if result['status'] != 'success' or result['household_count'] <= 0:
+            return False
+        self._load()[self._hash(resident_number)] = {
+            'household_count': int(result['household_count']),
+            'checked': time.time(),
+        }
+        self._dirty = True
+        self.stats['stored'] += 1
+        return True
+
+    def lookup_result(self, resident_number, entry):
+        """
+        캐시 항목을 search_resident 결과 형식으로 변환
+
+        Returns:
+            dict: 'source'가 'cache'인 성공 결과
+        """
+        checked = time.strftime('%Y-%m-%d', time.localtime(entry['checked']))
+        return {
+            'resident_number': resident_number,
+            'household_count': entry['household_count'],
+            'status': 'success',
+            'message': f"Found {entry['household_count']} members (cache, {checked})",
+            'source': 'cache'
+        }
+
+    def save(self):
+        """변경 내용 저장 (만료된 항목은 정리)"""
+        if not self._dirty:
+            return
+        now = time.time()
+        entries = {
+            key: entry for key, entry in self._load().items()
+            if self.ttl_seconds <= 0 or now - entry['checked'] <= self.ttl_seconds
+        }
+        self._write_json(self.path, {'version': self.VERSION, 'entries': entries})
+        self._entries = entries
+        self._dirty = False
+
+    def _load(self):
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == self.VERSION:
+                    self._entries = data.get('entries', {})
+            except (OSError, ValueError) as e:
+                print(f"[RESULT CACHE] 캐시 로드 실패: {e}")
+        return self._entries
+
+    def _hash(self, resident_number):
+        digits = normalize_resident_number(resident_number)
+        return hmac.new(self._key(), digits.encode('utf-8'), hashlib.sha256).hexdigest()
+
+    def _key(self):
+        """설치별 비밀키 (캐시 파일만 유출되어도 주민등록번호를 대입해 찾을 수 없도록)"""
+        if self._secret is None:
+            if os.path.exists(self.key_path):
+                with open(self.key_path, 'rb') as f:
+                    self._secret = f.read()
+            else:
+                self._secret = secrets.token_bytes(32)
+                directory = os.path.dirname(self.key_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.key_path, 'wb') as f:
+                    f.write(self._secret)
+        return self._secret
+
+    @staticmethod
+    def _write_json(path, data):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(temp_path, path)
+
+
+def normalize_resident_number(resident_number):
+    """비교용 주민등록번호 (숫자만, '900101-1234567'과 '9001011234567'을 같은 값으로)"""
+    return ''.join(ch for ch in str(resident_number) if ch.isdigit())
+
+
+def dedupe_resident_numbers(resident_numbers):
+    """
+    입력 안의 중복 주민등록번호 묶기
+
+    Args:
+        resident_numbers: 주민등록번호 리스트
+
+    Returns:
+        list: [(대표 주민등록번호, [입력 위치, ...]), ...] 처음 나온 순서
+    """
+    groups = {}
+    for position, resident_number in enumerate(resident_numbers):
+        key = normalize_resident_number(resident_number)
+        if key not in groups:
+            groups[key] = (resident_number, [])
+        groups[key][1].append(position)
+    return list(groups.values())
@@ -0,0 +1,122 @@
+"""
+MARK: 지연 재시도 대기열
+본 처리 중 실패한 건은 바로 다시 시도하지 않고 모아 두었다가, 본 처리가 끝난 뒤
+오류 유형별 복구 단계(캐시 초기화, 대화상자 재검출 등)를 거쳐 간격을 늘려 가며 재시도
+"""
+
+import time
+
+
+class DeferredRetryQueue:
+    """본 처리 후 실패 건 재시도"""
+
+    def __init__(self, service, max_attempts=3, base_delay=2.0, max_delay=30.0):
+        """
+        초기화
+
+        Args:
+            service: SearchAutomationService (search_resident/is_retryable/recover/wait_ready 필요)
+            max_attempts: 건당 최대 재시도 횟수
+            base_delay: 첫 재시도 라운드 전 대기 시간 (초, 라운드마다 두 배)
+            max_delay: 라운드 전 최대 대기 시간 (초)
+        """
+        self.service = service
+        self.max_attempts = max(0, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._items = []  # [(key, resident_number, 마지막 오류 결과)]
+        self.stats = {'queued': 0, 'attempts': 0, 'recovered': 0, 'failed': 0, 'recoveries': {}}
+
+    def __len__(self):
+        return len(self._items)
+
+    def add(self, key, resident_number, result):
+        """
+        실패 결과를 대기열에 추가
+
+        Args:
+            key: 호출 측 식별자 (결과 위치 등, 재시도 결과 콜백에 그대로 전달)
+            resident_number: 주민등록번호
+            result: 오류 결과 (error_type 포함)
+
+        Returns:
+            bool: 추가 여부 (재시도할 수 없는 오류면 False)
+        """
+        if self.max_attempts == 0 or not self.service.is_retryable(result):
+            return False
+        self._items.append((key, resident_number, result))
+        self.stats['queued'] += 1
+        return True
+
+    def run(self, callback=None, should_stop=None):
+        """
+        재시도 실행
+
+        Args:
+            callback: callback(key, result) 건마다 최종 결과 (성공, 또는 재시도를 모두 쓴 오류)
+            should_stop: should_stop() -> True면 멈춤 (남은 건은 확정하지 않고 대기열에 남김)
+
+        Returns:
+            dict: {key: 최종 결과}
+        """
+        final = {}
+
+        def settle(key, result):
+            final[key] = result
+            if callback:
+                callback(key, result)
+
+        for attempt in range(1, self.max_attempts + 1):
+            if not self._items or (should_stop and should_stop()):
+                break
+
+            delay = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+            print(f"\n[RETRY] {attempt}차 재시도: {len(self._items)}건 ({delay:.1f}초 후)")
+            time.sleep(delay)
+
+            # 같은 유형의 복구는 라운드마다 한 번만 (건마다 캐시를 지우면 본 처리보다 느려짐)
+            for error_type in sorted({result.get('error_type', 'unknown') for _, _, result in self._items}):
+                step = self.service.recover(error_type)
+                if step:
+                    self.stats['recoveries'][step] = self.stats['recoveries'].get(step, 0) + 1
+
+            items, self._items = self._items, []
+            for position, (key, resident_number, previous) in enumerate(items):
+                if should_stop and should_stop():
+                    # 이번 라운드에서 시도하지 못한 건은 대기열에 남김
+                    self._items.extend(items[position:])
+                    break
+                if position:
+                    self.service.wait_ready('between_records', 0.2)
+                self.stats['attempts'] += 1
+                result = self.service.search_resident(resident_number)
+                if result['status'] == 'success':
+                    self.stats['recovered'] += 1
+                    settle(key, result)
+                elif attempt < self.max_attempts and self.service.is_retryable(result):
+                    self._items.append((key, resident_number, result))
+                else:
+                    settle(key, self._final_error(result, attempt))
+
+        if self._items:
+            print(f"[RETRY] 중지: {len(self._items)}건은 결과를 확정하지 않았습니다.")
+
+        self.stats['failed'] = sum(1 for result in final.values() if result['status'] != 'success')
+        self._print_stats()
+        return final
+
+    @staticmethod
+    def _final_error(result, attempts):
+        result = dict(result)
+        result['message'] = f"{result['message']} (재시도 {attempts}회 실패)"
+        return result
+
+    def _print_stats(self):
+        stats = self.stats
+        if not stats['queued']:
+            return
+        recoveries = ', '.join(f"{step} {count}회" for step, count in stats['recoveries'].items()) or '없음'
+        print(
+            f"[RETRY] 재시도 대상 {stats['queued']}건: 복구 {stats['recovered']}건, "
+            f"최종 실패 {stats['failed']}건 (시도 {stats['attempts']}회, 복구 단계: {recoveries})"
+        )
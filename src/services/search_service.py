@@ -6,15 +6,39 @@ MARK:
 
 import os
 import platform
+import threading
 import time
 import math
 
-import pyautogui
-from PIL import Image
+import cv2
+
+from ..core.action_plan import ActionPlan
 from ..core.automation import GUIAutomation
+from ..core.capture_planner import CapturePlanner
+from ..core.checkbox_counter import CheckboxCounter, ComponentCheckboxCounter
+from ..core.frame import CaptureFrame, image_size, load_gray
 from ..core.screen_capture import ScreenCapture
+from ..core.screen_state import ScreenStateClassifier, screen_signature
+from ..core.stabilizer import WaitStats, frames_differ, wait_until_stable
+from ..core.glyph_reader import GlyphDigitReader
+from ..core.session_recorder import SessionRecorder
 from ..core.image_matcher import ImageMatcher
+from ..core.interaction import get_profile
+from ..core.pacing import PacingController
+from ..core.text_entry import TextEntryEngine, TextEntryError
+from ..core.ui_cache import PersistentUICache
 from ..core.dialog_detector import DialogDetector
+from .batch_pipeline import PipelinedBatchRunner
+from .result_cache import normalize_resident_number
+from .retry_queue import DeferredRetryQueue
+
+
+class ElementNotFoundError(ValueError):
+    """템플릿 매칭으로 UI 요소를 찾지 못함"""
+
+
+class ScreenStateError(RuntimeError):
+    """조회 후 경고 창 등 결과가 아닌 화면이 표시됨"""
 
 
 def get_template_dir():
@@ -38,21 +62,90 @@ def get_template_dir():
 
 class SearchAutomationService:
     """검색 자동화 서비스"""
+
+    # 한 건 검색에서 학습 대상이 되는 대기 동작
+    PACED_ACTIONS = ('click', 'settle', 'result', 'input_pause')
+
+    # 체크박스 세는 방식 -> 카운터 생성 함수 (템플릿 경로를 받음)
+    CHECKBOX_ENGINES = {
+        'template': lambda path: CheckboxCounter(path, threshold=0.7),
+        'components': ComponentCheckboxCounter,
+    }
+
+    # 오류 유형별 재시도 전 복구 단계 (None이면 재시도하지 않음)
+    ERROR_RECOVERY = {
+        'invalid_input': None,
+        'template_missing': None,
+        'failsafe': None,
+        'element_not_found': 'clear_cache',
+        'entry_failed': 'refocus',
+        'timeout': 'redetect_dialog',
+        'warning': 'dismiss_warning',
+        'analysis': 'redetect_dialog',
+        'unknown': 'redetect_dialog',
+    }
     
-    def __init__(self, template_dir=None, target_window=None, use_dialog_detector=True):
+    def __init__(self, template_dir=None, target_window=None, use_dialog_detector=True,
+                 capture_backend='auto', automation=None, capture=None, adaptive_pacing=True,
+                 profile_steps=False, entry_strategy='auto', entry_verify='clipboard',
+                 interaction='mouse', persistent_cache=True, cache_check='error',
+                 input_lock=None, screen_states=True, stabilize=True,
+                 result_timeout=3.0, status_reader=True, checkbox_engine='template',
+                 compare_checkbox_engines=False):
         """
         Args:
             template_dir: UI 템플릿 이미지 디렉토리 (None이면 OS 자동 탐지)
             target_window: 타겟 윈도우 이름 (None이면 전체 화면)
             use_dialog_detector: 대화상자 검출 기능 사용 여부
+            capture_backend: 캡처 백엔드 ('auto', 'pyautogui', 'x11shm', 'replay' 또는 인스턴스)
+            automation: GUIAutomation 호환 객체 (None이면 pyautogui 기반 기본값)
+            capture: ScreenCapture (None이면 target_window/capture_backend로 생성)
+            adaptive_pacing: 동작 간 대기 시간을 장비별로 학습할지 여부
+            profile_steps: 입력 동작 계획의 단계별 소요 시간 측정 여부
+            entry_strategy: 텍스트 입력 방식 ('auto', 'type', 'paste', 'hybrid')
+            entry_verify: 입력값 확인 방식 ('clipboard', 'pixel', 'none')
+            interaction: 상호작용 프로필 ('mouse', 'keyboard', 'keyboard_refocus' 또는 InteractionProfile)
+                (키보드 프로필은 Enter 검색과 포커스 유지가 확인된 프로그램에서만 지정)
+            persistent_cache: UI 좌표를 tmp/cache에 저장해 다음 실행에서 재사용할지 여부
+                (PersistentUICache를 넘기면 해당 경로 사용)
+            cache_check: 캐시 좌표 확인 주기 ('error': 오류 후에만, 'every': 매 건, 정수 N: N건마다)
+            input_lock: 마우스/키보드 입력 구간에 잡을 lock (여러 윈도우가 입력 장치를 공유할 때)
+            screen_states: 결과 영역 화면 상태(결과 없음, 경고 등)를 분류할지 여부
+            stabilize: 고정 대기 대신 결과 영역이 안정될 때까지만 기다릴지 여부
+                (재생 캡처처럼 캡처할 때마다 프레임이 소모되는 경우 False)
+            result_timeout: 결과 화면 안정화 최대 대기 시간 (초)
+            status_reader: 상태 표시줄의 세대원 수를 읽어 체크박스 수와 교차 확인할지 여부
+                (템플릿 디렉토리에 status_label.png('조회 결과:' 글자)가 있을 때만 동작)
+            checkbox_engine: 체크박스 세는 방식 ('template': 템플릿 매칭, 'components': 연결 요소 모양 필터)
+            compare_checkbox_engines: 다른 방식으로도 세서 일치 여부 기록 (결과는 checkbox_engine 값 사용)
         """
         # template_dir이 지정되지 않으면 OS에 따라 자동 설정
         if template_dir is None:
             template_dir = get_template_dir()
         
-        self.automation = GUIAutomation(delay=0.5)
-        self.capture = ScreenCapture(target_window=target_window)
+        if automation is None:
+            pacer = PacingController() if adaptive_pacing else None
+            automation = GUIAutomation(delay=0.5, pacer=pacer)
+        self.automation = automation
+        self.text_entry = TextEntryEngine(
+            self.automation,
+            app_name=target_window or 'default',
+            strategy=entry_strategy,
+            verify=entry_verify,
+            field_reader=self._read_input_field,
+            normalize=normalize_resident_number
+        )
+        if capture is None:
+            capture = ScreenCapture(target_window=target_window, backend=capture_backend)
+        self.capture = capture
+        self.planner = CapturePlanner(self.capture)
         self.matcher = ImageMatcher(confidence=0.7)  # 템플릿 매칭 신뢰도
+        # 캐시 좌표 주변만 보는 확인용 매칭 (작은 영역에서는 채도/윤곽 모드가 쉽게 오탐하므로 밝기만 사용)
+        self.local_matcher = ImageMatcher(
+            confidence=0.8,
+            match_modes=('gray',),
+            method=cv2.TM_CCOEFF_NORMED
+        )
         self.template_dir = template_dir
         
         # 대화상자 검출기 초기화
@@ -62,33 +155,101 @@ class SearchAutomationService:
         # 사용 중인 템플릿 디렉토리 출력
         print(f"템플릿 디렉토리: {self.template_dir} (OS: {platform.system()})")
 
-        # UI 요소 위치 캐시
+        # 화면 상태 분류기 (결과 화면 예시는 검색하면서 학습, 나머지 상태는 tools/label_screen_state.py로 등록)
+        self.screen_states = ScreenStateClassifier(app_name=target_window or 'default') if screen_states else None
+        # 결과 영역 밖(대화상자/창 전체)에 뜨는 경고 창 확인용 예시 (tools/label_screen_state.py --window로 등록)
+        self.window_states = (
+            ScreenStateClassifier(app_name=f"{target_window or 'default'}:window") if screen_states else None
+        )
+        self._window_hint_shown = False
+        self._last_result_gray = None
+
+        # 완료 대기 (결과 영역 안정화) 설정 / 측정 기록
+        self.stabilize = stabilize
+        self.result_timeout = result_timeout
+        self.wait_stats = WaitStats()
+
+        # 상태 표시줄 숫자 판독기 (숫자 예시는 체크박스 수로 학습) / 교차 확인 기록
+        self.status_reader = GlyphDigitReader(app_name=target_window or 'default') if status_reader else None
+        self.count_check = {'agree': 0, 'mismatch': 0, 'status_used': 0, 'unread': 0}
+
+        # 체크박스 카운터 (첫 검색 때 템플릿 로드) / 마지막 검색의 체크박스 위치
+        if checkbox_engine not in self.CHECKBOX_ENGINES:
+            raise ValueError(
+                f"알 수 없는 체크박스 방식입니다: {checkbox_engine} (사용 가능: {', '.join(self.CHECKBOX_ENGINES)})"
+            )
+        self.checkbox_engine = checkbox_engine
+        self.compare_checkbox_engines = compare_checkbox_engines
+        self.checkbox_counters = {}
+        self.engine_agreement = {'agree': 0, 'disagree': 0, 'ms': {}}
+        self.last_checkboxes = []
+
+        # UI 요소 위치 캐시 (지문이 같으면 이전 실행에서 저장한 값 사용)
         self.ui_cache = {}
+        if isinstance(persistent_cache, PersistentUICache):
+            self.ui_store = persistent_cache
+        else:
+            self.ui_store = PersistentUICache() if persistent_cache else None
+        self._ui_fingerprint = None
+        if cache_check not in ('error', 'every') and not isinstance(cache_check, int):
+            raise ValueError(f"지원하지 않는 캐시 확인 주기입니다: {cache_check}")
+        self.cache_check = cache_check
+        self._cache_check_pending = False
+        self._records_since_check = 0
+        self.cache_check_stats = {'checks': 0, 'moved': 0, 'local_hits': 0, 'full_searches': 0}
 
-    @staticmethod
-    def _release_modifier_keys():
-        """특정 환경에서 남아있을 수 있는 modifier 키를 해제"""
-        stuck_keys = (
-            'command', 'commandleft', 'commandright',
-            'ctrl', 'ctrlleft', 'ctrlright',
-            'alt', 'option', 'altleft', 'altright',
-            'shift', 'shiftleft', 'shiftright'
-        )
-        for key in stuck_keys:
-            try:
-                pyautogui.keyUp(key)
-            except Exception:
-                # 일부 키는 현재 OS에서 지원되지 않을 수 있으므로 무시
-                continue
+        # 세션 녹화기 (start_recording 호출 시 생성)
+        self.recorder = None
 
-    def _normalize_coordinates(self, coords, screenshot_path):
-        """Retina/배율 환경에서 템플릿 좌표, 화면 좌표 보정"""
-        screen_w, screen_h = self.capture.get_screen_size()
-        with Image.open(screenshot_path) as shot:
-            img_w, img_h = shot.size
+        # 레코드 입력 동작 계획 (첫 검색 때 컴파일, 포커스 클릭 포함/생략 두 가지)
+        self.interaction = get_profile(interaction)
+        self._input_plans = {}
+        self._focus_confirmed = False
+        self.plan_stats = {'runs': 0, 'seconds': 0.0}
+        # 입력 계획 실행 구간만 잡음 (결과 대기/캡처/분석 중에는 다른 윈도우가 입력 가능)
+        self.input_lock = input_lock if input_lock is not None else threading.Lock()
+
+        self._restore_ui_cache()
+        self.profile_steps = profile_steps
+        self.plan_timings = {}
+
+    def start_recording(self, archive_path, keyframe_interval=30):
+        """
+        캡처 프레임과 GUI 동작 녹화 시작
+
+        Args:
+            archive_path: 아카이브 저장 경로 (.zip)
+            keyframe_interval: 키프레임 간격
+
+        Returns:
+            SessionRecorder: 녹화기
+        """
+        self.stop_recording()
+        self.recorder = SessionRecorder(archive_path, keyframe_interval=keyframe_interval)
+        self.recorder.attach(self.capture, self.automation)
+        print(f"[RECORD] 세션 녹화 시작: {archive_path}")
+        return self.recorder
 
-        scale_x = img_w / screen_w if screen_w else 1
-        scale_y = img_h / screen_h if screen_h else 1
+    def stop_recording(self):
+        """세션 녹화 종료 및 아카이브 저장"""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def _normalize_coordinates(self, coords, screenshot):
+        """Retina/배율 환경에서 템플릿 좌표, 화면 좌표 보정 (영역 캡처는 원점 오프셋 반영)"""
+        if isinstance(screenshot, CaptureFrame):
+            # 메모리 프레임은 캡처 시점의 크기/배율 메타데이터를 그대로 사용
+            img_w, img_h = screenshot.size
+            screen_w, screen_h = screenshot.logical_size
+            scale_x, scale_y = screenshot.scale
+            origin_x, origin_y = screenshot.origin
+        else:
+            screen_w, screen_h = self.capture.get_screen_size()
+            img_w, img_h = image_size(screenshot)
+            scale_x = img_w / screen_w if screen_w else 1
+            scale_y = img_h / screen_h if screen_h else 1
+            origin_x, origin_y = 0, 0
 
         print(
             "[SCALE] "
@@ -99,7 +260,7 @@ class SearchAutomationService:
         # Windows는 스케일링 보정을 하지 않음 (DPI 스케일링 방식이 다름)
         if platform.system() == "Windows":
             print("[SCALE] Windows 환경: 좌표 보정 스킵")
-            return coords.copy(), (1.0, 1.0)
+            return self._offset_coordinates(coords.copy(), origin_x, origin_y), (1.0, 1.0)
 
         # macOS에서만 Retina 보정 적용
         # 배율이 1과 다르면 좌표 보정
@@ -111,17 +272,27 @@ class SearchAutomationService:
             adjusted['height'] = int(coords['height'] / scale_y)
             adjusted['center_x'] = int(coords['center_x'] / scale_x)
             adjusted['center_y'] = int(coords['center_y'] / scale_y)
-            return adjusted, (scale_x, scale_y)
+            return self._offset_coordinates(adjusted, origin_x, origin_y), (scale_x, scale_y)
+
+        return self._offset_coordinates(coords.copy(), origin_x, origin_y), (scale_x, scale_y)
 
-        return coords.copy(), (scale_x, scale_y)
+    @staticmethod
+    def _offset_coordinates(coords, origin_x, origin_y):
+        """영역/윈도우 캡처 좌표를 화면 좌표로 이동"""
+        if origin_x or origin_y:
+            coords['x'] += origin_x
+            coords['y'] += origin_y
+            coords['center_x'] += origin_x
+            coords['center_y'] += origin_y
+        return coords
     
-    def find_ui_element(self, element_name, screenshot_path=None, use_dialog_roi=True):
+    def find_ui_element(self, element_name, screenshot=None, use_dialog_roi=True):
         """
         UI 요소 찾기 (OpenCV 템플릿 매칭)
 
         Args:
             element_name: 요소 이름 ('input_field', 'search_button', etc.)
-            screenshot_path: 스크린샷 경로 (None이면 새로 캡처)
+            screenshot: CaptureFrame 또는 스크린샷 경로 (None이면 새로 캡처)
             use_dialog_roi: 대화상자 ROI 내부에서만 검색할지 여부
 
         Returns:
@@ -132,33 +303,40 @@ class SearchAutomationService:
             print(f"Using cached position for '{element_name}'")
             return self.ui_cache[element_name]
 
-        # 스크린샷 캡처
-        if screenshot_path is None:
+        # 스크린샷 캡처 (메모리 프레임, 저장은 백그라운드)
+        if screenshot is None:
             print(f"Capturing screen for '{element_name}'...")
-            screenshot_path = self.capture.capture_full_screen()
-            print(f"Screenshot saved: {screenshot_path}")
+            screenshot = self.capture.grab_full_screen()
+            print(f"Screenshot grabbed: {screenshot}")
 
         # 대화상자 검출 기능 사용
         if self.dialog_detector and use_dialog_roi:
             # 대화상자 경계가 캐시되어 있지 않으면 검출
             if self.dialog_boundary is None:
                 print("\n[대화상자 ROI 기반 검색 모드]")
-                self.dialog_boundary = self.dialog_detector.detect_dialog_boundary(screenshot_path)
+                self.dialog_boundary = self.dialog_detector.detect_dialog_boundary(screenshot)
+                if self.dialog_boundary:
+                    dialog, _ = self._normalize_coordinates(self.dialog_boundary, screenshot)
+                    self.planner.set_region(
+                        'dialog', dialog['x'], dialog['y'], dialog['width'], dialog['height']
+                    )
 
             # 대화상자 내부에서 UI 요소 검색
             if self.dialog_boundary:
                 ui_elements = self.dialog_detector.find_input_fields_in_dialog(
-                    screenshot_path,
+                    screenshot,
                     self.dialog_boundary,
                     self.template_dir
                 )
 
                 if element_name in ui_elements:
                     result = ui_elements[element_name]
-                    normalized, _ = self._normalize_coordinates(result, screenshot_path)
+                    normalized, _ = self._normalize_coordinates(result, screenshot)
 
                     # 캐시 저장
                     self.ui_cache[element_name] = normalized
+                    self._update_result_pane_region()
+                    self._save_ui_cache()
                     return normalized
 
         # 전체 화면 검색 (fallback)
@@ -172,12 +350,12 @@ class SearchAutomationService:
             raise FileNotFoundError(f"Template not found: {template_path}")
 
         # OpenCV 템플릿 매칭
-        result = self.matcher.find_template(screenshot_path, template_path)
+        result = self.matcher.find_template(screenshot, template_path)
 
         if result is None:
-            raise ValueError(f"UI element '{element_name}' not found")
+            raise ElementNotFoundError(f"UI element '{element_name}' not found")
 
-        normalized, scale = self._normalize_coordinates(result, screenshot_path)
+        normalized, scale = self._normalize_coordinates(result, screenshot)
         print(
             f"[MATCH] {element_name} "
             f"top-left=({normalized['x']}, {normalized['y']}) "
@@ -188,9 +366,216 @@ class SearchAutomationService:
 
         # 캐시 저장
         self.ui_cache[element_name] = normalized
+        self._update_result_pane_region()
+        self._save_ui_cache()
 
         return normalized
+
+    def _restore_ui_cache(self):
+        """
+        저장된 UI 좌표 불러오기 (지문이 같고 확인용 요소가 그 자리에 있을 때만)
+
+        Returns:
+            bool: 불러왔으면 True
+        """
+        if self.ui_store is None:
+            return False
+
+        start = time.perf_counter()
+        try:
+            self._ui_fingerprint = self.ui_store.fingerprint(self.capture, self.template_dir)
+            data = self.ui_store.load(self._ui_fingerprint)
+            if not data or not data.get('elements'):
+                return False
+
+            elements = data['elements']
+            check_name = 'input_field' if 'input_field' in elements else next(iter(elements))
+            if self._verify_cached_element(check_name, elements[check_name]) is False:
+                print(f"[UI CACHE] '{check_name}'이(가) 저장된 위치에 없어 캐시를 버립니다.")
+                self.ui_store.clear()
+                return False
+        except Exception as e:
+            print(f"[UI CACHE] 캐시 확인 실패: {e}")
+            return False
+
+        self.ui_cache.update(elements)
+        self.dialog_boundary = data.get('dialog_boundary')
+        for name, rect in data.get('regions', {}).items():
+            self.planner.set_region(name, *rect)
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"[UI CACHE] 저장된 좌표 사용: {', '.join(elements)} ({elapsed:.0f}ms)")
+        return True
+
+    def _save_ui_cache(self):
+        """현재 UI 좌표/대화상자 경계/캡처 영역 저장"""
+        if self.ui_store is None or not self.ui_cache:
+            return
+        try:
+            if self._ui_fingerprint is None:
+                self._ui_fingerprint = self.ui_store.fingerprint(self.capture, self.template_dir)
+            regions = {name: entry['rect'] for name, entry in self.planner.regions.items()}
+            self.ui_store.save(self._ui_fingerprint, self.ui_cache, self.dialog_boundary, regions)
+        except Exception as e:
+            print(f"[UI CACHE] 캐시 저장 실패: {e}")
+
+    def _verify_cached_element(self, element_name, coords, margin=12, tolerance=6):
+        """
+        저장된 좌표 주변만 캡처해서 요소가 그 자리에 있는지 확인
+
+        Args:
+            element_name: 요소 이름 (템플릿 파일 이름)
+            coords: 저장된 화면 좌표
+            margin: 주변 여유 (픽셀)
+            tolerance: 허용 중심 위치 차이 (픽셀)
+
+        Returns:
+            bool or None: 템플릿이 없어 확인할 수 없으면 None
+        """
+        template_path = os.path.join(self.template_dir, f"{element_name}.png")
+        if not os.path.exists(template_path):
+            return None
+
+        found = self._match_near(template_path, coords, margin)
+        return found is not None and (
+            abs(found['center_x'] - coords['center_x']) <= tolerance
+            and abs(found['center_y'] - coords['center_y']) <= tolerance
+        )
+
+    def _match_near(self, template_path, coords, margin):
+        """
+        좌표 주변 영역만 캡처해서 템플릿 매칭
+
+        Returns:
+            dict or None: 화면 좌표 (못 찾으면 None)
+        """
+        screen_w, screen_h = self.capture.get_screen_size()
+        x = max(0, coords['x'] - margin)
+        y = max(0, coords['y'] - margin)
+        width = min(coords['x'] + coords['width'] + margin, screen_w) - x
+        height = min(coords['y'] + coords['height'] + margin, screen_h) - y
+        if width <= 0 or height <= 0:
+            return None
+
+        frame = self.capture.grab_region(x, y, width, height)
+        result = self.local_matcher.find_template(frame, template_path)
+        if result is None:
+            return None
+        found, _ = self._normalize_coordinates(result, frame)
+        return found
+
+    def _update_result_pane_region(self):
+        """
+        대화상자와 조회 조건 요소 위치로 결과 영역 추정
+
+        결과 목록은 대화상자 안에서 입력 필드/검색 버튼 아래쪽에 있으므로
+        그 아래부터 대화상자 하단까지를 결과 영역으로 등록한다.
+        """
+        dialog = self.planner.get_region('dialog')
+        controls = [
+            self.ui_cache[name] for name in ('input_field', 'search_button')
+            if name in self.ui_cache
+        ]
+        if dialog is None or not controls:
+            return
+
+        dialog_x, dialog_y, dialog_w, dialog_h = dialog
+        top = max(coords['y'] + coords['height'] for coords in controls) + 5
+        bottom = dialog_y + dialog_h
+        if bottom - top < 20:
+            return
+
+        self.planner.set_region('result_pane', dialog_x, top, dialog_w, bottom - top)
     
+    def build_input_plan(self, profile=None, focus=True):
+        """
+        한 건 검색의 입력 시퀀스 정의
+
+        Args:
+            profile: 상호작용 프로필 (None이면 서비스 설정값)
+            focus: 입력 필드를 클릭해서 포커스를 맞출지 여부
+
+        Returns:
+            ActionPlan: 입력 필드 초기화 → 주민등록번호 입력 → 검색 (Enter 또는 버튼 클릭)
+        """
+        profile = self.interaction if profile is None else get_profile(profile)
+        select_modifier = 'command' if platform.system() == 'Darwin' else 'ctrl'
+
+        plan = ActionPlan(f'resident_search[{profile.name}{"" if focus else ", focused"}]')
+        if focus:
+            (plan.click('input_field', clicks=3)
+                .sleep(self.automation.delay, pace='click')
+                .sleep(0.1, pace='settle'))
+        (plan.hotkey(select_modifier, 'a')
+            # macOS에서 Command가 간헐적으로 해제되지 않는 문제 대응 (방금 누른 키만 해제)
+            .release_modifiers()
+            .key('backspace')
+            .sleep(0.1, pace='settle')
+            .text('{resident_number}', interval=0.01)
+            # OS가 modifier 눌림을 보고할 때만 전체 해제
+            .release_modifiers(check_os=True)
+            .sleep(0.1, pace='settle'))
+        if profile.uses_search_button:
+            plan.click('search_button').sleep(self.automation.delay, pace='click')
+        else:
+            # 입력 필드의 Enter 바인딩으로 검색 (검색 버튼 탐색/마우스 이동 생략)
+            plan.key(profile.submit_key)
+        # 결과 대기(pace='result')는 입력 lock 밖에서 하도록 계획에 넣지 않음 (_capture_once)
+        return plan
+
+    def _get_input_plan(self):
+        """컴파일된 입력 계획 반환 (포커스가 확인된 뒤에는 입력 필드 클릭 생략)"""
+        focus = self.interaction.refocus == 'every' or not self._focus_confirmed
+        plan = self._input_plans.get(focus)
+        if plan is None:
+            plan = self.build_input_plan(focus=focus).compile(
+                self.find_ui_element,
+                text_entry=self.text_entry
+            )
+            self._input_plans[focus] = plan
+            print(plan.describe())
+        return plan
+
+    def interaction_savings(self):
+        """
+        기존 마우스 방식 대비 건당 예상 절약 시간
+
+        Returns:
+            float: 절약 시간 (초, 대기 시간 기준)
+        """
+        pacer = self.automation.pacer
+        delay_for = pacer.delay_for if pacer is not None else None
+        baseline = self.build_input_plan(profile='mouse').estimate_wait(delay_for)
+        current = self.build_input_plan(focus=self.interaction.refocus == 'every').estimate_wait(delay_for)
+        return baseline - current
+
+    def _read_input_field(self):
+        """입력 필드 영역 grayscale 이미지 (픽셀 방식 입력값 확인용)"""
+        field = self.find_ui_element('input_field')
+        frame = self.capture.grab_region(field['x'], field['y'], field['width'], field['height'])
+        return frame.gray
+
+    def _record_plan_timing(self, run):
+        """입력 계획 소요 시간 누적 (단계별 시간은 profile_steps=True일 때)"""
+        self.plan_stats['runs'] += 1
+        self.plan_stats['seconds'] += run['total']
+        for label, seconds in run['steps']:
+            total, count = self.plan_timings.get(label, (0.0, 0))
+            self.plan_timings[label] = (total + seconds, count + 1)
+
+    def print_plan_timings(self):
+        """입력 계획 평균 소요 시간/조작 방식 절약 시간 출력"""
+        if self.plan_stats['runs']:
+            average = self.plan_stats['seconds'] / self.plan_stats['runs']
+            print(
+                f"[PLAN] 상호작용 프로필={self.interaction.name}: 입력 건당 평균 {average * 1000:.1f}ms, "
+                f"마우스 방식 대비 예상 절약 {self.interaction_savings() * 1000:.0f}ms/건"
+            )
+        if not self.plan_timings:
+            return
+        print("\n[PLAN] 단계별 평균 소요 시간")
+        for label, (total, count) in self.plan_timings.items():
+            print(f"  - {label}: {total / count * 1000:.1f}ms ({count}회)")
+
     def search_resident(self, resident_number):
         """
         주민등록번호 검색
@@ -206,148 +591,657 @@ class SearchAutomationService:
                 'message': 메시지
             }
         """
-        try:            
-            resident_number = '' if resident_number is None else str(resident_number).strip()
-            if not resident_number or resident_number.lower() == 'nan':
-                raise ValueError("주민등록번호가 비어 있습니다.")
+        return self._run_record(resident_number, self._search_once)
 
-            input_field = self.find_ui_element('input_field')
-            
-            self.automation.click(
-                input_field['center_x'],
-                input_field['center_y'],
-                clicks=3
-            )
-            time.sleep(0.1)
-            select_modifier = 'command' if platform.system() == 'Darwin' else 'ctrl'
-            # 혹시 남아있는 modifier가 있으면 입력 전에 해제
-            self._release_modifier_keys()
-            pyautogui.hotkey(select_modifier, 'a')
-            # macOS에서 Command가 간헐적으로 해제되지 않는 문제 대응
-            self._release_modifier_keys()
-            pyautogui.press('backspace')
-            time.sleep(0.1)
-            # 주민등록번호 입력 (타이핑 방식)
-            print(f"[INPUT] 주민등록번호 입력 시도: {resident_number}")
-            self._release_modifier_keys()
-            pyautogui.write(resident_number, interval=0.01)
-            self._release_modifier_keys()
-            print("[INPUT] 입력 완료")
-            time.sleep(0.1)
-            # 검색 버튼 찾기
-            search_button = self.find_ui_element('search_button')
-            
-            # 검색 버튼 클릭
-            self.automation.click(
-                search_button['center_x'],
-                search_button['center_y']
+    def submit_record(self, resident_number):
+        """
+        입력/검색 후 결과 영역 캡처까지만 수행 (분석은 analyze_result에서 따로, 파이프라인용)
+
+        Args:
+            resident_number: 주민등록번호
+
+        Returns:
+            dict: 성공 시 {'resident_number', 'status': 'captured', 'frame'},
+                  실패 시 search_resident와 같은 오류 결과
+        """
+        return self._run_record(resident_number, self._capture_once)
+
+    def _run_record(self, resident_number, step):
+        """한 건 처리 공통 흐름 (캐시 확인, 오류 시 modifier 해제/좌표 보정 후 한 번 재시도)"""
+        resident_number = '' if resident_number is None else str(resident_number).strip()
+        if not resident_number or resident_number.lower() == 'nan':
+            return self.error_result(resident_number, "주민등록번호가 비어 있습니다.", 'invalid_input')
+        self._records_since_check += 1
+        if self.recorder is not None:
+            self.recorder.record_input(resident_number)
+
+        for attempt in range(2):
+            try:
+                if self._should_check_cache():
+                    self._check_cached_elements()
+                return step(resident_number)
+
+            except Exception as e:
+                print(f"Error: {e}")
+                # 입력 도중 실패했으면 눌린 키가 남아있을 수 있으므로 전체 해제
+                with self.input_lock:
+                    self.automation.reset_modifiers()
+                # 포커스를 잃었을 수 있으므로 다음 건은 입력 필드를 다시 클릭
+                self._focus_confirmed = False
+                self.automation.report_pacing(self.PACED_ACTIONS, False)
+
+                # 캐시된 좌표가 틀려서 실패했으면 그 자리에서 고치고 같은 건을 한 번 재시도
+                if attempt == 0 and self._check_cached_elements():
+                    print("[CACHE] 위치가 바뀐 UI 요소를 다시 찾았습니다. 같은 건을 재시도합니다.")
+                    continue
+                self._cache_check_pending = True
+                return self.error_result(resident_number, str(e), self.classify_error(e))
+
+    @staticmethod
+    def error_result(resident_number, message, error_type='unknown'):
+        """
+        오류 결과
+
+        Returns:
+            dict: search_resident 오류 결과 ('error_type'은 ERROR_RECOVERY 키)
+        """
+        return {
+            'resident_number': resident_number,
+            'household_count': 0,
+            'status': 'error',
+            'message': message,
+            'error_type': error_type
+        }
+
+    @staticmethod
+    def classify_error(error):
+        """
+        예외를 오류 유형으로 분류
+
+        Returns:
+            str: ERROR_RECOVERY 키
+        """
+        # pyautogui를 가져오지 않고 확인 (디스플레이 없는 재생 환경)
+        if type(error).__name__ == 'FailSafeException':
+            return 'failsafe'
+        if isinstance(error, FileNotFoundError):
+            return 'template_missing'
+        if isinstance(error, ElementNotFoundError):
+            return 'element_not_found'
+        if isinstance(error, TextEntryError):
+            return 'entry_failed'
+        if isinstance(error, TimeoutError):
+            return 'timeout'
+        if isinstance(error, ScreenStateError):
+            return 'warning'
+        return 'unknown'
+
+    def is_retryable(self, result):
+        """오류 결과를 재시도 대기열에 넣을지 여부"""
+        if result['status'] == 'success':
+            return False
+        return self.ERROR_RECOVERY.get(result.get('error_type', 'unknown')) is not None
+
+    def recover(self, error_type):
+        """
+        재시도 전 오류 유형별 복구
+
+        Args:
+            error_type: ERROR_RECOVERY 키
+
+        Returns:
+            str or None: 실행한 복구 단계
+        """
+        step = self.ERROR_RECOVERY.get(error_type)
+        if step == 'clear_cache':
+            # 화면 배치가 바뀌었다고 보고 대화상자/UI 요소를 처음부터 다시 찾음
+            self.clear_cache()
+        elif step == 'refocus':
+            with self.input_lock:
+                self.automation.reset_modifiers()
+            self._focus_confirmed = False
+        elif step == 'dismiss_warning':
+            # 경고 창의 기본 버튼(확인) 누르기
+            with self.input_lock:
+                self.automation.press_key('enter')
+            self._focus_confirmed = False
+        elif step == 'redetect_dialog':
+            # 팝업 등으로 결과 영역이 가려졌을 수 있으므로 대화상자 경계/캡처 영역만 다시 구함
+            self.dialog_boundary = None
+            self.planner.invalidate()
+            self._focus_confirmed = False
+        if step:
+            print(f"[RETRY] 복구 단계 실행: {error_type} → {step}")
+        return step
+
+    def _search_once(self, resident_number):
+        """입력 계획 실행 → 결과 영역 캡처 → 세대원 수 계산 (실패 시 예외)"""
+        captured = self._capture_once(resident_number)
+        result = self.analyze_result(
+            resident_number, captured['frame'], captured['state'], captured['status_frame']
+        )
+        result['screen_changed'] = captured['changed']
+
+        # 결과가 보이면 현재 대기 시간으로 충분했다는 신호 (0명, 이전 건과 같은 화면은 판단 보류)
+        self.automation.report_pacing(self.PACED_ACTIONS, self.pacing_signal(result))
+        self.last_checkboxes = result['checkboxes']
+        return result
+
+    def _capture_once(self, resident_number):
+        """입력 계획 실행 → 결과 영역 캡처 (실패 시 예외)"""
+        # 레코드 입력 시퀀스 (워크플로당 한 번 컴파일한 동작 계획 실행)
+        print(f"[INPUT] 주민등록번호 입력 시도: {resident_number}")
+        plan = self._get_input_plan()
+        with self.input_lock:
+            run = plan.run(
+                self.automation,
+                {'resident_number': resident_number},
+                timing=self.profile_steps
             )
-            
-            time.sleep(0.1)
-            # 결과 영역 캡처
-            result_screenshot = self.capture.capture_full_screen()
-            # 세대원 수 추출 (이미지 매칭 방식)
-            print("Counting checkboxes with image matching...")
-            household_count = self._count_checkboxes_by_image(result_screenshot)
-            print(f"   Found {household_count} household members (Image Matching)")
-            
-            return {
-                'resident_number': resident_number,
-                'household_count': household_count,
-                'status': 'success',
-                'message': f'Found {household_count} members'
-            }
-            
-        except Exception as e:
-            print(f"Error: {e}")
-            return {
-                'resident_number': resident_number,
-                'household_count': 0,
-                'status': 'error',
-                'message': str(e)
-            }
-    
-    def _count_checkboxes_by_image(self, screenshot_path):
+        self._record_plan_timing(run)
+        self._focus_confirmed = True
+        print(f"[INPUT] 입력 완료 ({run['total'] * 1000:.0f}ms)")
+
+        frame, state, changed = self._wait_for_result()
+        if state == 'no_result':
+            # 결과 영역만 보면 영역 밖에 뜬 경고/모달 창 아래의 빈 결과 영역도 '결과 없음'으로 보임
+            state = self._check_window_state(state)
+        if state == 'warning':
+            raise ScreenStateError("조회 후 경고 창이 표시되었습니다.")
+        return {
+            'resident_number': resident_number,
+            'status': 'captured',
+            'frame': frame,
+            'state': state,
+            'changed': changed,
+            'status_frame': self._capture_status_count(),
+        }
+
+    def _check_window_state(self, state):
         """
-        이미지 매칭으로 체크박스 개수 세기
+        '결과 없음'을 받아들이기 전 대화상자 영역(모르면 창 전체)의 화면 상태 확인
 
         Args:
-            screenshot_path: 스크린샷 파일 경로
+            state: 결과 영역 분류 결과
 
         Returns:
-            int: 체크박스 개수
+            str: 대화상자/창이 경고 예시에 가장 가까우면 'warning', 아니면 state 그대로
+        """
+        classifier = self.window_states
+        if classifier is None:
+            return state
+        if not classifier.has('warning'):
+            if not self._window_hint_shown:
+                print(
+                    "[STATE] 창 전체 경고 예시가 없어 결과 영역 밖 경고 창은 확인하지 않습니다. "
+                    "(tools/label_screen_state.py warning --window, no_result --window로 등록)"
+                )
+                self._window_hint_shown = True
+            return state
+
+        window = self.planner.capture_step('dialog', persist=False)
+        window_state, distance = classifier.classify(screen_signature(window))
+        if window_state == 'warning':
+            print(f"[STATE] 결과 영역은 '결과 없음'이지만 창에 경고 창이 보입니다. (거리 {distance:.3f})")
+            self.capture.persist_frame(window)
+            return 'warning'
+        return state
+
+    def _capture_status_count(self):
+        """
+        상태 표시줄 세대원 수 영역 캡처 (영역은 처음 한 번만 찾음)
+
+        Returns:
+            CaptureFrame or None: 판독기를 쓰지 않거나 영역을 찾지 못하면 None
+        """
+        if self.status_reader is None:
+            return None
+        if self.planner.plan('status') is None and not self._locate_status_count():
+            return None
+        return self.planner.capture_step('status')
+
+    def _locate_status_count(self):
+        """
+        '조회 결과:' 글자(status_label 템플릿) 바로 오른쪽을 숫자 영역(status_bar)으로 등록
+
+        Returns:
+            bool: 등록했으면 True (템플릿이 없거나 찾지 못하면 판독기를 끔)
         """
         try:
-            # 체크박스 템플릿 경로
-            checkbox_template = os.path.join(self.template_dir, 'checkbox.png')
+            label = self.find_ui_element('status_label')
+        except (FileNotFoundError, ElementNotFoundError) as e:
+            print(f"[STATUS] 상태 표시줄을 찾지 못해 체크박스 수만 사용합니다: {e}")
+            self.status_reader = None
+            return False
+
+        # 글자 높이의 4배면 세 자리 숫자와 단위('명')까지 들어감
+        height = label['height'] + 4
+        self.planner.set_region(
+            'status_bar', label['x'] + label['width'], label['y'] - 2, max(40, label['height'] * 4), height
+        )
+        self._save_ui_cache()
+        return self.planner.plan('status') is not None
+
+    def _wait_for_result(self):
+        """
+        검색 결과 표시 대기 후 결과 영역 캡처
+
+        결과 영역을 알면 화면이 바뀌고 더 이상 변하지 않을 때까지만 기다리고
+        (화면 상태 예시가 있으면 조회 중 화면은 건너뛰고 상태 분류),
+        모르면 학습된 고정 시간 대기 후 전체 화면 캡처
+
+        Returns:
+            tuple: (CaptureFrame, 화면 상태 또는 None, 이전 건 결과 화면과 달라졌는지(모르면 None))
+        """
+        pacer = getattr(self.automation, 'pacer', None)
+        fixed_wait = pacer.delay_for('result', 0.1) if pacer is not None else 0.1
+        previous = self._last_result_gray
+        if not self.stabilize or self.planner.plan('result') is None:
+            self.automation.pause('result', 0.1)
+            frame = self.planner.capture_step('result')
+            self._last_result_gray = frame.gray
+            if previous is None or previous.shape != frame.gray.shape:
+                return frame, None, None
+            return frame, None, frames_differ(frame.gray, previous)
+
+        options = {
+            'baseline': self._last_result_gray,
+            # 바뀌지 않은 화면(연속 '결과 없음' 등)은 기존 고정 대기 시간이 지나면 인정
+            'unchanged_after': fixed_wait,
+            'timeout': max(self.result_timeout, fixed_wait * 4),
+        }
+        # 대기 중 캡처는 보관하지 않고 최종으로 받아들인 프레임만 보관 (PNG 저장/링 버퍼/녹화)
+        grab = lambda: self.planner.capture_step('result', persist=False)
+        classifier = self.screen_states
+        if classifier is not None and classifier.exemplars:
+            waited = classifier.wait_for_result(grab, **options)
+        else:
+            waited = wait_until_stable(grab, **options)
+            waited['state'] = None
+        self.wait_stats.record('result', waited)
+        self._last_result_gray = waited['gray']
+        self.capture.persist_frame(waited['frame'])
+
+        detail = f"상태={waited['state']}, " if waited['state'] else ''
+        if waited['timed_out']:
+            print(f"[WAIT] 결과 화면이 {waited['elapsed']:.1f}초 안에 안정되지 않아 마지막 화면으로 진행합니다.")
+        print(
+            f"[WAIT] 결과 화면 {waited['elapsed'] * 1000:.0f}ms 대기 "
+            f"({detail}캡처 {waited['samples']}회{'' if waited['changed'] else ', 변화 없음'})"
+        )
+        return waited['frame'], waited['state'], waited['changed'] if previous is not None else None
+
+    def wait_ready(self, action='between_records', default=0.2):
+        """
+        다음 건 입력 전 대기 (결과 영역이 멈출 때까지만, 학습된 대기 시간이 최대)
 
-            if not os.path.exists(checkbox_template):
-                print(f"체크박스 템플릿이 없습니다: {checkbox_template}")
-                print(f"템플릿 생성 도구를 실행하세요: ./venv/bin/python tools/create_templates.py")
-                return 0
+        결과 영역을 모르거나 안정화 대기를 끈 경우에는 기존 고정 대기
 
-            # 템플릿 매칭으로 모든 체크박스 찾기
-            import cv2
-            import numpy as np
+        Args:
+            action: pacer 동작 유형
+            default: pacer가 없을 때 최대 대기 시간 (초)
+        """
+        if not self.stabilize or self.planner.plan('result') is None:
+            self.automation.pause(action, default)
+            return
+        pacer = getattr(self.automation, 'pacer', None)
+        limit = pacer.delay_for(action, default) if pacer is not None else default
+        waited = wait_until_stable(lambda: self.planner.capture_step('result', persist=False), timeout=limit)
+        self.wait_stats.record(action, waited)
+        # 다음 건의 결과 변화는 지금 화면을 기준으로 판단
+        self._last_result_gray = waited['gray']
 
-            # 이미지 로드
-            screenshot = cv2.imread(screenshot_path)
-            template = cv2.imread(checkbox_template)
+    def analyze_result(self, resident_number, frame, state=None, status_frame=None):
+        """
+        캡처한 결과 영역에서 세대원 수 계산 (GUI 조작 없음, 다른 스레드에서 호출 가능)
 
-            if screenshot is None or template is None:
-                print(f"이미지 로드 실패")
-                return 0
+        Args:
+            resident_number: 주민등록번호
+            frame: 결과 영역 CaptureFrame
+            state: 캡처할 때 분류한 화면 상태 ('no_result'는 체크박스가 없을 때만 0명으로 확정)
+            status_frame: 상태 표시줄 세대원 수 영역 (있으면 체크박스 수와 교차 확인)
 
-            # 그레이스케일 변환
-            screenshot_gray = cv2.cvtColor(screenshot, cv2.COLOR_BGR2GRAY)
-            template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
+        Returns:
+            dict: search_resident 성공 결과
+
+        Raises:
+            Exception: 템플릿/이미지 문제로 분석할 수 없을 때
+        """
+        # 세대원 수 추출 (이미지 매칭 방식)
+        print("Counting checkboxes with image matching...")
+        counted = self._count_checkboxes(frame)
+        household_count = counted['count']
+        print(f"   Found {household_count} household members (Image Matching)")
 
-            # 템플릿 매칭
-            result = cv2.matchTemplate(screenshot_gray, template_gray, cv2.TM_CCOEFF_NORMED)
+        if state == 'no_result':
+            # 화면 상태 분류만 믿고 0명으로 저장하면 캐시/저널에 틀린 값이 남으므로 체크박스 수로 확인
+            if household_count == 0:
+                print("   조회 결과 없음 화면 (체크박스 없음 확인)")
+                return {
+                    'resident_number': resident_number,
+                    'household_count': 0,
+                    'status': 'success',
+                    'message': '조회 결과가 없습니다.',
+                    'checkboxes': []
+                }
+            print(f"[STATE] '결과 없음'으로 분류됐지만 체크박스 {household_count}개가 있어 결과 화면으로 처리합니다.")
+            if self.screen_states is not None:
+                self.screen_states.stats['overruled'] += 1
 
-            # 임계값 이상인 위치 찾기
-            threshold = 0.7  # 70% 이상 일치
-            locations = np.where(result >= threshold)
+        # 체크박스가 보이는 화면은 결과 화면 예시로 학습 (다음 건부터 결과 대기에 사용)
+        if household_count > 0 and self.screen_states is not None:
+            self.screen_states.learn('result', screen_signature(frame))
 
-            print(f"체크박스 매칭 시도 (임계값: {threshold})")
-            print(f"매칭 후보: {len(locations[0])}개")
+        message = f'Found {household_count} members'
+        if status_frame is not None and self.status_reader is not None:
+            checked = self._cross_check_count(status_frame, counted, frame)
+            if checked is not None:
+                household_count, message = checked
 
-            # 중복 제거 (가까운 위치는 하나로 간주)
-            matches = []
-            for pt in zip(*locations[::-1]):
-                # 기존 매치와 너무 가까우면 스킵
-                is_duplicate = False
-                for existing_pt in matches:
-                    distance = np.sqrt((pt[0] - existing_pt[0])**2 + (pt[1] - existing_pt[1])**2)
-                    if distance < 20:  # 20픽셀 이내면 중복
-                        is_duplicate = True
-                        break
+        return {
+            'resident_number': resident_number,
+            'household_count': household_count,
+            'status': 'success',
+            'message': message,
+            'checkboxes': counted['screen_rects']
+        }
 
-                if not is_duplicate:
-                    matches.append(pt)
+    def _cross_check_count(self, status_frame, counted, frame):
+        """
+        상태 표시줄 숫자와 체크박스 수 비교
 
-            count = len(matches)
-            print(f"매칭된 체크박스: {count}개 (임계값: {threshold})")
+        - 같으면 판독 결과 확정 (숫자 뒤 글자 수 기록)
+        - 상태 표시줄이 더 크면 목록이 결과 영역보다 길어 일부 체크박스가 안 보이는 것으로 보고 상태 표시줄 값 사용
+        - 못 읽은 숫자가 있으면 체크박스 수로 숫자 예시 학습 (목록이 잘렸을 수 있으면 학습 안 함)
 
-            return count
+        Returns:
+            tuple or None: (세대원 수, 메시지), 체크박스 수를 그대로 쓰면 None
+        """
+        reader = self.status_reader
+        count = counted['count']
+        read = reader.read(status_frame)
+
+        if read['value'] is None or read['complete'] is False:
+            self.count_check['unread'] += 1
+            if count > 0 and not self._list_may_be_truncated(counted, frame):
+                if reader.learn(status_frame, count):
+                    print(f"[STATUS] 숫자 예시 학습: '{count}' (보유: {reader.known_digits()})")
+                relearned = reader.read(status_frame)
+                if relearned['value'] == count:
+                    reader.confirm(relearned)
+            return None
+
+        print(f"   상태 표시줄: {read['value']}명 ({read['elapsed_ms']:.2f}ms, 거리 {read['distance']:.3f})")
+        if read['value'] == count:
+            self.count_check['agree'] += 1
+            reader.confirm(read)
+            return None
+
+        self.count_check['mismatch'] += 1
+        if read['value'] > count and read['complete']:
+            self.count_check['status_used'] += 1
+            print(f"[STATUS] 체크박스 {count}개 < 상태 표시줄 {read['value']}명: 목록이 잘린 것으로 보고 상태 표시줄 값 사용")
+            return read['value'], f"Found {read['value']} members (status bar, {count} checkboxes visible)"
+
+        print(f"[STATUS] 체크박스 {count}개와 상태 표시줄 {read['value']}명이 다릅니다. 체크박스 수를 사용합니다.")
+        return count, f"Found {count} members (status bar read {read['value']})"
+
+    @staticmethod
+    def _list_may_be_truncated(counted, frame):
+        """마지막 체크박스가 결과 영역 아래 끝 가까이 있으면 아래에 안 보이는 행이 있을 수 있음"""
+        if not counted['rects']:
+            return False
+        _, y, _, h = counted['rects'][-1]
+        return y + h * 3 >= load_gray(frame).shape[0]
 
+    def _should_check_cache(self):
+        """설정한 주기에 따라 이번 건에서 캐시 좌표를 확인할지 결정"""
+        if not self.ui_cache:
+            return False
+        if self._cache_check_pending or self.cache_check == 'every':
+            return True
+        if isinstance(self.cache_check, int) and self.cache_check > 0:
+            return self._records_since_check >= self.cache_check
+        return False
+
+    def _check_cached_elements(self):
+        """
+        캐시된 UI 요소가 그 자리에 있는지 주변 영역 매칭으로 확인하고,
+        없으면 더 넓은 주변 영역에서 다시 찾기 (그래도 없으면 캐시에서 빼서 다음 조회 때 전체 검색)
+
+        Returns:
+            bool: 좌표가 바뀐 요소가 있으면 True
+        """
+        self._cache_check_pending = False
+        self._records_since_check = 0
+        changed = False
+        offset = None
+
+        for element_name, coords in list(self.ui_cache.items()):
+            self.cache_check_stats['checks'] += 1
+            if self._verify_cached_element(element_name, coords) is not False:
+                continue
+
+            self.cache_check_stats['moved'] += 1
+            changed = True
+            relocated = self._local_search(element_name, coords)
+            if relocated is None:
+                print(f"[CACHE] '{element_name}' 주변에서 찾지 못해 전체 검색으로 넘깁니다.")
+                self.cache_check_stats['full_searches'] += 1
+                del self.ui_cache[element_name]
+                continue
+
+            self.cache_check_stats['local_hits'] += 1
+            print(
+                f"[CACHE] '{element_name}' 위치 보정: "
+                f"({coords['center_x']}, {coords['center_y']}) -> "
+                f"({relocated['center_x']}, {relocated['center_y']})"
+            )
+            offset = (relocated['x'] - coords['x'], relocated['y'] - coords['y'])
+            self.ui_cache[element_name] = relocated
+
+        if not changed:
+            return False
+
+        # 윈도우가 통째로 움직였다고 보고 캡처 영역도 같은 만큼 이동
+        if offset is not None:
+            for name, entry in list(self.planner.regions.items()):
+                x, y, w, h = entry['rect']
+                self.planner.set_region(name, x + offset[0], y + offset[1], w, h)
+        else:
+            self.planner.invalidate()
+        self.dialog_boundary = None
+        self._input_plans = {}
+        self._focus_confirmed = False
+        self._save_ui_cache()
+        return True
+
+    def _local_search(self, element_name, coords):
+        """
+        캐시된 좌표 주변(요소 크기의 2배 여유)에서만 요소 다시 찾기
+
+        Returns:
+            dict or None: 화면 좌표 (못 찾으면 None)
+        """
+        template_path = os.path.join(self.template_dir, f"{element_name}.png")
+        if not os.path.exists(template_path):
+            return None
+        margin = max(80, 2 * max(coords['width'], coords['height']))
+        return self._match_near(template_path, coords, margin)
+
+    def _count_checkboxes_by_image(self, screenshot):
+        """
+        이미지 매칭으로 체크박스 개수 세기
+
+        Args:
+            screenshot: CaptureFrame 또는 스크린샷 파일 경로
+
+        Returns:
+            int: 체크박스 개수 (위치는 self.last_checkboxes에 화면 좌표로 저장)
+        """
+        self.last_checkboxes = []
+        try:
+            counted = self._count_checkboxes(screenshot)
+        except FileNotFoundError as e:
+            print(e)
+            print(f"템플릿 생성 도구를 실행하세요: ./venv/bin/python tools/create_templates.py")
+            return 0
         except Exception as e:
             print(f"체크박스 카운팅 오류: {e}")
             import traceback
             traceback.print_exc()
             return 0
 
-    def batch_search(self, resident_numbers, callback=None):
+        self.last_checkboxes = counted['screen_rects']
+        return counted['count']
+
+    def _count_checkboxes(self, screenshot):
+        """
+        체크박스 찾기 (실패 시 예외)
+
+        Returns:
+            dict: CheckboxCounter.count 결과
+        """
+        # 체크박스 템플릿 경로
+        checkbox_template = os.path.join(self.template_dir, 'checkbox.png')
+        if not os.path.exists(checkbox_template):
+            raise FileNotFoundError(f"체크박스 템플릿이 없습니다: {checkbox_template}")
+
+        roi = self._result_roi(screenshot)
+        counted = self._checkbox_counter(self.checkbox_engine, checkbox_template).count(screenshot, roi=roi)
+        print(
+            f"매칭된 체크박스: {counted['count']}개 "
+            f"({self.checkbox_engine}, {counted['elapsed_ms']:.2f}ms)"
+        )
+        self._record_engine_time(self.checkbox_engine, counted['elapsed_ms'])
+
+        if self.compare_checkbox_engines:
+            for engine in self.CHECKBOX_ENGINES:
+                if engine == self.checkbox_engine:
+                    continue
+                other = self._checkbox_counter(engine, checkbox_template).count(screenshot, roi=roi)
+                self._record_engine_time(engine, other['elapsed_ms'])
+                if other['count'] == counted['count']:
+                    self.engine_agreement['agree'] += 1
+                else:
+                    self.engine_agreement['disagree'] += 1
+                    print(f"[CHECKBOX] {self.checkbox_engine} {counted['count']}개 / {engine} {other['count']}개 불일치")
+        return counted
+
+    def _checkbox_counter(self, engine, template_path):
+        """방식별 카운터 (템플릿은 한 번만 읽어서 재사용)"""
+        counter = self.checkbox_counters.get(engine)
+        if counter is None or counter.template_path != template_path:
+            counter = self.checkbox_counters[engine] = self.CHECKBOX_ENGINES[engine](template_path)
+        return counter
+
+    def _record_engine_time(self, engine, elapsed_ms):
+        total, count = self.engine_agreement['ms'].get(engine, (0.0, 0))
+        self.engine_agreement['ms'][engine] = (total + elapsed_ms, count + 1)
+
+    def print_checkbox_stats(self):
+        """체크박스 방식별 평균 소요 시간/일치율 출력"""
+        agreement = self.engine_agreement
+        if not agreement['ms']:
+            return
+        times = ', '.join(
+            f"{engine} {total / count:.2f}ms" for engine, (total, count) in agreement['ms'].items()
+        )
+        compared = agreement['agree'] + agreement['disagree']
+        if compared:
+            print(
+                f"[CHECKBOX] 방식 비교 {compared}건: 일치 {agreement['agree']} "
+                f"({agreement['agree'] / compared * 100:.1f}%), 평균 {times}"
+            )
+        else:
+            print(f"[CHECKBOX] 체크박스 세기 평균: {times}")
+
+    def _result_roi(self, screenshot):
+        """
+        전체 화면 프레임일 때 결과 영역(대화상자 입력 줄 아래)만 검색하도록 픽셀 ROI 계산
+
+        Returns:
+            tuple or None: (x, y, w, h) 프레임 픽셀 좌표 (영역 캡처이거나 결과 영역을 모르면 None)
+        """
+        if not isinstance(screenshot, CaptureFrame) or screenshot.kind == 'region':
+            return None
+        region = self.planner.get_region('result_pane')
+        if region is None:
+            return None
+        x, y, w, h = region
+        scale_x, scale_y = screenshot.scale
+        origin_x, origin_y = screenshot.origin
+        return (
+            int((x - origin_x) * scale_x),
+            int((y - origin_y) * scale_y),
+            int(w * scale_x),
+            int(h * scale_y),
+        )
+
+    def batch_search(self, resident_numbers, callback=None, pipeline=False, max_pending=4,
+                     retry_attempts=3):
         """
         일괄 검색
         
         Args:
             resident_numbers: 주민등록번호 리스트
             callback: 진행 상황 콜백 함수 (index, total, result)
+            pipeline: 결과 분석을 별도 스레드에서 다음 건 입력과 겹쳐 실행할지 여부
+            max_pending: 파이프라인 분석 대기 프레임 최대 수
+            retry_attempts: 실패 건을 본 처리 뒤에 다시 시도할 최대 횟수 (0이면 재시도 안 함)
             
         Returns:
             list: 검색 결과 리스트
         """
+        if pipeline:
+            runner = PipelinedBatchRunner(self, max_pending=max_pending)
+            results = runner.run(resident_numbers, callback=callback)
+        else:
+            results = self._batch_search_sequential(resident_numbers, callback)
+
+        # 실패 건은 본 처리 속도를 떨어뜨리지 않도록 마지막에 복구 단계를 거쳐 재시도
+        retry_queue = DeferredRetryQueue(self, max_attempts=retry_attempts)
+        for index, result in enumerate(results):
+            if result is not None:
+                retry_queue.add(index, result['resident_number'], result)
+        for index, result in retry_queue.run().items():
+            results[index] = result
+
+        self.save_pacing()
+        self.print_plan_timings()
+
+        print(
+            f"[PLAN] 영역 캡처 {self.planner.stats['region_captures']}회, "
+            f"전체 캡처 {self.planner.stats['full_captures']}회, "
+            f"캡처 픽셀 비율 {self.planner.pixel_ratio() * 100:.1f}%"
+        )
+        modifier_stats = self.automation.modifier_stats
+        print(
+            f"[AUTO] modifier 해제 이벤트 {modifier_stats['release_events']}회 "
+            f"({modifier_stats['release_seconds'] * 1000:.1f}ms), "
+            f"전체 해제 {modifier_stats['full_resets']}회"
+        )
+        check_stats = self.cache_check_stats
+        print(
+            f"[CACHE] 좌표 확인 {check_stats['checks']}회, 위치 변경 {check_stats['moved']}회 "
+            f"(주변 재검색 성공 {check_stats['local_hits']}, 전체 검색 {check_stats['full_searches']})"
+        )
+        entry_stats = self.text_entry.stats
+        print(
+            f"[ENTRY] 입력 전략={self.text_entry.strategy} "
+            f"확인 {entry_stats['verified']}/{entry_stats['entries']}건, "
+            f"불일치 {entry_stats['mismatches']}회, 대체 입력 {entry_stats['fallbacks']}회"
+        )
+        latency = self.capture.capture_latency()
+        print(
+            f"[CAPTURE] 백엔드={latency['backend']} 캡처 {latency['count']}회, "
+            f"평균 {latency['mean_ms']:.1f}ms, 최대 {latency['max_ms']:.1f}ms"
+        )
+        
+        return results
+
+    def _batch_search_sequential(self, resident_numbers, callback=None):
+        """한 건씩 입력 → 분석 → 대기 순서로 처리"""
         results = []
         total = len(resident_numbers)
         
@@ -362,14 +1256,71 @@ class SearchAutomationService:
             
             # 다음 검색 전 대기
             if i < total:
-                time.sleep(0.2)
-        
+                self.automation.report_pacing('between_records', self.pacing_signal(result))
+                self.wait_ready('between_records', 0.2)
+
         return results
     
+    @staticmethod
+    def pacing_signal(result):
+        """
+        검색 결과를 pacer 성공 신호로 변환
+
+        결과 영역이 이전 건과 달라진 것을 확인한 경우만 성공으로 봄
+        (이전 사람의 결과 화면을 센 경우도 세대원 수는 0보다 크므로 그것만으로는 성공 판단 불가)
+
+        Returns:
+            bool or None: 성공(True), 실패(False), 판단 불가(None, 0명 결과 또는 화면 변화 미확인)
+        """
+        if result['status'] != 'success':
+            return False
+        if result['household_count'] <= 0 or result.get('screen_changed') is not True:
+            return None
+        return True
+
+    def save_pacing(self):
+        """학습된 대기 시간/화면 상태 예시 저장 및 요약 출력"""
+        if self.window_states is not None:
+            self.window_states.save()
+        if self.screen_states is not None:
+            self.screen_states.save()
+            stats = self.screen_states.stats
+            if stats['waits']:
+                print(
+                    f"[STATE] 결과 대기 {stats['waits']}회, 평균 {stats['wait_seconds'] / stats['waits'] * 1000:.0f}ms "
+                    f"(미분류 {stats['unknown']}/{stats['classified']}, 체크박스로 뒤집힘 {stats['overruled']})"
+                )
+        self.wait_stats.print_summary()
+        self.print_checkbox_stats()
+        if self.status_reader is not None:
+            self.status_reader.save()
+            check = self.count_check
+            if check['agree'] or check['mismatch']:
+                print(
+                    f"[STATUS] 상태 표시줄/체크박스 교차 확인: 일치 {check['agree']}, 불일치 {check['mismatch']} "
+                    f"(상태 표시줄 값 사용 {check['status_used']}), 판독 불가 {check['unread']}"
+                )
+        pacer = getattr(self.automation, 'pacer', None)
+        if pacer is None:
+            return
+        pacer.save()
+        for action, values in pacer.summary().items():
+            print(
+                f"[PACING] {action}: {values['delay'] * 1000:.0f}ms "
+                f"(성공 {values['successes']}, 실패 {values['failures']})"
+            )
+
     def clear_cache(self):
         """UI 위치 캐시 초기화"""
         self.ui_cache.clear()
         self.dialog_boundary = None
+        self.planner.invalidate()
+        self._input_plans = {}
+        self._focus_confirmed = False
+        # 화면 배치가 바뀌었을 수 있으므로 저장된 좌표와 지문도 버림
+        if self.ui_store is not None:
+            self.ui_store.clear()
+        self._ui_fingerprint = None
 
     def get_dialog_boundary(self):
         """
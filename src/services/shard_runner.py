@@ -0,0 +1,305 @@
+"""
+MARK: 다중 윈도우 분할 실행
+한 대의 PC에 띄운 여러 대상 윈도우(타일 배치한 Mock 창 등)에 레코드를 나눠 검색하고
+결과는 입력 순서대로 하나로 모음
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from ..core.automation import GUIAutomation
+from ..core.pacing import PacingController
+from ..core.screen_capture import ScreenCapture
+from ..core.screenshot_store import ScreenshotStore
+from ..core.ui_cache import PersistentUICache
+from ..core.window_geometry import StaticWindowGeometryProvider
+from .search_service import SearchAutomationService
+
+
+@dataclass
+class ShardSpec:
+    """분할 실행 단위 (윈도우 하나)"""
+
+    name: str
+    target_window: str
+    # 창 위치를 알고 있으면 (x, y, width, height) 고정 사용 (직접 띄운 타일 배치 창)
+    rect: Optional[Tuple[int, int, int, int]] = None
+    # 윈도우별로 독립된 입력 드라이버 (None이면 마우스/키보드를 다른 분할과 공유)
+    automation: Any = None
+
+
+class _TimedLock:
+    """lock 대기 시간을 재는 래퍼 (분할마다 하나, 공유 lock을 감쌈)"""
+
+    def __init__(self, lock):
+        self.lock = lock
+        self.wait_seconds = 0.0
+
+    def __enter__(self):
+        start = time.perf_counter()
+        self.lock.acquire()
+        self.wait_seconds += time.perf_counter() - start
+        return self
+
+    def __exit__(self, *exc):
+        self.lock.release()
+        return False
+
+
+class ShardedBatchRunner:
+    """여러 윈도우에 레코드를 나눠 검색하는 일괄 검색기"""
+
+    def __init__(self, shards, template_dir=None, between_default=0.2,
+                 max_consecutive_errors=5, service_options=None):
+        """
+        초기화
+
+        Args:
+            shards: ShardSpec 리스트
+            template_dir: UI 템플릿 디렉토리 (None이면 OS 자동 탐지)
+            between_default: 같은 윈도우에서 다음 건 입력 전 최대 대기 시간 (초, 결과 영역이 멈추면 바로 진행)
+            max_consecutive_errors: 연속 오류가 이만큼 나면 해당 윈도우는 중단 (남은 건은 다른 윈도우가 처리)
+            service_options: SearchAutomationService에 넘길 추가 옵션
+        """
+        if not shards:
+            raise ValueError("분할 실행할 윈도우가 없습니다.")
+        names = [shard.name for shard in shards]
+        if len(set(names)) != len(names):
+            raise ValueError(f"윈도우 이름이 중복되었습니다: {names}")
+
+        self.shards = list(shards)
+        self.template_dir = template_dir
+        self.between_default = between_default
+        self.max_consecutive_errors = max(1, int(max_consecutive_errors))
+        self.service_options = dict(service_options or {})
+
+        # 마우스/키보드는 하나뿐이므로 공유하는 분할은 같은 드라이버(대기 시간 학습 포함)와 lock을 씀
+        self._shared_automation = None
+        self._shared_lock = threading.Lock()
+        # 스크린샷 보관소도 하나만 사용 (분할마다 만들면 같은 디렉토리에 일련번호/용량 한도가 따로 생겨
+        # 같은 밀리초에 저장한 파일 이름이 겹치고 용량 한도가 분할 수만큼 늘어남)
+        self._shared_store = None
+        self.services = {}
+        self.stats = {}
+
+    def build_services(self):
+        """분할별 검색 서비스 생성 (이미 만들었으면 그대로 사용)"""
+        for shard in self.shards:
+            if shard.name not in self.services:
+                self.services[shard.name] = self._build_service(shard)
+        return self.services
+
+    def _build_service(self, shard):
+        options = dict(self.service_options)
+        window_geometry = None
+        if shard.rect is not None:
+            window_geometry = StaticWindowGeometryProvider({shard.target_window: shard.rect})
+        if self._shared_store is None:
+            self._shared_store = ScreenshotStore()
+        capture = ScreenCapture(
+            output_dir=self._shared_store.output_dir,
+            target_window=shard.target_window,
+            store=self._shared_store,
+            backend=options.pop('capture_backend', 'auto'),
+            window_geometry=window_geometry
+        )
+
+        if shard.automation is not None:
+            automation = shard.automation
+            input_lock = _TimedLock(threading.Lock())
+        else:
+            if self._shared_automation is None:
+                pacer = PacingController() if options.pop('adaptive_pacing', True) else None
+                self._shared_automation = GUIAutomation(delay=0.5, pacer=pacer)
+            automation = self._shared_automation
+            input_lock = _TimedLock(self._shared_lock)
+            # 입력 포커스가 윈도우 사이를 오가므로 매 건 입력 필드를 다시 클릭
+            if options.get('interaction') == 'keyboard':
+                options['interaction'] = 'keyboard_refocus'
+        options.pop('adaptive_pacing', None)
+
+        # 윈도우마다 위치가 다르므로 좌표 캐시 파일도 따로 저장
+        slug = re.sub(r'[^0-9A-Za-z_-]+', '_', shard.name)
+        if options.pop('persistent_cache', True):
+            options['persistent_cache'] = PersistentUICache(f"tmp/cache/ui_cache_{slug}.json")
+        else:
+            options['persistent_cache'] = False
+
+        return SearchAutomationService(
+            template_dir=self.template_dir,
+            target_window=shard.target_window,
+            automation=automation,
+            capture=capture,
+            input_lock=input_lock,
+            **options
+        )
+
+    def run(self, resident_numbers, callback=None, should_stop=None):
+        """
+        일괄 검색
+
+        Args:
+            resident_numbers: 주민등록번호 리스트
+            callback: 진행 상황 콜백 (index, total, result), 입력 순서대로 호출
+            should_stop: should_stop() -> True면 진행 중인 건만 마치고 멈춤
+
+        Returns:
+            list: 입력과 같은 길이의 검색 결과 (각 결과에 처리한 윈도우 이름 'shard' 포함,
+                중지해서 처리하지 못한 건은 None, 건너뛴 건 때문에 뒤 결과가 앞으로 당겨지지 않음)
+        """
+        services = self.build_services()
+        total = len(resident_numbers)
+        results = [None] * total
+        pending = deque(range(total))
+        state = {'next_emit': 0}
+        lock = threading.Lock()
+        self.stats = {
+            shard.name: {
+                'records': 0, 'errors': 0, 'busy_seconds': 0.0, 'retired': False,
+                'exceptions': 0, 'last_exception': None
+            }
+            for shard in self.shards
+        }
+
+        def take():
+            with lock:
+                if not pending or (should_stop and should_stop()):
+                    return None
+                return pending.popleft()
+
+        def give_back(index):
+            with lock:
+                pending.appendleft(index)
+
+        def finish(index, result):
+            # 앞에서부터 이어진 결과만 순서대로 콜백 호출
+            with lock:
+                results[index] = result
+                while state['next_emit'] < total and results[state['next_emit']] is not None:
+                    if callback:
+                        callback(state['next_emit'] + 1, total, results[state['next_emit']])
+                    state['next_emit'] += 1
+
+        start = time.perf_counter()
+        threads = [
+            threading.Thread(
+                target=self._shard_loop,
+                args=(shard, services[shard.name], resident_numbers, take, give_back, finish),
+                name=f"shard-{shard.name}",
+                daemon=True
+            )
+            for shard in self.shards
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        # 모든 윈도우가 중단되어 남은 건은 오류로 기록
+        for index in pending:
+            if should_stop and should_stop():
+                break
+            finish(index, {
+                'resident_number': resident_numbers[index],
+                'household_count': 0,
+                'status': 'error',
+                'message': '처리할 수 있는 윈도우가 없습니다.',
+                'shard': None
+            })
+
+        self._save_pacing(services)
+        finished = sum(result is not None for result in results)
+        self._print_stats(finished, elapsed)
+        return results
+
+    def _shard_loop(self, shard, service, resident_numbers, take, give_back, finish):
+        """윈도우 하나의 처리 루프 (입력 계획만 lock 안에서, 결과 대기/캡처/분석은 다른 윈도우와 겹쳐 실행)"""
+        stats = self.stats[shard.name]
+        consecutive_errors = 0
+        first = True
+        index = None
+
+        try:
+            while True:
+                index = take()
+                if index is None:
+                    return
+
+                busy_start = time.perf_counter()
+                try:
+                    if not first:
+                        service.wait_ready('between_records', self.between_default)
+                    result = service.search_resident(resident_numbers[index])
+                except Exception as e:
+                    # 한 건의 예상하지 못한 예외는 오류 결과로 기록하고 연속 오류 규칙으로 처리
+                    print(f"[SHARD] {shard.name}: {resident_numbers[index]} 처리 중 예외 ({type(e).__name__}: {e})")
+                    self._record_exception(stats, e)
+                    result = {
+                        'resident_number': resident_numbers[index],
+                        'household_count': 0,
+                        'status': 'error',
+                        'message': f"처리 중 예외: {e}",
+                    }
+                first = False
+                stats['busy_seconds'] += time.perf_counter() - busy_start
+
+                if result['status'] != 'success':
+                    consecutive_errors += 1
+                    if consecutive_errors >= self.max_consecutive_errors:
+                        # 윈도우가 닫히거나 가려졌을 가능성: 이 건은 다른 윈도우에 넘기고 중단
+                        print(f"[SHARD] {shard.name}: 연속 오류 {consecutive_errors}회, 이 윈도우는 중단합니다.")
+                        stats['retired'] = True
+                        give_back(index)
+                        return
+                else:
+                    consecutive_errors = 0
+
+                stats['records'] += 1
+                stats['errors'] += result['status'] != 'success'
+                service.automation.report_pacing('between_records', service.pacing_signal(result))
+                finished, index = index, None
+                finish(finished, dict(result, shard=shard.name))
+        except Exception as e:
+            # 스레드가 조용히 끝나면 잡고 있던 건이 처리되지 않으므로 다른 윈도우에 넘기고 중단
+            print(f"[SHARD] {shard.name}: 처리 루프 예외로 중단합니다. ({type(e).__name__}: {e})")
+            self._record_exception(stats, e)
+            stats['retired'] = True
+            if index is not None:
+                give_back(index)
+
+    @staticmethod
+    def _record_exception(stats, error):
+        stats['exceptions'] += 1
+        stats['last_exception'] = f"{type(error).__name__}: {error}"
+
+    def _save_pacing(self, services):
+        """학습된 대기 시간 저장 (같은 드라이버는 한 번만)"""
+        saved = set()
+        for service in services.values():
+            if id(service.automation) in saved:
+                continue
+            saved.add(id(service.automation))
+            service.save_pacing()
+
+    def _print_stats(self, finished, elapsed):
+        if not finished or elapsed <= 0:
+            return
+        print(
+            f"\n[SHARD] 윈도우 {len(self.shards)}개, {finished}건 {elapsed:.2f}초 "
+            f"(초당 {finished / elapsed:.2f}건, 건당 {elapsed / finished * 1000:.0f}ms)"
+        )
+        for name, stats in self.stats.items():
+            lock_wait = self.services[name].input_lock.wait_seconds
+            exceptions = f", 예외 {stats['exceptions']}회" if stats['exceptions'] else ''
+            print(
+                f"  - {name}: {stats['records']}건 (오류 {stats['errors']}), "
+                f"가동률 {stats['busy_seconds'] / elapsed * 100:.0f}%, "
+                f"입력 장치 대기 {lock_wait:.2f}초"
+                f"{exceptions}"
+                f"{', 중단됨' if stats['retired'] else ''}"
+            )
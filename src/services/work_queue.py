@@ -0,0 +1,422 @@
+"""
+MARK: 공유 폴더 작업 큐
+서버 없이 공유 디렉토리 하나로 여러 PC가 입력 레코드를 나눠 처리.
+청크 파일을 pending → leased로 원자적 이름 변경(rename)해서 가져가고,
+만료 시각이 파일 이름에 들어 있어 멈춘 PC의 청크는 다른 PC가 다시 가져감
+
+디렉토리 구조:
+    <root>/manifest.json          청크 수/크기, 입력 파일
+    <root>/pending/c00001.json    처리 대기 청크 (레코드 목록)
+    <root>/leased/c00001@<작업자>@<만료 epoch>.json
+    <root>/done/c00001.json       처리 완료 청크 (결과 행 목록)
+"""
+
+import json
+import os
+import platform
+import shutil
+import socket
+import time
+import uuid
+from dataclasses import dataclass
+
+from .batch_pipeline import PipelinedBatchRunner
+from .retry_queue import DeferredRetryQueue
+
+
+def default_worker_id():
+    """작업자 ID (호스트명-프로세스 ID, 파일 이름에 쓸 수 있는 문자만)"""
+    host = socket.gethostname() or platform.node() or 'unknown'
+    safe_host = ''.join(ch if ch.isalnum() or ch in '-_' else '_' for ch in host)
+    return f"{safe_host}-{os.getpid()}"
+
+
+def _to_json(value):
+    # pandas/numpy 값 (순번 등) 변환
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+@dataclass
+class Lease:
+    """가져간 청크"""
+
+    chunk: str
+    path: str
+    expires: float
+    records: list
+    lost: bool = False
+    start: int = 0  # 청크 첫 레코드의 입력 전체 기준 위치 (순번이 없는 입력의 행 번호용)
+
+
+class LeaseQueue:
+    """rename 기반 임대(lease) 작업 큐"""
+
+    def __init__(self, root, worker_id=None, lease_seconds=600):
+        """
+        초기화 (이미 만들어진 큐에 참여, 새로 만들 때는 create 사용)
+
+        Args:
+            root: 공유 디렉토리 경로
+            worker_id: 작업자 ID (None이면 호스트명-PID)
+            lease_seconds: 임대 유지 시간 (초, 이 시간 안에 갱신하지 않으면 다른 PC가 가져감)
+        """
+        self.root = root
+        self.worker_id = worker_id or default_worker_id()
+        if '@' in self.worker_id:
+            raise ValueError(f"작업자 ID에 '@'를 쓸 수 없습니다: {self.worker_id}")
+        self.lease_seconds = lease_seconds
+        self.pending_dir = os.path.join(root, 'pending')
+        self.leased_dir = os.path.join(root, 'leased')
+        self.done_dir = os.path.join(root, 'done')
+        self.manifest = self._read_json(os.path.join(root, 'manifest.json'))
+
+    @classmethod
+    def create(cls, root, records, chunk_size=50, source=None, **kwargs):
+        """
+        입력 레코드를 청크로 나눠 큐 생성 (이미 있으면 기존 큐에 참여)
+
+        임시 디렉토리에 모두 쓴 뒤 디렉토리 이름을 바꿔서 만들므로,
+        여러 PC가 동시에 만들어도 하나만 반영되고 반쯤 만들어진 큐는 보이지 않음
+
+        Args:
+            root: 공유 디렉토리 경로
+            records: ExcelService.read_residents 결과
+            chunk_size: 청크당 레코드 수
+            source: 입력 파일 경로 (manifest 기록용)
+
+        Returns:
+            LeaseQueue
+        """
+        if os.path.exists(os.path.join(root, 'manifest.json')):
+            print(f"[QUEUE] 기존 큐에 참여합니다: {root}")
+            return cls(root, **kwargs)
+
+        chunk_size = max(1, int(chunk_size))
+        parent = os.path.dirname(os.path.abspath(root))
+        os.makedirs(parent, exist_ok=True)
+        staging = os.path.join(parent, f".{os.path.basename(root)}.{uuid.uuid4().hex}")
+        for name in ('pending', 'leased', 'done'):
+            os.makedirs(os.path.join(staging, name))
+
+        chunks = []
+        for start in range(0, len(records), chunk_size):
+            chunk = f"c{len(chunks) + 1:05d}"
+            cls._write_json(os.path.join(staging, 'pending', f"{chunk}.json"), {
+                'chunk': chunk,
+                'start': start,
+                'records': records[start:start + chunk_size],
+            })
+            chunks.append(chunk)
+        cls._write_json(os.path.join(staging, 'manifest.json'), {
+            'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'source': source,
+            'total': len(records),
+            'chunk_size': chunk_size,
+            'chunks': chunks,
+        })
+
+        try:
+            os.rename(staging, root)
+            print(f"[QUEUE] 큐 생성: {root} ({len(records)}건, 청크 {len(chunks)}개)")
+        except OSError as e:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.exists(os.path.join(root, 'manifest.json')):
+                # 권한 없음, 공유 폴더 연결 끊김, 빈 곳이 아닌 같은 이름의 디렉토리 등
+                raise OSError(f"큐 디렉토리를 만들 수 없습니다: {root} ({e})") from e
+            # 다른 PC가 먼저 만들었음
+            print(f"[QUEUE] 기존 큐에 참여합니다: {root}")
+        return cls(root, **kwargs)
+
+    def claim(self):
+        """
+        처리할 청크 하나 가져오기 (만료된 임대는 먼저 회수)
+
+        Returns:
+            Lease or None: 가져갈 청크가 없으면 None
+
+        Raises:
+            OSError: 청크 파일이 그대로 있는데 rename이 실패했을 때
+                (공유 폴더 연결 끊김/읽기 전용 등, 다른 PC가 가져간 경우와 구분할 수 없으므로 중단)
+        """
+        self.reclaim_expired()
+        for name in sorted(os.listdir(self.pending_dir)):
+            if not name.endswith('.json'):
+                continue
+            chunk = name[:-len('.json')]
+            expires = time.time() + self.lease_seconds
+            leased_path = self._leased_path(chunk, expires)
+            pending_path = os.path.join(self.pending_dir, name)
+            try:
+                os.rename(pending_path, leased_path)
+            except (FileNotFoundError, PermissionError):
+                # 다른 PC가 먼저 가져감 (Windows 공유 폴더는 사용 중인 파일 rename이 PermissionError)
+                continue
+            except OSError as e:
+                # 네트워크 공유의 EBUSY/ESTALE 등: 파일이 사라졌으면 다른 PC가 가져간 것
+                if not os.path.exists(pending_path):
+                    continue
+                raise OSError(f"청크 {chunk}를 가져올 수 없습니다: {pending_path} ({e})") from e
+
+            if os.path.exists(self._done_path(chunk)):
+                # 완료 후 임대가 만료되어 다시 나온 청크
+                self._remove(leased_path)
+                continue
+            data = self._read_json(leased_path)
+            print(f"[QUEUE] 청크 {chunk} 가져옴 ({len(data['records'])}건)")
+            return Lease(
+                chunk=chunk, path=leased_path, expires=expires, records=data['records'],
+                start=int(data.get('start', 0))
+            )
+        return None
+
+    def renew(self, lease, min_remaining=None):
+        """
+        임대 연장 (남은 시간이 min_remaining보다 많으면 그대로 둠)
+
+        Args:
+            lease: Lease
+            min_remaining: 이 시간(초)보다 적게 남았을 때만 연장 (None이면 임대 시간의 절반)
+
+        Returns:
+            bool: 임대 유지 여부 (False면 다른 PC가 회수해 감)
+        """
+        if lease.lost:
+            return False
+        if min_remaining is None:
+            min_remaining = self.lease_seconds / 2
+        if lease.expires - time.time() > min_remaining:
+            return True
+
+        expires = time.time() + self.lease_seconds
+        new_path = self._leased_path(lease.chunk, expires)
+        try:
+            os.rename(lease.path, new_path)
+        except FileNotFoundError:
+            print(f"[QUEUE] 청크 {lease.chunk} 임대가 만료되어 다른 작업자에게 넘어갔습니다.")
+            lease.lost = True
+            return False
+        lease.path = new_path
+        lease.expires = expires
+        return True
+
+    def complete(self, lease, rows):
+        """
+        청크 처리 결과 저장 후 임대 반납
+
+        임대를 잃었더라도 결과는 저장 (먼저 끝낸 결과가 남고, 같은 청크를 다시 처리한 결과로 덮어써도 내용은 같음)
+
+        Args:
+            lease: Lease
+            rows: 결과 행 목록 (청크 레코드 순서)
+        """
+        self._write_json(self._done_path(lease.chunk), {
+            'chunk': lease.chunk,
+            'worker': self.worker_id,
+            'completed': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'rows': rows,
+        })
+        self._remove(lease.path)
+        print(f"[QUEUE] 청크 {lease.chunk} 완료 ({len(rows)}건)")
+
+    def release(self, lease):
+        """처리하지 못한 청크를 대기열로 되돌림"""
+        if lease.lost:
+            return
+        try:
+            os.rename(lease.path, os.path.join(self.pending_dir, f"{lease.chunk}.json"))
+        except FileNotFoundError:
+            pass
+        lease.lost = True
+
+    def reclaim_expired(self):
+        """
+        만료된 임대를 대기열로 되돌림
+
+        Returns:
+            int: 회수한 청크 수
+        """
+        now = time.time()
+        reclaimed = 0
+        for name in os.listdir(self.leased_dir):
+            parsed = self._parse_leased(name)
+            if parsed is None:
+                continue
+            chunk, worker, expires = parsed
+            if expires > now:
+                continue
+            try:
+                os.rename(
+                    os.path.join(self.leased_dir, name),
+                    os.path.join(self.pending_dir, f"{chunk}.json")
+                )
+            except FileNotFoundError:
+                # 원래 작업자가 연장/완료했거나 다른 PC가 먼저 회수함
+                continue
+            print(f"[QUEUE] 만료된 청크 {chunk} 회수 (작업자 {worker})")
+            reclaimed += 1
+        return reclaimed
+
+    def status(self):
+        """
+        진행 상황
+
+        Returns:
+            dict: {'total', 'pending', 'leased', 'done'} (청크 수)
+        """
+        done = {name[:-len('.json')] for name in os.listdir(self.done_dir) if name.endswith('.json')}
+        leased = {
+            parsed[0] for parsed in map(self._parse_leased, os.listdir(self.leased_dir))
+            if parsed is not None and parsed[0] not in done
+        }
+        pending = {
+            name[:-len('.json')] for name in os.listdir(self.pending_dir)
+            if name.endswith('.json') and name[:-len('.json')] not in done
+        }
+        return {
+            'total': len(self.manifest['chunks']),
+            'pending': len(pending),
+            'leased': len(leased),
+            'done': len(done),
+        }
+
+    def is_complete(self):
+        return self.status()['done'] >= len(self.manifest['chunks'])
+
+    def merge(self):
+        """
+        완료된 청크 결과를 입력 순서대로 합침
+
+        Returns:
+            list: 결과 행 목록
+
+        Raises:
+            RuntimeError: 아직 끝나지 않은 청크가 있을 때
+        """
+        rows = []
+        missing = []
+        for chunk in self.manifest['chunks']:
+            path = self._done_path(chunk)
+            if not os.path.exists(path):
+                missing.append(chunk)
+                continue
+            rows.extend(self._read_json(path)['rows'])
+        if missing:
+            raise RuntimeError(f"완료되지 않은 청크가 있습니다: {', '.join(missing[:10])}")
+        return rows
+
+    def _leased_path(self, chunk, expires):
+        return os.path.join(self.leased_dir, f"{chunk}@{self.worker_id}@{int(expires)}.json")
+
+    def _done_path(self, chunk):
+        return os.path.join(self.done_dir, f"{chunk}.json")
+
+    @staticmethod
+    def _parse_leased(name):
+        """임대 파일 이름 → (청크, 작업자, 만료 epoch), 형식이 다르면 None"""
+        if not name.endswith('.json'):
+            return None
+        parts = name[:-len('.json')].split('@')
+        if len(parts) != 3:
+            return None
+        try:
+            return parts[0], parts[1], int(parts[2])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _read_json(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json(path, data):
+        # 같은 디렉토리에 임시 파일로 쓴 뒤 교체 (다른 PC가 반쯤 쓴 파일을 읽지 않도록)
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=_to_json)
+        os.replace(temp_path, path)
+
+
+def run_queue_worker(queue, service, poll_interval=10.0, between_default=1.0):
+    """
+    큐가 빌 때까지 청크를 가져와 검색하고 결과 저장
+
+    Args:
+        queue: LeaseQueue
+        service: SearchAutomationService
+        poll_interval: 다른 작업자가 처리 중인 청크만 남았을 때 확인 간격 (초, 만료 임대 회수용)
+        between_default: 다음 건 입력 전 기본 대기 시간 (초)
+
+    Returns:
+        int: 이 작업자가 완료한 청크 수
+    """
+    completed = 0
+    while True:
+        lease = queue.claim()
+        if lease is None:
+            status = queue.status()
+            if status['done'] >= status['total']:
+                print(f"[QUEUE] 모든 청크 완료 (이 작업자 {completed}개)")
+                return completed
+            print(f"[QUEUE] 다른 작업자가 처리 중: 대기 {status['pending']}, 처리 중 {status['leased']}, "
+                  f"완료 {status['done']}/{status['total']}")
+            time.sleep(poll_interval)
+            continue
+
+        records = lease.records
+        jobs = [i for i, record in enumerate(records) if str(record.get('주민등록번호') or '').strip()]
+        runner = PipelinedBatchRunner(service, between_default=between_default)
+        try:
+            searched = runner.run(
+                [str(records[i]['주민등록번호']).strip() for i in jobs],
+                # 처리 중 임대 연장 (연장 실패 = 다른 작업자가 가져감, 이 청크는 중단)
+                callback=lambda index, total, result: queue.renew(lease),
+                should_stop=lambda: lease.lost
+            )
+            # 결과는 jobs와 같은 위치 (임대를 잃어 중지했으면 처리하지 못한 건은 None)
+            unfinished = any(result is None for result in searched)
+            if not lease.lost and not unfinished:
+                # 실패 건은 청크 마지막에 복구 단계를 거쳐 재시도
+                retry_queue = DeferredRetryQueue(service)
+                for position, result in enumerate(searched):
+                    retry_queue.add(position, result['resident_number'], result)
+                retried = retry_queue.run(
+                    callback=lambda position, result: queue.renew(lease),
+                    should_stop=lambda: lease.lost
+                )
+                for position, result in retried.items():
+                    searched[position] = result
+        except Exception:
+            queue.release(lease)
+            raise
+
+        if lease.lost or unfinished:
+            # 청크 단위로만 완료 기록 (다른 작업자가 가져갔거나 남은 건이 있으면 청크째 다시 처리)
+            queue.release(lease)
+            continue
+
+        by_position = dict(zip(jobs, searched))
+        rows = []
+        for i, record in enumerate(records):
+            result = by_position.get(i)
+            rows.append({
+                # 순번 열이 없으면 청크 안 위치가 아닌 입력 전체 기준 번호 (청크마다 1부터 겹치지 않도록)
+                '순번': record.get('순번', lease.start + i + 1),
+                '주민등록번호': record.get('주민등록번호', ''),
+                '이름': record.get('이름', ''),
+                '세대원 수': result['household_count'] if result else 0,
+                '상태': '완료' if result and result['status'] == 'success' else '오류',
+                '메시지': result['message'] if result else '주민등록번호가 비어 있습니다.',
+            })
+        queue.complete(lease, rows)
+        completed += 1
+        service.save_pacing()
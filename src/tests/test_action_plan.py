@@ -0,0 +1,134 @@
+"""
+동작 계획 테스트 (컴파일 시 좌표 한 번 해석, 실행 순서, 조건 대기, 대기 시간 추정)
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from src.core.action_plan import ActionPlan
+
+
+class RecordingAutomation:
+    """실행한 동작을 기록하는 자동화 객체"""
+
+    def __init__(self):
+        self.calls = []
+        self.global_pause = True
+
+    @contextmanager
+    def no_global_pause(self):
+        self.global_pause = False
+        try:
+            yield
+        finally:
+            self.global_pause = True
+
+    def click(self, x, y, clicks=1, delay=None):
+        self.calls.append(('click', x, y, clicks, self.global_pause))
+
+    def hotkey(self, *keys, delay=None):
+        self.calls.append(('hotkey',) + keys)
+
+    def press_key(self, key, delay=None):
+        self.calls.append(('key', key))
+
+    def type_text(self, text, interval=0.0, delay=None):
+        self.calls.append(('type', text))
+
+    def pause(self, action, default):
+        self.calls.append(('pause', action, default))
+
+    def release_modifiers(self):
+        self.calls.append(('release',))
+
+    def ensure_modifiers_released(self):
+        self.calls.append(('release_os',))
+
+
+class StubTextEntry:
+    def __init__(self):
+        self.entered = []
+
+    def enter(self, text, interval=0.0):
+        self.entered.append(text)
+
+
+def search_plan():
+    return (
+        ActionPlan('search')
+        .click('input_field', clicks=3)
+        .hotkey('ctrl', 'a')
+        .text('{resident_number}')
+        .sleep(0.2, pace='settle')
+        .key('enter')
+        .release_modifiers(check_os=True)
+    )
+
+
+def test_compile_resolves_each_target_once():
+    resolved = []
+
+    def resolver(name):
+        resolved.append(name)
+        return {'center_x': 10, 'center_y': 20}
+
+    plan = ActionPlan('twice').click('input_field').click('input_field').click('search_button')
+    compiled = plan.compile(resolver)
+
+    assert resolved == ['input_field', 'search_button']
+    assert '@ (10, 20)' in compiled.describe()
+
+
+def test_run_executes_steps_in_order_without_global_pause():
+    automation = RecordingAutomation()
+    compiled = search_plan().compile(lambda name: {'center_x': 5, 'center_y': 7})
+
+    run = compiled.run(automation, {'resident_number': '900101-1234567'}, timing=True)
+
+    assert automation.calls == [
+        ('click', 5, 7, 3, False),
+        ('hotkey', 'ctrl', 'a'),
+        ('type', '900101-1234567'),
+        ('pause', 'settle', 0.2),
+        ('key', 'enter'),
+        ('release_os',),
+    ]
+    assert [label for label, _ in run['steps']][0] == '01 click input_field x3'
+    assert compiled.run_count == 1
+
+
+def test_text_entry_engine_replaces_typing():
+    automation = RecordingAutomation()
+    text_entry = StubTextEntry()
+    compiled = ActionPlan('entry').text('{resident_number}').compile(lambda name: None, text_entry=text_entry)
+
+    compiled.run(automation, {'resident_number': '900101-1234567'})
+
+    assert text_entry.entered == ['900101-1234567']
+    assert automation.calls == []
+
+
+def test_wait_condition_must_be_bound_and_times_out():
+    plan = ActionPlan('wait').wait_for('ready', timeout=0.05)
+    with pytest.raises(ValueError):
+        plan.compile(lambda name: None)
+
+    compiled = plan.compile(lambda name: None, conditions={'ready': lambda params: False})
+    with pytest.raises(TimeoutError):
+        compiled.run(RecordingAutomation())
+
+    polls = []
+    compiled = plan.compile(lambda name: None, conditions={'ready': lambda params: polls.append(1) or len(polls) > 2})
+    compiled.run(RecordingAutomation())
+    assert len(polls) == 3
+
+
+def test_estimate_wait_uses_learned_delays():
+    plan = ActionPlan('sleeps').sleep(0.3).sleep(0.2, pace='settle').key('enter')
+
+    assert plan.estimate_wait() == pytest.approx(0.5)
+    assert plan.estimate_wait(lambda pace, default: 0.05) == pytest.approx(0.35)
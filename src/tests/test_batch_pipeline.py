@@ -0,0 +1,89 @@
+"""
+파이프라인 일괄 검색 테스트 (결과 위치 유지, 분석 실패 재입력)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.services.batch_pipeline import PipelinedBatchRunner
+from src.services.search_service import SearchAutomationService
+
+
+class StubAutomation:
+    def report_pacing(self, actions, success):
+        pass
+
+
+class StubService:
+    """캡처 단계는 바로 끝나고 분석에서 주민등록번호 끝자리를 세대원 수로 돌려주는 서비스"""
+
+    PACED_ACTIONS = SearchAutomationService.PACED_ACTIONS
+    error_result = staticmethod(SearchAutomationService.error_result)
+    classify_error = staticmethod(lambda error: 'unknown')
+
+    def __init__(self, capture_errors=(), analysis_failures=None):
+        self.automation = StubAutomation()
+        self.capture_errors = set(capture_errors)
+        self.analysis_failures = dict(analysis_failures or {})
+        self.submitted = []
+
+    def submit_record(self, resident_number):
+        self.submitted.append(resident_number)
+        if resident_number in self.capture_errors:
+            return self.error_result(resident_number, "capture failed")
+        return {'resident_number': resident_number, 'status': 'captured', 'frame': None}
+
+    def analyze_result(self, resident_number, frame, state=None, status_frame=None):
+        if self.analysis_failures.get(resident_number, 0) > 0:
+            self.analysis_failures[resident_number] -= 1
+            raise ValueError("analysis failed")
+        return {
+            'resident_number': resident_number,
+            'household_count': int(resident_number[-1]),
+            'status': 'success',
+            'message': 'ok',
+            'checkboxes': [],
+        }
+
+    def wait_ready(self, action, default):
+        pass
+
+    def pacing_signal(self, result):
+        return None
+
+
+def test_results_keep_input_positions():
+    numbers = [f"90010{i}" for i in range(8)]
+    service = StubService(capture_errors={numbers[3]}, analysis_failures={numbers[5]: 1})
+
+    results = PipelinedBatchRunner(service, max_pending=2).run(numbers)
+
+    assert [r['resident_number'] for r in results] == numbers
+    assert results[3]['status'] == 'error'
+    assert results[5]['status'] == 'success'
+    assert service.submitted.count(numbers[5]) == 2
+
+
+def test_stop_leaves_none_in_place():
+    numbers = [f"90010{i}" for i in range(6)]
+    service = StubService()
+
+    results = PipelinedBatchRunner(service).run(
+        numbers, should_stop=lambda: len(service.submitted) >= 3
+    )
+
+    assert len(results) == len(numbers)
+    assert [r['resident_number'] for r in results[:3]] == numbers[:3]
+    assert results[3:] == [None, None, None]
+
+
+def test_callback_runs_in_input_order():
+    numbers = [f"90010{i}" for i in range(5)]
+    seen = []
+
+    PipelinedBatchRunner(StubService(), max_pending=3).run(
+        numbers, callback=lambda index, total, result: seen.append((index, result['resident_number']))
+    )
+
+    assert seen == [(i + 1, rn) for i, rn in enumerate(numbers)]
@@ -0,0 +1,91 @@
+"""
+체크박스 카운터 테스트 (템플릿 매칭 + NMS, 연결 요소 방식, 실제 화면 캡처)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import cv2
+import numpy as np
+import pytest
+
+from src.core.checkbox_counter import CheckboxCounter, ComponentCheckboxCounter
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+REAL_SCREEN = os.path.join(PROJECT_ROOT, 'data', 'templates', 'img_org.png')
+REAL_CHECKBOX = os.path.join(PROJECT_ROOT, 'data', 'templates', 'templates_real', 'checkbox.png')
+
+
+def draw_checkbox(image, x, y, size=14):
+    cv2.rectangle(image, (x, y), (x + size - 1, y + size - 1), 60, 1)
+
+
+@pytest.fixture
+def template_path(tmp_path):
+    template = np.full((18, 18), 240, dtype=np.uint8)
+    draw_checkbox(template, 2, 2)
+    path = str(tmp_path / 'checkbox.png')
+    cv2.imwrite(path, template)
+    return path
+
+
+def result_pane(rows=(20, 50, 80, 110), text=True):
+    """체크박스 줄과 옆의 글자 ('0'은 크기가 비슷한 글자)"""
+    image = np.full((140, 200), 240, dtype=np.uint8)
+    for y in rows:
+        draw_checkbox(image, 12, y)
+        if text:
+            cv2.putText(image, '0 ABC', (40, y + 12), cv2.FONT_HERSHEY_SIMPLEX, 0.45, 60, 1)
+    return image
+
+
+@pytest.mark.parametrize('counter_class', [CheckboxCounter, ComponentCheckboxCounter])
+def test_counts_checkboxes_top_to_bottom(template_path, counter_class):
+    counted = counter_class(template_path).count(result_pane())
+
+    assert counted['count'] == 4
+    assert [rect[1] for rect in counted['rects']] == sorted(rect[1] for rect in counted['rects'])
+    assert all(abs(rect[0] - 10) <= 1 for rect in counted['rects'])
+    assert counted['screen_rects'] == counted['rects']
+
+
+@pytest.mark.parametrize('counter_class', [CheckboxCounter, ComponentCheckboxCounter])
+def test_roi_limits_search_and_keeps_image_coordinates(template_path, counter_class):
+    counted = counter_class(template_path).count(result_pane(), roi=(0, 40, 200, 60))
+
+    assert counted['count'] == 2
+    assert [rect[1] for rect in counted['rects']] == [48, 78]
+
+
+@pytest.mark.parametrize('counter_class', [CheckboxCounter, ComponentCheckboxCounter])
+def test_empty_pane_has_no_checkboxes(template_path, counter_class):
+    assert counter_class(template_path).count(result_pane(rows=()))['count'] == 0
+
+
+def test_nms_keeps_one_peak_per_checkbox(template_path):
+    counter = CheckboxCounter(template_path, threshold=0.5)
+    counted = counter.count(result_pane(text=False))
+
+    assert counted['count'] == 4
+    assert all(score >= 0.5 for score in counted['scores'])
+
+
+def test_template_is_reloaded_when_file_changes(template_path):
+    counter = CheckboxCounter(template_path)
+    first = counter.template
+    assert counter.template is first
+
+    larger = np.full((22, 22), 240, dtype=np.uint8)
+    draw_checkbox(larger, 2, 2, size=18)
+    cv2.imwrite(template_path, larger)
+    os.utime(template_path, (0, os.path.getmtime(template_path) + 10))
+    assert counter.template.shape == (22, 22)
+
+
+@pytest.mark.skipif(not os.path.exists(REAL_SCREEN), reason='실제 화면 캡처 없음')
+def test_components_on_real_capture():
+    counted = ComponentCheckboxCounter(REAL_CHECKBOX).count(REAL_SCREEN)
+
+    assert counted['count'] == 5
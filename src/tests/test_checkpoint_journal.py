@@ -0,0 +1,83 @@
+"""
+진행 기록 저널 테스트 (추가/다시 읽기/이어서 하기에서 건너뛸 건)
+"""
+
+import json
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.services.checkpoint_journal import CheckpointJournal
+
+
+def make_row(number, resident_number, status='완료', message='ok'):
+    return {
+        '순번': number, '주민등록번호': resident_number, '이름': f"이름{number}",
+        '세대원 수': 1 if status == '완료' else 0, '상태': status, '메시지': message,
+    }
+
+
+def test_append_and_reload_in_input_order(tmp_path):
+    journal = CheckpointJournal(str(tmp_path / 'out' / 'result.journal.jsonl'))
+    journal.append(make_row(2, '900101-1000002'))
+    journal.append(make_row(1, '900101-1000001'))
+    journal.close()
+
+    records = [{'순번': 1, '주민등록번호': '900101-1000001'}, {'순번': 2, '주민등록번호': '900101-1000002'},
+               {'순번': 3, '주민등록번호': '900101-1000003'}]
+    rows = CheckpointJournal(journal.path).rows_for(records)
+
+    assert [row['순번'] for row in rows] == [1, 2]
+    assert all(CheckpointJournal.FINAL_KEY not in row for row in rows)
+
+
+def test_errors_are_retried_on_resume(tmp_path):
+    journal = CheckpointJournal(str(tmp_path / 'result.journal.jsonl'))
+    journal.append(make_row(1, '900101-1000001'))
+    journal.append(make_row(2, '900101-1000002', '오류', 'timeout'))
+    journal.append(make_row(3, '', '오류', '주민등록번호가 비어 있습니다.'), final=True)
+    journal.append(make_row(4, '900101-1000004', '오류', '잘못된 주민등록번호'), final=True)
+    journal.close()
+
+    done = journal.load(finished_only=True)
+    assert set(done) == {('1', '900101-1000001'), ('3', ''), ('4', '900101-1000004')}
+    assert len(journal.load()) == 4
+
+    # 다시 처리해서 성공하면 나중 줄이 우선
+    journal.append(make_row(2, '900101-1000002'))
+    journal.close()
+    assert journal.load(finished_only=True)[('2', '900101-1000002')]['상태'] == '완료'
+
+
+def test_rows_without_final_flag_use_status(tmp_path):
+    path = tmp_path / 'result.journal.jsonl'
+    lines = [make_row(1, '900101-1000001'), make_row(2, '900101-1000002', '오류'), make_row(3, '', '오류')]
+    path.write_text(''.join(json.dumps(row, ensure_ascii=False) + '\n' for row in lines), encoding='utf-8')
+
+    done = CheckpointJournal(str(path)).load(finished_only=True)
+
+    assert set(done) == {('1', '900101-1000001'), ('3', '')}
+
+
+def test_partial_last_line_is_ignored_and_terminated(tmp_path):
+    path = tmp_path / 'result.journal.jsonl'
+    path.write_text(json.dumps(make_row(1, '900101-1000001')) + '\n{"순번": 2, "주민', encoding='utf-8')
+
+    journal = CheckpointJournal(str(path))
+    assert list(journal.load()) == [('1', '900101-1000001')]
+
+    journal.append(make_row(2, '900101-1000002'))
+    journal.close()
+    assert list(journal.load()) == [('1', '900101-1000001'), ('2', '900101-1000002')]
+
+
+def test_key_uses_position_without_number_column(tmp_path):
+    journal = CheckpointJournal(str(tmp_path / 'result.journal.jsonl'))
+    journal.append(make_row(3, '900101-1000003'))
+    journal.close()
+
+    records = [{'주민등록번호': '900101-1000001'}, {'주민등록번호': 'nan'}, {'주민등록번호': ' 900101-1000003 '}]
+    done = journal.load(finished_only=True)
+
+    assert [CheckpointJournal.key(record, i) in done for i, record in enumerate(records, 1)] == [False, False, True]
+    assert CheckpointJournal.key(records[1], 2) == ('2', '')
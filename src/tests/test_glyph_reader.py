@@ -0,0 +1,78 @@
+"""
+상태 표시줄 숫자 판독 테스트 (글자 나누기, 학습 후 읽기, 숫자 뒤 글자, 저장/불러오기)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import cv2
+import numpy as np
+
+from src.core.glyph_reader import GlyphDigitReader, segment_glyphs
+
+
+def render(text, dark_background=False):
+    """밝은 배경에 검은 글자 (dark_background면 반대)"""
+    image = np.full((30, 20 + 22 * len(text)), 255, dtype=np.uint8)
+    cv2.putText(image, text, (6, 23), cv2.FONT_HERSHEY_SIMPLEX, 0.8, 0, 2)
+    return 255 - image if dark_background else image
+
+
+def trained_reader():
+    reader = GlyphDigitReader(app_name='test', path='')
+    assert reader.learn(render('1234567890'), 1234567890)
+    return reader
+
+
+def test_segment_glyphs_splits_digits_and_skips_blank_area():
+    _, boxes = segment_glyphs(render('305'))
+    assert len(boxes) == 3
+    assert [box[0] for box in boxes] == sorted(box[0] for box in boxes)
+
+    assert segment_glyphs(np.full((30, 60), 200, dtype=np.uint8)) == (None, [])
+
+
+def test_read_learned_digits():
+    reader = trained_reader()
+    assert reader.known_digits() == '0123456789'
+
+    read = reader.read(render('305'))
+    assert read['value'] == 305
+    assert read['unknown'] == 0
+    assert read['complete'] is None
+    assert reader.read(render('47', dark_background=True))['value'] == 47
+
+
+def test_suffix_glyphs_are_confirmed_and_checked():
+    reader = trained_reader()
+
+    read = reader.read(render('42M'))
+    assert read['value'] == 42 and read['unknown'] == 1
+    reader.confirm(read)
+    assert reader.read(render('7M'))['complete'] is True
+    assert reader.read(render('7MM'))['complete'] is False
+
+
+def test_unreadable_without_examples():
+    reader = GlyphDigitReader(app_name='test', path='')
+
+    read = reader.read(render('12'))
+    assert read['value'] is None
+    assert reader.stats['unreadable'] == 1
+    # 글자 수가 값보다 적으면 학습하지 않음
+    assert not reader.learn(render('1'), 12)
+
+
+def test_save_and_load_per_app(tmp_path):
+    path = str(tmp_path / 'glyphs' / 'host.json')
+    reader = GlyphDigitReader(app_name='app1', path=path)
+    reader.learn(render('1234567890'), 1234567890)
+    reader.confirm(reader.read(render('5M')))
+    reader.save()
+
+    loaded = GlyphDigitReader(app_name='app1', path=path)
+    assert loaded.known_digits() == '0123456789'
+    assert loaded.suffix_glyphs == 1
+    assert loaded.read(render('86'))['value'] == 86
+    assert GlyphDigitReader(app_name='app2', path=path).known_digits() == ''
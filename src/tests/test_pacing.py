@@ -0,0 +1,92 @@
+"""
+적응형 동작 간격 조절 테스트 (성공 시 감소, 실패 시 증가, 하한, 저장/불러오기)
+"""
+
+import json
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from src.core.pacing import PacingController
+
+
+def make_pacer(**kwargs):
+    options = dict(path=False, success_streak=2, autosave_every=0)
+    options.update(kwargs)
+    return PacingController(**options)
+
+
+def test_success_streak_tightens_down_to_baseline_fraction():
+    pacer = make_pacer()
+    assert pacer.delay_for('click', 0.4) == 0.4
+
+    pacer.report('click', True)
+    assert pacer.delay_for('click', 0.4) == 0.4
+    pacer.report('click', True)
+    assert pacer.delay_for('click', 0.4) == pytest.approx(0.4 * 0.85)
+
+    for _ in range(100):
+        pacer.report('click', True)
+    assert pacer.delay_for('click', 0.4) == pytest.approx(0.2)
+
+
+def test_failure_backs_off_and_remembers_floor():
+    pacer = make_pacer(min_fraction=0.0)
+    pacer.delay_for('result', 0.2)
+
+    pacer.report(('result',), False)
+    assert pacer.delay_for('result', 0.2) == pytest.approx(0.4)
+    assert pacer.summary()['result']['floor'] == pytest.approx(0.24)
+
+    # 연속 성공으로 줄어도 실패했던 값 위의 하한 아래로는 내려가지 않음
+    for _ in range(20):
+        pacer.report('result', True)
+    assert pacer.delay_for('result', 0.2) >= 0.2
+
+
+def test_backoff_is_capped_and_none_is_ignored():
+    pacer = make_pacer(max_delay=1.0)
+    pacer.delay_for('key', 0.6)
+
+    pacer.report('key', None)
+    assert pacer.summary()['key']['failures'] == 0
+    for _ in range(3):
+        pacer.report('key', False)
+    assert pacer.delay_for('key', 0.6) == 1.0
+
+
+def test_save_and_load_round_trip(tmp_path):
+    path = str(tmp_path / 'pacing' / 'host.json')
+    pacer = make_pacer(path=path)
+    pacer.delay_for('click', 0.5)
+    pacer.report('click', False)
+    pacer.save()
+
+    assert [name for name in os.listdir(tmp_path / 'pacing')] == ['host.json']
+    loaded = make_pacer(path=path)
+    assert loaded.summary()['click']['failures'] == 1
+    assert loaded.delay_for('click', 0.5) == pytest.approx(1.0)
+
+
+def test_loaded_delay_without_baseline_is_raised_to_lower_bound(tmp_path):
+    # 하한 없이 줄어든 이전 버전 학습값
+    path = tmp_path / 'old.json'
+    path.write_text(json.dumps({'actions': {'settle': {'delay': 0.01}}}), encoding='utf-8')
+
+    pacer = make_pacer(path=str(path))
+
+    assert pacer.delay_for('settle', 0.3) == pytest.approx(0.15)
+
+
+def test_autosave_after_reports(tmp_path):
+    path = tmp_path / 'auto.json'
+    pacer = make_pacer(path=str(path), autosave_every=3)
+    pacer.delay_for('click', 0.5)
+
+    pacer.report('click', True)
+    pacer.report('click', True)
+    assert not path.exists()
+    pacer.report('click', True)
+    assert path.exists()
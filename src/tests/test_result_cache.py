@@ -0,0 +1,76 @@
+"""
+조회 결과 캐시 테스트 (HMAC 비밀키, 유효 기간, 중복 묶기)
+"""
+
+import json
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.services.result_cache import ResultCache, dedupe_resident_numbers, normalize_resident_number
+
+
+def success(count):
+    return {'resident_number': '', 'household_count': count, 'status': 'success', 'message': 'ok'}
+
+
+def test_put_get_and_reload_without_plain_number(tmp_path):
+    path = str(tmp_path / 'cache' / 'result_cache.json')
+    cache = ResultCache(path)
+    assert cache.put('900101-1234567', success(3))
+    cache.save()
+
+    text = open(path, encoding='utf-8').read()
+    assert '9001011234567' not in text and '900101-1234567' not in text
+    assert os.path.exists(str(tmp_path / 'cache' / 'result_cache.key'))
+
+    # 하이픈 유무와 관계없이 같은 항목
+    entry = ResultCache(path).get('9001011234567')
+    assert entry['household_count'] == 3
+    assert ResultCache(path).lookup_result('9001011234567', entry)['source'] == 'cache'
+
+
+def test_hash_depends_on_installation_key(tmp_path):
+    path = str(tmp_path / 'result_cache.json')
+    cache = ResultCache(path)
+    cache.put('900101-1234567', success(2))
+    cache.save()
+
+    # 캐시 파일만 다른 설치로 옮기면 (키가 다르면) 찾을 수 없음
+    other = ResultCache(path, key_path=str(tmp_path / 'other.key'))
+    assert other.get('900101-1234567') is None
+    assert other.stats['misses'] == 1
+    assert open(tmp_path / 'other.key', 'rb').read() != open(tmp_path / 'result_cache.key', 'rb').read()
+
+
+def test_expired_entries_are_ignored_and_pruned(tmp_path):
+    path = str(tmp_path / 'result_cache.json')
+    cache = ResultCache(path, ttl_days=1)
+    cache.put('900101-1234567', success(2))
+    cache.put('900101-2234567', success(4))
+    key = cache._hash('900101-1234567')
+    cache._load()[key]['checked'] = time.time() - 2 * 86400
+
+    assert cache.get('900101-1234567') is None
+    assert cache.stats['expired'] == 1
+    assert cache.get('900101-2234567')['household_count'] == 4
+
+    cache.save()
+    with open(path, encoding='utf-8') as f:
+        assert key not in json.load(f)['entries']
+
+
+def test_only_positive_successes_are_stored(tmp_path):
+    cache = ResultCache(str(tmp_path / 'result_cache.json'))
+
+    assert not cache.put('900101-1234567', success(0))
+    assert not cache.put('900101-1234567', dict(success(3), status='error'))
+    assert ResultCache(str(tmp_path / 'disabled.json'), ttl_days=0).get('900101-1234567') is None
+
+
+def test_dedupe_groups_by_digits_in_first_seen_order():
+    numbers = ['900101-1234567', '800101-1234567', '9001011234567', ' 900101-1234567 ']
+
+    assert normalize_resident_number(' 900101-1234567 ') == '9001011234567'
+    assert dedupe_resident_numbers(numbers) == [('900101-1234567', [0, 2, 3]), ('800101-1234567', [1])]
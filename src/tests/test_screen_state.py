@@ -0,0 +1,84 @@
+"""
+화면 상태 분류 테스트 ('결과 없음' 확정 전 창 전체 경고 확인)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from src.core.screen_state import ScreenStateClassifier, screen_signature
+from src.services.search_service import SearchAutomationService
+
+
+def dialog_image(modal=False):
+    """밝은 대화상자, modal이면 가운데 어두운 경고 창"""
+    image = np.full((120, 200), 230, dtype=np.uint8)
+    image[10:30, 10:190] = 120  # 입력 필드 줄
+    if modal:
+        image[40:100, 50:150] = 40
+    return image
+
+
+class StubPlanner:
+    def __init__(self, image):
+        self.image = image
+        self.steps = []
+
+    def capture_step(self, step, persist=True):
+        self.steps.append(step)
+        return self.image
+
+
+class StubCapture:
+    def __init__(self):
+        self.persisted = []
+
+    def persist_frame(self, frame):
+        self.persisted.append(frame)
+
+
+def make_service(image, labeled=True):
+    service = object.__new__(SearchAutomationService)
+    service.window_states = ScreenStateClassifier(app_name='test:window', path='')
+    if labeled:
+        service.window_states.learn('no_result', screen_signature(dialog_image()))
+        service.window_states.learn('warning', screen_signature(dialog_image(modal=True)))
+    service.planner = StubPlanner(image)
+    service.capture = StubCapture()
+    service._window_hint_shown = False
+    return service
+
+
+def test_warning_outside_result_pane_overrules_no_result():
+    service = make_service(dialog_image(modal=True))
+
+    assert service._check_window_state('no_result') == 'warning'
+    assert service.planner.steps == ['dialog']
+    assert len(service.capture.persisted) == 1
+
+
+def test_plain_dialog_keeps_no_result():
+    service = make_service(dialog_image())
+
+    assert service._check_window_state('no_result') == 'no_result'
+    assert service.capture.persisted == []
+
+
+def test_without_warning_examples_window_is_not_captured():
+    service = make_service(dialog_image(modal=True), labeled=False)
+
+    assert service._check_window_state('no_result') == 'no_result'
+    assert service.planner.steps == []
+    assert service._window_hint_shown
+
+
+def test_classifier_threshold_and_nearest_state():
+    classifier = ScreenStateClassifier(app_name='test', path='')
+    classifier.learn('no_result', screen_signature(dialog_image()))
+    classifier.learn('warning', screen_signature(dialog_image(modal=True)))
+
+    assert classifier.classify(screen_signature(dialog_image()))[0] == 'no_result'
+    assert classifier.classify(screen_signature(np.zeros((120, 200), dtype=np.uint8)))[0] is None
+    assert classifier.stats['unknown'] == 1
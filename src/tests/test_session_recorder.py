@@ -0,0 +1,67 @@
+"""
+세션 녹화/재생 테스트 (건별 입력 기록, 요청하지 않은 프레임 건너뛰기)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+from PIL import Image
+
+from src.core.capture_backends import ReplayBackend
+from src.core.capture_planner import CapturePlanner
+from src.core.screen_capture import ScreenCapture
+from src.core.session_recorder import ReplayAutomation, SessionRecorder, SessionReplayer
+
+
+def solid(value):
+    return Image.fromarray(np.full((120, 160, 3), value, dtype=np.uint8))
+
+
+def test_resident_numbers_come_from_record_events_only(tmp_path):
+    archive = str(tmp_path / 'session.zip')
+    automation = ReplayAutomation()
+    recorder = SessionRecorder(archive)
+    recorder.attach(automation=automation)
+
+    # 입력 전략 측정/혼합 입력/재입력이 섞인 동작 기록
+    recorder.record_input('9001011234567')
+    for _ in range(3):
+        automation.type_text('9001011234567')
+    automation.paste_text('900101123456')
+    automation.type_text('7')
+    recorder.record_input('8502022345678')
+    automation.paste_text('8502022345678')
+    recorder.close()
+
+    replayer = SessionReplayer(archive)
+    assert replayer.resident_numbers() == ['9001011234567', '8502022345678']
+    assert len(replayer.actions()) == 6
+
+
+def test_replay_skips_frames_of_unrequested_steps(tmp_path):
+    archive = str(tmp_path / 'session.zip')
+    capture = ScreenCapture(
+        output_dir=str(tmp_path / 'shots'), persist_mode='none',
+        backend=ReplayBackend([solid(v) for v in range(0, 200, 20)])
+    )
+    planner = CapturePlanner(capture)
+    planner.set_region('result_pane', 0, 0, 100, 50)
+    planner.set_region('status_bar', 0, 60, 40, 10)
+    recorder = SessionRecorder(archive)
+    recorder.attach(capture=capture)
+
+    recorded = []
+    for _ in range(3):
+        recorded.append(int(np.asarray(planner.capture_step('result').image)[0, 0, 0]))
+        planner.capture_step('status')
+        # 보관하지 않는 캡처(안정화 대기 중간 프레임)는 녹화되지 않음
+        planner.capture_step('result', persist=False)
+    recorder.close()
+
+    backend = SessionReplayer(archive).capture_backend()
+    replayed = [int(np.asarray(backend.grab((0, 0, 100, 50)))[0, 0, 0]) for _ in range(3)]
+
+    assert replayed == recorded
+    assert backend.skipped == {'status': 2}
@@ -0,0 +1,98 @@
+"""
+다중 윈도우 분할 실행 테스트 (결과 위치 유지, 분할 스레드 예외 처리)
+"""
+
+import os
+import sys
+import threading
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.services.shard_runner import ShardedBatchRunner, ShardSpec
+
+
+class StubAutomation:
+    def report_pacing(self, actions, success):
+        pass
+
+
+class StubService:
+    """주민등록번호 끝자리를 세대원 수로 돌려주는 검색 서비스"""
+
+    def __init__(self, fail=(), raise_on=(), on_search=None):
+        self.automation = StubAutomation()
+        self.fail = set(fail)
+        self.raise_on = set(raise_on)
+        self.on_search = on_search
+
+    def wait_ready(self, action, default):
+        pass
+
+    def search_resident(self, resident_number):
+        if self.on_search:
+            self.on_search(resident_number)
+        if resident_number in self.raise_on:
+            raise RuntimeError("boom")
+        status = 'error' if resident_number in self.fail else 'success'
+        return {
+            'resident_number': resident_number,
+            'household_count': int(resident_number[-1]),
+            'status': status,
+            'message': status,
+        }
+
+    def pacing_signal(self, result):
+        return None
+
+    def save_pacing(self):
+        pass
+
+
+def make_runner(services, **kwargs):
+    runner = ShardedBatchRunner([ShardSpec(name, name) for name in services], **kwargs)
+    runner.services = dict(services)
+    runner._print_stats = lambda finished, elapsed: None
+    return runner
+
+
+def test_results_keep_input_positions():
+    runner = make_runner({'w1': StubService(), 'w2': StubService()})
+    numbers = [f"90010{i}" for i in range(10)]
+
+    results = runner.run(numbers)
+
+    assert [result['resident_number'] for result in results] == numbers
+
+
+def test_stopped_run_leaves_gaps_in_place():
+    stop = threading.Event()
+    numbers = [f"90010{i}" for i in range(6)]
+    service = StubService(on_search=lambda rn: rn == numbers[2] and stop.set())
+    runner = make_runner({'w1': service})
+
+    results = runner.run(numbers, should_stop=stop.is_set)
+
+    assert len(results) == len(numbers)
+    assert [r['resident_number'] for r in results[:3]] == numbers[:3]
+    assert results[3:] == [None, None, None]
+
+
+def test_shard_exception_becomes_error_result():
+    numbers = ['900101', '900102', '900103']
+    runner = make_runner({'w1': StubService(raise_on={'900102'})})
+
+    results = runner.run(numbers)
+
+    assert [r['status'] for r in results] == ['success', 'error', 'success']
+    assert runner.stats['w1']['exceptions'] == 1
+
+
+def test_retired_shard_hands_records_to_other_shard():
+    numbers = [f"90010{i}" for i in range(6)]
+    broken = StubService(fail=set(numbers))
+    runner = make_runner({'broken': broken, 'ok': StubService()}, max_consecutive_errors=1)
+
+    results = runner.run(numbers)
+
+    assert all(result is not None for result in results)
+    assert runner.stats['broken']['retired']
+    assert [r['resident_number'] for r in results] == numbers
@@ -0,0 +1,91 @@
+"""
+화면 안정화 대기 테스트 (변화 후 안정, 변화 없는 화면, accept, 시간 초과)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import numpy as np
+
+from src.core.stabilizer import WaitStats, frames_differ, wait_until_stable
+
+
+def screen(value, block=None):
+    image = np.full((40, 60), value, dtype=np.uint8)
+    if block is not None:
+        image[10:30, 10:30] = block
+    return image
+
+
+class Sequence:
+    """미리 정한 화면을 차례로 돌려주고 끝나면 마지막 화면을 반복"""
+
+    def __init__(self, images):
+        self.images = list(images)
+        self.grabs = 0
+
+    def __call__(self):
+        image = self.images[min(self.grabs, len(self.images) - 1)]
+        self.grabs += 1
+        return image
+
+
+def test_frames_differ_ignores_small_and_faint_changes():
+    base = screen(200)
+    cursor = base.copy()
+    cursor[0:2, 0:5] = 0  # 10픽셀 (커서 깜빡임)
+    faint = base + 20
+
+    assert not frames_differ(cursor, base)
+    assert not frames_differ(faint, base)
+    assert frames_differ(screen(200, block=0), base)
+    assert frames_differ(base, None)
+    assert frames_differ(base, np.zeros((10, 10), dtype=np.uint8))
+
+
+def test_waits_for_change_then_two_equal_samples():
+    baseline = screen(200)
+    grab = Sequence([baseline, baseline, screen(200, block=50), screen(200, block=0), screen(200, block=0)])
+
+    waited = wait_until_stable(grab, baseline=baseline, timeout=2.0, interval=0)
+
+    assert waited['changed'] and not waited['timed_out']
+    assert grab.grabs == 5
+    assert waited['gray'][15, 15] == 0
+
+
+def test_unchanged_screen_is_accepted_after_fixed_wait():
+    baseline = screen(200, block=0)
+    grab = Sequence([baseline])
+
+    waited = wait_until_stable(grab, baseline=baseline, unchanged_after=0.0, timeout=2.0, interval=0)
+
+    assert not waited['changed'] and not waited['timed_out']
+    assert waited['samples'] == 2
+
+
+def test_accept_keeps_waiting_and_timeout_returns_last_frame():
+    grab = Sequence([screen(200, block=0)])
+    rejected = []
+
+    waited = wait_until_stable(
+        grab, timeout=0.05, interval=0.005, accept=lambda gray: rejected.append(gray) and False
+    )
+
+    assert waited['timed_out']
+    assert rejected
+    assert waited['frame'] is grab.images[0]
+
+
+def test_wait_stats_summary():
+    stats = WaitStats()
+    stats.record('result', {'elapsed': 0.1, 'timed_out': False, 'changed': True})
+    stats.record('result', {'elapsed': 0.3, 'timed_out': False, 'changed': False})
+    stats.record('result', {'elapsed': 3.0, 'timed_out': True, 'changed': False})
+
+    summary = stats.summary()['result']
+    assert summary['count'] == 3
+    assert abs(summary['average'] - 3.4 / 3) < 1e-9
+    assert summary['max'] == 3.0
+    assert (summary['timeouts'], summary['unchanged']) == (1, 1)
@@ -0,0 +1,176 @@
+"""
+텍스트 입력 전략 엔진 테스트 (입력 유실 감지 / 다른 방식으로 재입력)
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from src.core.text_entry import TextEntryEngine, TextEntryError
+from src.services.result_cache import normalize_resident_number
+
+
+class StubAutomation:
+    """입력 필드 흉내 (lost_strategies의 입력은 필드에 반영되지 않음)"""
+
+    def __init__(self, lost_writes=(), clipboard=True):
+        self.field = ''
+        self.lost_writes = set(lost_writes)
+        self.clipboard = clipboard
+        self.writes = []
+
+    def type_text(self, text, interval=0.05, delay=None):
+        self.writes.append(('type', text))
+        if 'type' not in self.lost_writes:
+            self.field += text
+
+    def paste_text(self, text, delay=None):
+        self.writes.append(('paste', text))
+        if 'paste' not in self.lost_writes:
+            self.field += text
+
+    def copy_selection(self, timeout=0.3):
+        if not self.clipboard:
+            return None
+        return self.field
+
+    def hotkey(self, *keys, delay=None):
+        pass
+
+    def release_modifiers(self):
+        return 0
+
+    def press_key(self, key, delay=None):
+        if key == 'backspace':
+            self.field = ''
+
+
+def make_engine(automation, strategy='type', **kwargs):
+    kwargs.setdefault('verify_every', 1)
+    return TextEntryEngine(
+        automation, strategy=strategy, path='', settle=0,
+        normalize=normalize_resident_number, **kwargs
+    )
+
+
+def test_lost_write_falls_back_to_next_strategy():
+    automation = StubAutomation(lost_writes={'type'})
+    engine = make_engine(automation)
+
+    result = engine.enter('9001011234567')
+
+    assert result['verified'] is True
+    assert result['strategy'] == 'paste'
+    assert result['attempts'] == 2
+    assert automation.field == '9001011234567'
+    assert engine.stats['mismatches'] == 1
+    assert engine.stats['fallbacks'] == 1
+
+
+def test_all_strategies_lost_raises():
+    automation = StubAutomation(lost_writes={'type', 'paste'})
+    engine = make_engine(automation)
+
+    with pytest.raises(TextEntryError):
+        engine.enter('9001011234567')
+
+
+def test_reformatted_field_matches_digits():
+    automation = StubAutomation()
+    engine = make_engine(automation)
+    automation.type_text = lambda text, interval=0.05, delay=None: setattr(
+        automation, 'field', '900101-1234567'
+    )
+
+    assert engine.enter('9001011234567')['verified'] is True
+
+
+def test_masked_field_is_unverified_not_mismatch():
+    automation = StubAutomation()
+    engine = make_engine(automation)
+    automation.copy_selection = lambda timeout=0.3: '900101-1******'
+
+    result = engine.enter('9001011234567')
+
+    assert result['verified'] is None
+    assert result['attempts'] == 1
+
+
+def test_missing_clipboard_is_unverified():
+    engine = make_engine(StubAutomation(clipboard=False))
+
+    assert engine.enter('9001011234567')['verified'] is None
+
+
+def test_verification_is_sampled():
+    automation = StubAutomation()
+    engine = make_engine(automation, verify_every=10)
+    copies = []
+    original = automation.copy_selection
+    automation.copy_selection = lambda timeout=0.3: copies.append(1) or original()
+
+    for _ in range(20):
+        automation.field = ''
+        engine.enter('9001011234567')
+
+    assert len(copies) == 2
+
+
+class FakeClipboard:
+    """pyperclip 대체 (복사 단축키가 아무것도 복사하지 못하는 빈 필드 흉내)"""
+
+    PyperclipException = RuntimeError
+
+    def __init__(self, available=True):
+        self.available = available
+        self.text = 'stale'
+
+    def copy(self, text):
+        if not self.available:
+            raise self.PyperclipException("no clipboard backend")
+        self.text = text
+
+    def paste(self):
+        return self.text
+
+
+class FakePyAutoGUI:
+    def hotkey(self, *keys, **kwargs):
+        pass
+
+    def keyUp(self, key, **kwargs):
+        pass
+
+
+def make_gui_automation(monkeypatch, clipboard):
+    from src.core import automation as automation_module
+
+    monkeypatch.setattr(automation_module, 'pyperclip', clipboard)
+    monkeypatch.setattr(automation_module, 'pyautogui', FakePyAutoGUI())
+    gui = object.__new__(automation_module.GUIAutomation)
+    gui._action_listeners = []
+    gui._held_modifiers = set()
+    gui.modifier_stats = {'release_events': 0, 'release_seconds': 0.0, 'full_resets': 0, 'stuck_detected': 0}
+    return gui
+
+
+def test_copy_selection_empty_field_returns_empty_string(monkeypatch):
+    gui = make_gui_automation(monkeypatch, FakeClipboard())
+
+    assert gui.copy_selection(timeout=0.02) == ''
+
+
+def test_copy_selection_without_clipboard_returns_none(monkeypatch):
+    gui = make_gui_automation(monkeypatch, FakeClipboard(available=False))
+
+    assert gui.copy_selection(timeout=0.02) is None
+
+
+def test_empty_copy_after_write_is_mismatch():
+    automation = StubAutomation()
+    engine = make_engine(automation)
+    automation.copy_selection = lambda timeout=0.3: ''
+
+    assert engine._verify('9001011234567') is False
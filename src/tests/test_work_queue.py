@@ -0,0 +1,147 @@
+"""
+공유 폴더 작업 큐 테스트 (가져가기/연장/만료 회수/완료/합치기, 청크별 순번)
+"""
+
+import os
+import sys
+import time
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import pytest
+
+from src.services.search_service import SearchAutomationService
+from src.services.work_queue import LeaseQueue, run_queue_worker
+
+
+def make_records(count, numbered=True):
+    records = []
+    for i in range(count):
+        record = {'주민등록번호': f"900101-10000{i:02d}", '이름': f"이름{i}"}
+        if numbered:
+            record['순번'] = i + 1
+        records.append(record)
+    return records
+
+
+class StubAutomation:
+    def report_pacing(self, actions, success):
+        pass
+
+
+class StubService:
+    """모든 건을 세대원 수 1로 바로 성공 처리하는 서비스"""
+
+    PACED_ACTIONS = SearchAutomationService.PACED_ACTIONS
+    is_retryable = SearchAutomationService.is_retryable
+    ERROR_RECOVERY = SearchAutomationService.ERROR_RECOVERY
+
+    def __init__(self):
+        self.automation = StubAutomation()
+
+    def submit_record(self, resident_number):
+        return {'resident_number': resident_number, 'status': 'captured', 'frame': None}
+
+    def analyze_result(self, resident_number, frame, state=None, status_frame=None):
+        return {'resident_number': resident_number, 'household_count': 1, 'status': 'success', 'message': 'ok'}
+
+    def wait_ready(self, action, default):
+        pass
+
+    def pacing_signal(self, result):
+        return None
+
+    def save_pacing(self):
+        pass
+
+
+def test_claim_complete_and_merge(tmp_path):
+    root = str(tmp_path / 'queue')
+    queue = LeaseQueue.create(root, make_records(5), chunk_size=2, worker_id='pc1')
+
+    leases = []
+    while True:
+        lease = queue.claim()
+        if lease is None:
+            break
+        leases.append(lease)
+    assert [lease.chunk for lease in leases] == ['c00001', 'c00002', 'c00003']
+    assert [lease.start for lease in leases] == [0, 2, 4]
+    assert queue.status() == {'total': 3, 'pending': 0, 'leased': 3, 'done': 0}
+
+    with pytest.raises(RuntimeError):
+        queue.merge()
+
+    for lease in reversed(leases):
+        queue.complete(lease, [{'순번': record['순번']} for record in lease.records])
+    assert queue.is_complete()
+    assert [row['순번'] for row in queue.merge()] == [1, 2, 3, 4, 5]
+
+
+def test_create_joins_existing_queue(tmp_path):
+    root = str(tmp_path / 'queue')
+    LeaseQueue.create(root, make_records(4), chunk_size=2, worker_id='pc1')
+    other = LeaseQueue.create(root, make_records(10), chunk_size=2, worker_id='pc2')
+
+    assert other.manifest['total'] == 4
+    assert other.worker_id == 'pc2'
+
+
+def test_renew_and_reclaim_expired(tmp_path):
+    root = str(tmp_path / 'queue')
+    queue = LeaseQueue.create(root, make_records(2), chunk_size=2, worker_id='pc1', lease_seconds=60)
+    lease = queue.claim()
+
+    # 남은 시간이 충분하면 그대로, 부족하면 파일 이름의 만료 시각을 갱신
+    assert queue.renew(lease) is True
+    old_expires = lease.expires
+    assert queue.renew(lease, min_remaining=120) is True
+    assert lease.expires >= old_expires
+    assert os.path.exists(lease.path)
+
+    # 만료된 임대는 다른 PC가 회수하고, 원래 작업자는 연장할 때 임대를 잃었음을 알게 됨
+    expired_path = queue._leased_path(lease.chunk, time.time() - 1)
+    os.rename(lease.path, expired_path)
+    lease.path = expired_path
+    other = LeaseQueue(root, worker_id='pc2')
+    assert other.reclaim_expired() == 1
+    assert queue.renew(lease, min_remaining=120) is False
+    assert lease.lost
+
+    reclaimed = other.claim()
+    assert reclaimed.chunk == lease.chunk
+    assert reclaimed.records == lease.records
+
+
+def test_release_returns_chunk_to_pending(tmp_path):
+    root = str(tmp_path / 'queue')
+    queue = LeaseQueue.create(root, make_records(2), chunk_size=1, worker_id='pc1')
+    lease = queue.claim()
+    queue.release(lease)
+
+    assert queue.status()['pending'] == 2
+    assert queue.claim().chunk == lease.chunk
+
+
+def test_worker_numbers_rows_by_chunk_start(tmp_path):
+    root = str(tmp_path / 'queue')
+    records = make_records(5, numbered=False)
+    records[3]['주민등록번호'] = ''
+    queue = LeaseQueue.create(root, records, chunk_size=2, worker_id='pc1')
+
+    assert run_queue_worker(queue, StubService(), poll_interval=0, between_default=0) == 3
+
+    rows = queue.merge()
+    assert [row['순번'] for row in rows] == [1, 2, 3, 4, 5]
+    assert [row['상태'] for row in rows] == ['완료', '완료', '완료', '오류', '완료']
+
+
+def test_claim_raises_when_rename_fails_for_other_reasons(tmp_path, monkeypatch):
+    root = str(tmp_path / 'queue')
+    queue = LeaseQueue.create(root, make_records(1), chunk_size=1, worker_id='pc1')
+
+    def broken_rename(src, dst):
+        raise OSError(116, 'Stale file handle')
+
+    monkeypatch.setattr(os, 'rename', broken_rename)
+    with pytest.raises(OSError, match='c00001'):
+        queue.claim()
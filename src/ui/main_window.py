@@ -23,6 +23,8 @@ class MainWindow:
         # 변수
         self.input_file_path = tk.StringVar()
         self.output_file_path = tk.StringVar()
+        self.resume_enabled = tk.BooleanVar(value=True)
+        self.force_refresh = tk.BooleanVar(value=False)
         self.is_running = False
         self.total_count = 0
         self.current_index = 0
@@ -119,6 +121,24 @@ class MainWindow:
             fg="black",
             width=10
         ).grid(row=1, column=2, pady=5)
+
+        # 이어서 하기 (출력 파일 옆 진행 기록에서 끝난 건 건너뜀)
+        tk.Checkbutton(
+            file_frame,
+            text="이전 진행 기록이 있으면 이어서 하기",
+            variable=self.resume_enabled,
+            font=("맑은 고딕", 9),
+            bg="#f5f5f5"
+        ).grid(row=3, column=1, sticky=tk.W, padx=10)
+
+        # 새로 조회 (저장된 조회 결과 캐시를 쓰지 않음, 조회 결과는 다시 저장)
+        tk.Checkbutton(
+            file_frame,
+            text="저장된 조회 결과를 쓰지 않고 모두 새로 조회",
+            variable=self.force_refresh,
+            font=("맑은 고딕", 9),
+            bg="#f5f5f5"
+        ).grid(row=4, column=1, sticky=tk.W, padx=10)
         
         # 진행 상황 영역
         progress_frame = tk.LabelFrame(
@@ -361,6 +381,9 @@ class MainWindow:
 
             # 검색 자동화 서비스 초기화 (템플릿 매칭 모드)
             from ..services.search_service import SearchAutomationService
+            from ..services.batch_pipeline import PipelinedBatchRunner
+            from ..services.retry_queue import DeferredRetryQueue
+            from ..services.result_cache import ResultCache, dedupe_resident_numbers
             search_service = SearchAutomationService()
 
             self.log("- 검색 자동화 서비스 초기화 완료")
@@ -376,15 +399,29 @@ class MainWindow:
 
             self.log("")
 
+            # 진행 기록 (한 건 끝날 때마다 디스크에 기록, 다시 실행하면 끝난 건은 건너뜀)
+            from ..services.checkpoint_journal import CheckpointJournal
+            journal = CheckpointJournal(CheckpointJournal.path_for(self.output_file_path.get()))
+            if self.resume_enabled.get():
+                # 성공했거나 다시 해도 같은 건만 건너뛰고, 오류로 기록된 건은 다시 처리
+                done = journal.load(finished_only=True)
+                retry_errors = len(journal.load()) - len(done)
+            else:
+                journal.reset()
+                done = {}
+                retry_errors = 0
+
             # 각 주민등록번호 검색
-            results = []
             total = len(records)
+            # 검색할 건 (순번 위치, 레코드, 주민등록번호, 이름)
+            jobs = []
+            skipped = 0
+            blank = 0
 
             for i, record in enumerate(records, 1):
-                # 중지 요청 확인
-                if not self.is_running:
-                    self.log("사용자가 중지했습니다.")
-                    break
+                if journal.key(record, i) in done:
+                    skipped += 1
+                    continue
 
                 raw_resident_number = record.get('주민등록번호', '')
                 raw_name = record.get('이름', '')
@@ -400,45 +437,119 @@ class MainWindow:
 
                 if not resident_number:
                     self.log("  - 주민등록번호가 비어 있어 건너뜁니다.")
-                    results.append({
+                    journal.append({
                         '순번': record.get('순번', i),
                         '주민등록번호': '',
                         '이름': name,
                         '세대원 수': 0,
                         '상태': '오류',
-                        '메시지': '주민등록번호가 비어 있습니다.'
-                    })
-                    self.update_progress(i, total)
+                        '메시지': '주민등록번호가 비어 있습니다.',
+                        '출처': ''
+                    }, final=True)
+                    blank += 1
                     continue
-                name = '' if raw_name is None else str(raw_name).strip()
 
-                self.log(f"\n[{i}/{total}] {name} ({resident_number})")
+                jobs.append((i - 1, record, resident_number, name))
 
-                # 검색 실행 (이미지 매칭 사용)
-                result = search_service.search_resident(resident_number)
+            if skipped:
+                self.log(f"이전 진행 기록에서 {skipped}건을 건너뜁니다: {journal.path}")
+                self.update_progress(skipped, total)
+            if retry_errors:
+                self.log(f"이전 진행 기록의 오류 {retry_errors}건은 다시 처리합니다.")
 
-                # 결과 기록 (순번, 주민등록번호, 이름, 세대원 수, 상태, 메시지)
-                output_record = {
-                    '순번': record.get('순번', i),
+            finished = {'count': 0}
+
+            def record_result(job, result, source):
+                position, record, resident_number, name = job
+
+                # 결과 기록 (순번, 주민등록번호, 이름, 세대원 수, 상태, 메시지, 출처)
+                journal.append({
+                    '순번': record.get('순번', position + 1),
                     '주민등록번호': resident_number,
                     '이름': name,
                     '세대원 수': result['household_count'],
                     '상태': '완료' if result['status'] == 'success' else '오류',
-                    '메시지': result['message']
-                }
-                results.append(output_record)
+                    '메시지': result['message'],
+                    '출처': source
+                }, final=result['status'] == 'success' or not search_service.is_retryable(result))
 
                 # 진행 상황 업데이트
-                self.update_progress(i, total)
+                finished['count'] += 1
+                self.update_progress(skipped + blank + finished['count'], total)
 
                 if result['status'] == 'success':
-                    self.log(f"완료: {result['household_count']}명")
+                    self.log(f"완료: {result['household_count']}명 ({source})")
                 else:
                     self.log(f"오류: {result['message']}")
 
-                # 다음 검색 전 대기 (1초)
-                if i < total:
-                    time.sleep(1)
+            # 같은 주민등록번호는 한 번만 조회하고, 유효 기간 안의 이전 조회 결과는 재사용
+            result_cache = ResultCache()
+            force_refresh = self.force_refresh.get()
+            lookups = []  # [(주민등록번호, [jobs 위치, ...])]
+            cache_count = 0
+            for resident_number, members in dedupe_resident_numbers([job[2] for job in jobs]):
+                entry = None if force_refresh else result_cache.get(resident_number)
+                if entry is None:
+                    lookups.append((resident_number, members))
+                    continue
+                cached = result_cache.lookup_result(resident_number, entry)
+                for member in members:
+                    record_result(jobs[member], cached, '캐시')
+                cache_count += len(members)
+            duplicate_count = sum(len(members) - 1 for _, members in lookups)
+            self.log(
+                f"조회 대상 {len(lookups)}건 (캐시 사용 {cache_count}건, 입력 내 중복 {duplicate_count}건"
+                f"{', 저장된 결과 무시' if force_refresh else ''})"
+            )
+
+            def finish_lookup(index, result):
+                resident_number, members = lookups[index - 1]
+                result_cache.put(resident_number, result)
+                for order, member in enumerate(members):
+                    record_result(jobs[member], result, '조회' if order == 0 else '중복')
+
+            # 실패 건은 본 처리가 끝난 뒤 복구 단계를 거쳐 재시도
+            retry_queue = DeferredRetryQueue(search_service)
+
+            def on_result(index, job_total, result):
+                resident_number, members = lookups[index - 1]
+                name = jobs[members[0]][3]
+                self.log(f"\n[{index}/{job_total}] {name} ({resident_number})")
+                if retry_queue.add(index, resident_number, result):
+                    self.log(f"오류: {result['message']} (나중에 다시 시도)")
+                    return
+                finish_lookup(index, result)
+
+            # 입력/검색은 이 스레드에서, 결과 분석은 작업 스레드에서 겹쳐 실행 (결과는 입력 순서대로 기록)
+            # 다음 검색 전 대기는 기본 1초, 장비별 학습값 사용
+            runner = PipelinedBatchRunner(search_service, between_default=1.0)
+            try:
+                runner.run(
+                    [resident_number for resident_number, _ in lookups],
+                    callback=on_result,
+                    should_stop=lambda: not self.is_running
+                )
+
+                # 중지했으면 재시도하지 않음 (기록하지 않은 실패 건은 이어서 하기에서 다시 처리)
+                if len(retry_queue) and self.is_running:
+                    self.log(f"\n실패한 {len(retry_queue)}건을 다시 시도합니다.")
+
+                    def on_retry(index, result):
+                        resident_number, members = lookups[index - 1]
+                        self.log(f"\n[재시도] {jobs[members[0]][3]} ({resident_number})")
+                        finish_lookup(index, result)
+
+                    retry_queue.run(callback=on_retry, should_stop=lambda: not self.is_running)
+            finally:
+                result_cache.save()
+            if not self.is_running:
+                self.log("사용자가 중지했습니다.")
+
+            # 진행 기록에서 입력 순서대로 결과 구성 (중지해서 처리하지 못한 건은 제외)
+            journal.close()
+            results = journal.rows_for(records)
+
+            search_service.save_pacing()
 
             # 결과 저장
             self.log("")
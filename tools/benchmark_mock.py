@@ -0,0 +1,75 @@
+"""
+Mock 시스템 처리량 측정 도구
+같은 프로세스에 Mock 시스템(Tkinter)을 띄우고 위젯을 직접 구동해서
+실제 마우스/키보드 속도와 무관하게 batch_search 루프의 계산 속도를 측정 (Xvfb에서 실행 가능)
+
+사용법:
+    python tools/benchmark_mock.py [건수] [템플릿 디렉토리] [체크박스 방식(template/components)]
+    xvfb-run -s "-screen 0 1280x800x24" python tools/benchmark_mock.py 200
+"""
+
+import os
+import sys
+import time
+import tkinter as tk
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from mock_system.app import HaengbokEumMockSystem
+from src.core.tk_driver import TkWidgetAutomation
+from src.services.search_service import SearchAutomationService
+
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    template_dir = sys.argv[2] if len(sys.argv) > 2 else None
+    checkbox_engine = sys.argv[3] if len(sys.argv) > 3 else 'template'
+
+    root = tk.Tk()
+    app = HaengbokEumMockSystem(root)
+    # 창이 실제로 그려질 때까지 이벤트 처리 (비전 파이프라인은 렌더링된 화면을 캡처)
+    root.update()
+    root.lift()
+    root.update()
+
+    rows = app.df.head(limit)
+    resident_numbers = rows['주민등록번호'].tolist()
+    expected = {
+        row['주민등록번호']: app.count_household_members(row)
+        for _, row in rows.iterrows()
+    }
+
+    service = SearchAutomationService(
+        template_dir=template_dir,
+        automation=TkWidgetAutomation(root),
+        # 위젯에 직접 넣으므로 입력 방식 측정/저장 불필요 (실제 환경 학습값을 덮어쓰지 않음)
+        entry_strategy='paste',
+        # Xvfb 화면 지문으로 실제 환경의 좌표 캐시를 지우지 않도록 끔
+        persistent_cache=False,
+        checkbox_engine=checkbox_engine,
+        # 다른 방식과의 일치율도 함께 출력
+        compare_checkbox_engines=True
+    )
+
+    start = time.perf_counter()
+    results = service.batch_search(resident_numbers)
+    elapsed = time.perf_counter() - start
+
+    matched = sum(
+        1 for result in results
+        if result['status'] == 'success' and result['household_count'] == expected.get(result['resident_number'])
+    )
+
+    print("\n=== Mock 처리량 측정 결과 ===")
+    print(f"  - 처리: {len(results)}건, 정답 일치: {matched}건")
+    if results:
+        print(f"  - 총 {elapsed:.2f}초, 건당 {elapsed / len(results) * 1000:.1f}ms, "
+              f"초당 {len(results) / elapsed:.1f}건")
+
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
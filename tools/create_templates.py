@@ -97,18 +97,20 @@ def main():
     print("  1. input_field  (입력 필드)")
     print("  2. search_button (검색 버튼)")
     print("  3. checkbox (체크박스)")
-    print("  4. custom (사용자 정의)")
+    print("  4. status_label (상태 표시줄 '조회 결과:' 글자, 숫자 바로 앞까지)")
+    print("  5. custom (사용자 정의)")
     print()
 
-    choice = input("선택 (1-4): ").strip()
+    choice = input("선택 (1-5): ").strip()
 
     template_map = {
         '1': 'input_field',
         '2': 'search_button',
         '3': 'checkbox',
+        '4': 'status_label',
     }
 
-    if choice == '4':
+    if choice == '5':
         template_name = input("템플릿 이름 입력: ").strip()
         if not template_name:
             print("❌ 템플릿 이름이 비어있습니다.")
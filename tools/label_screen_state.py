@@ -0,0 +1,58 @@
+"""
+화면 상태 예시 등록 도구
+현재 결과 영역 화면을 지정한 상태(결과 없음, 경고 등)의 예시로 저장.
+'result' 상태는 검색하면서 자동으로 학습되므로 나머지 상태를 등록할 때 사용
+
+사용법:
+    (행복e음에서 등록할 화면을 띄운 뒤)
+    python tools/label_screen_state.py <상태> [대상 창 제목] [--window]
+
+    상태: idle, searching, result, no_result, warning
+    --window: 결과 영역 대신 대화상자 영역(모르면 창 전체)을 등록
+        (결과 영역 밖에 뜨는 경고 창 확인용, warning과 no_result 화면을 모두 등록)
+"""
+
+import os
+import sys
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.screen_state import STATES, screen_signature
+from src.services.search_service import SearchAutomationService
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if arg != '--window']
+    window = len(args) != len(sys.argv) - 1
+    if not args or args[0] not in STATES:
+        print(__doc__)
+        sys.exit(1)
+
+    state = args[0]
+    target_window = args[1] if len(args) > 1 else None
+
+    service = SearchAutomationService(target_window=target_window)
+    classifier = service.window_states if window else service.screen_states
+
+    # 입력 필드/검색 버튼을 찾으면 그 아래가 결과 영역으로 등록됨
+    for element_name in ('input_field', 'search_button'):
+        service.find_ui_element(element_name)
+    if service.planner.plan('result') is None:
+        print("결과 영역을 찾지 못했습니다. 조회 화면이 보이는지 확인하세요.")
+        sys.exit(1)
+
+    signature = screen_signature(service.planner.capture_step('dialog' if window else 'result'))
+    current, distance = classifier.classify(signature)
+    print(f"현재 분류: {current or '미분류'} (거리 {distance:.3f})")
+
+    if classifier.learn(state, signature):
+        classifier.save()
+        print(f"'{state}' 예시를 저장했습니다: {classifier.path}")
+    else:
+        print(f"'{state}'에 이미 비슷한 예시가 있어 저장하지 않았습니다.")
+
+
+if __name__ == "__main__":
+    main()
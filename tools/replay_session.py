@@ -0,0 +1,51 @@
+"""
+녹화된 세션 재생 도구
+디스플레이 없이 녹화 프레임으로 검색 파이프라인을 다시 실행하고 소요 시간을 측정
+
+사용법:
+    python tools/replay_session.py tmp/sessions/run.zip [템플릿 디렉토리]
+"""
+
+import os
+import sys
+import time
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.core.session_recorder import SessionReplayer
+
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+
+    archive_path = sys.argv[1]
+    template_dir = sys.argv[2] if len(sys.argv) > 2 else None
+
+    replayer = SessionReplayer(archive_path)
+    # 입력 동작(type_text/paste_text)이 아닌 건별 기록으로 입력 목록 구성
+    resident_numbers = replayer.resident_numbers()
+    print(f"녹화 세션: {archive_path}")
+    print(f"  - 이벤트: {len(replayer.events)}개, 입력 기록: {len(resident_numbers)}건")
+    if not resident_numbers:
+        print("건별 입력 기록이 없는 세션입니다. 현재 버전으로 다시 녹화하세요.")
+        sys.exit(1)
+
+    service = replayer.build_service(template_dir=template_dir)
+
+    start = time.perf_counter()
+    results = service.batch_search(resident_numbers)
+    elapsed = time.perf_counter() - start
+
+    print("\n=== 재생 결과 ===")
+    for result in results:
+        print(f"  {result['resident_number']}: {result['household_count']}명 ({result['status']})")
+    if results:
+        print(f"총 {elapsed:.2f}초, 건당 {elapsed / len(results) * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
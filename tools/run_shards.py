@@ -0,0 +1,115 @@
+"""
+다중 윈도우 분할 실행 도구
+대상 윈도우 여러 개에 입력 파일의 레코드를 나눠 검색하고 결과를 입력 순서대로 한 파일에 저장
+(마우스/키보드는 윈도우끼리 번갈아 쓰고, 결과 대기/캡처/분석은 겹쳐 실행)
+
+사용법:
+    # Mock 창 3개를 타일 배치로 띄워서 실행
+    python tools/run_shards.py input.xlsx output.xlsx --launch-mock 3
+
+    # 이미 띄운 윈도우에 붙어서 실행 (제목 부분 일치)
+    python tools/run_shards.py input.xlsx output.xlsx --window "주민조회 [1]" --window "주민조회 [2]"
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+# 프로젝트 루트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from src.services.excel_service import ExcelService
+from src.services.shard_runner import ShardedBatchRunner, ShardSpec
+
+MOCK_TITLE = "행복e음 - 주민조회"
+
+
+def launch_mock_windows(count, columns, width, height):
+    """
+    Mock 시스템 창을 타일 배치로 띄움
+
+    Returns:
+        tuple: (프로세스 리스트, 창 제목 리스트)
+    """
+    processes = []
+    titles = []
+    app_path = os.path.join(project_root, 'mock_system', 'app.py')
+    for i in range(count):
+        # "[1]"은 "[10]"에 부분 일치하지 않으므로 대괄호로 번호를 붙임
+        title = f"{MOCK_TITLE} [{i + 1}]"
+        x = (i % columns) * width
+        y = (i // columns) * height
+        processes.append(subprocess.Popen([
+            sys.executable, app_path,
+            '--title', title,
+            '--geometry', f"{width}x{height}+{x}+{y}"
+        ]))
+        titles.append(title)
+    return processes, titles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="다중 윈도우 분할 실행")
+    parser.add_argument('input', help="입력 파일 (주민등록번호/이름 컬럼)")
+    parser.add_argument('output', help="결과 파일 (.xlsx)")
+    parser.add_argument('--window', action='append', default=[], help="대상 윈도우 제목 (여러 번 지정)")
+    parser.add_argument('--launch-mock', type=int, default=0, help="띄울 Mock 창 수")
+    parser.add_argument('--columns', type=int, default=2, help="Mock 창 타일 열 수")
+    parser.add_argument('--size', default="800x600", help="Mock 창 크기")
+    parser.add_argument('--template-dir', default=None, help="템플릿 디렉토리")
+    args = parser.parse_args()
+
+    processes = []
+    titles = list(args.window)
+    if args.launch_mock:
+        width, height = (int(v) for v in args.size.split('x'))
+        processes, launched = launch_mock_windows(args.launch_mock, max(1, args.columns), width, height)
+        titles.extend(launched)
+        # 창이 뜰 때까지 대기
+        time.sleep(3)
+    if not titles:
+        parser.error("--window 또는 --launch-mock을 지정하세요.")
+
+    records = ExcelService.read_residents(args.input)
+    runner = ShardedBatchRunner(
+        [ShardSpec(name=f"window{i + 1}", target_window=title) for i, title in enumerate(titles)],
+        template_dir=args.template_dir
+    )
+
+    # 빈 주민등록번호는 검색하지 않고 결과에만 기록
+    jobs = [i for i, record in enumerate(records) if record.get('주민등록번호')]
+
+    def on_result(index, total, result):
+        print(f"[{index}/{total}] {result['resident_number']}: {result['household_count']}명 "
+              f"({result['status']}, {result['shard']})")
+
+    try:
+        searched = runner.run([records[i]['주민등록번호'] for i in jobs], callback=on_result)
+    finally:
+        for process in processes:
+            process.terminate()
+
+    # 결과는 jobs와 같은 위치 (중지해서 처리하지 못한 건은 None)
+    by_position = {i: result for i, result in zip(jobs, searched) if result is not None}
+    rows = []
+    for i, record in enumerate(records):
+        result = by_position.get(i)
+        if result is None and i in jobs:
+            continue
+        rows.append({
+            '순번': record.get('순번', i + 1),
+            '주민등록번호': record.get('주민등록번호', ''),
+            '이름': record.get('이름', ''),
+            '세대원 수': result['household_count'] if result else 0,
+            '상태': '완료' if result and result['status'] == 'success' else '오류',
+            '메시지': result['message'] if result else '주민등록번호가 비어 있습니다.',
+            '처리 창': result['shard'] if result else ''
+        })
+    ExcelService.write_results(args.output, rows)
+
+
+if __name__ == "__main__":
+    main()